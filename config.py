@@ -3,6 +3,7 @@
 pydantic-settings를 사용하여 타입 안전성과 자동 검증을 제공합니다.
 """
 
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -26,11 +27,102 @@ class Settings(BaseSettings):
     db_user: str
     db_password: str
     db_name: str
-    db_pool_size: int = 5
+    db_pool_size: int = 5  # 시작 크기 (서버 시작 시 미리 연결, 이후 min ~ max 사이에서 자동 조절)
+    db_pool_min_size: int = 2  # 자동 축소 하한 (유휴 시에도 유지하는 커넥션 수)
+    db_pool_max_size: int = 20  # 자동 확장 상한 (MySQL max_connections / 워커 수 이하로)
+    db_pool_adaptive: bool = True  # false면 db_pool_size로 고정
+    db_pool_resize_interval: float = 10.0  # 크기 조절 판단 주기 (초)
+    db_pool_grow_wait: float = 0.005  # 커넥션을 이 시간 이상 기다린 획득이 있으면 확장 (초)
+    db_pool_shrink_utilization: float = 0.5  # 최대 동시 사용 수가 크기의 이 비율 이하면 1씩 축소
+    db_pool_recycle: int = 3600  # 이 시간 이상 유휴 상태인 커넥션은 꺼낼 때 새로 연결 (MySQL wait_timeout보다 짧게, -1이면 사용 안 함, 초)
+    db_acquire_timeout: float = 2.0  # 풀에서 커넥션을 기다리는 최대 시간 (초과 시 503, 초)
+    db_replica_hosts: List[str] = []  # 조회용 replica ("host" 또는 "host:port", 환경 변수는 JSON 목록), 비어 있으면 primary만 사용
+    db_replica_pool_size: int = 5  # replica별 커넥션 풀 시작 크기 (primary와 같은 min/max 범위에서 자동 조절)
+    db_read_your_writes_window: float = 2.0  # 쓰기 후 같은 클라이언트의 조회를 primary로 보내는 시간 (replica 지연 허용치, 초)
+    db_deadline_grace: float = 0.5  # 요청 마감 후 서버의 쿼리 중단(MAX_EXECUTION_TIME)을 기다리는 시간, 이후 KILL QUERY (초)
+    db_single_flight: bool = True  # 동일한 동시 조회(게시글/목록/댓글)를 하나의 쿼리로 병합
+
+    # 요청 처리 시간 한도 (DeadlineMiddleware, DB 쿼리 실행 시간 한도로 적용, 0이면 제한 없음)
+    request_timeout: float = 10.0  # 기본값 (초)
+    request_timeouts: Dict[str, float] = {
+        # "메서드 경로 접두사": 초 (가장 긴 접두사 하나만 적용)
+        "GET /v1": 5.0,
+        # 업로드는 본문 수신 시간도 한도에 포함되므로 길게 (느린 회선에서 5MB 업로드 후 파일 저장/등록까지)
+        "POST /v1/posts/image": 60.0,
+        "POST /v1/users/me/profile-image": 60.0,
+        "POST /v1/auth/profile-image": 60.0,
+    }
+
+    # 요청 수락 제어 (AdmissionControlMiddleware, 분류별 동시 실행 수 제한)
+    admission_control_enabled: bool = True
+    admission_read_limit: int = 32  # 조회 요청 동시 실행 수
+    admission_write_limit: int = 16  # 작성/수정/삭제 요청 동시 실행 수
+    admission_auth_limit: int = 8  # 로그인/가입/비밀번호 변경(bcrypt) 동시 실행 수
+    admission_queue_size: int = 64  # 분류별 대기열 길이 (가득 차면 바로 429)
+    admission_queue_timeout: float = 1.0  # 대기열에서 기다리는 최대 시간 (초과 시 429, 초)
+    admission_retry_after: int = 1  # 429 응답의 Retry-After (초)
+
+    # 요청 빈도 제한 (RateLimitMiddleware, 토큰 버킷)
+    # "메서드 경로 접두사": "요청 수/초" (가장 긴 접두사 규칙 적용, 환경 변수에는 JSON으로 지정)
+    rate_limit_enabled: bool = True
+    rate_limit_rules: Dict[str, str] = {
+        "POST /v1/auth/login": "10/60",
+        "POST /v1/auth/signup": "5/60",
+        "GET /v1/auth/emails/availability": "30/60",
+        "GET /v1/auth/nicknames/availability": "30/60",
+        "PATCH /v1/users": "10/60",  # 정보/비밀번호 변경
+        "POST /v1": "60/60",  # 그 밖의 작성 (게시글/댓글/좋아요/이미지)
+        "PATCH /v1": "60/60",
+        "DELETE /v1": "60/60",
+    }
+    rate_limit_max_keys: int = 100_000  # 메모리에 유지할 최대 버킷 수
+    rate_limit_sweep_interval: float = 60.0  # 가득 찬 버킷 정리 주기 (초)
 
     # 디버그 모드
     debug: bool = False
 
+    # DB에서 읽은 응답 스키마(BaseSchema.from_trusted)도 검증 (debug 모드에서는 항상 검증)
+    validate_trusted_data: bool = False
+
+    # 액세스 로그 구조화 캡처 (트래픽 리플레이용 JSON Lines, None이면 비활성)
+    access_log_capture_path: Optional[str] = None
+
+    # 업로드 이미지 파생본 생성 (ProcessPoolExecutor)
+    image_workers: int = 2
+    image_webp_quality: int = 80
+
+    # 업로드 요청 본문 크기 제한 (BodyLimitMiddleware, multipart 요청에 적용)
+    # 파일 크기 제한(5MB) + multipart 경계/헤더 여유분, 받는 중에 넘으면 디스크에 다 쓰기 전에 413
+    upload_max_body_size: int = 5 * 1024 * 1024 + 64 * 1024
+
+    # 업로드 파일 정리 (utils.common.upload_gc, 0이면 백그라운드 실행 안 함)
+    upload_gc_interval: int = 0  # 실행 주기 (초)
+    upload_gc_grace: int = 86400  # 이 시간보다 오래된 미사용 파일만 삭제 (초)
+    upload_gc_batch_size: int = 500
+
+    # 서버 시작 warm-up (완료 전에는 /health/ready가 503)
+    startup_warm_queries: bool = True  # 커넥션 확인 후 첫 페이지 목록을 미리 조회 (목록 캐시/DB 버퍼 채우기)
+
+    # 게시글 목록 응답 캐시 (stale-while-revalidate, 작성/수정/삭제 시 무효화)
+    feed_cache_enabled: bool = True
+    feed_cache_ttl: float = 2.0  # 이 시간 동안은 캐시 그대로 사용 (초)
+    feed_cache_stale_ttl: float = 30.0  # ttl 이후 이 시간 동안은 이전 본문을 반환하며 백그라운드 갱신 (초)
+    feed_cache_max_entries: int = 256
+    feed_cache_max_offset: int = 100  # 이 offset 미만의 앞쪽 페이지만 캐시
+
+    # 변경분 동기화 (since 조회, utils.common.delta_sync)
+    delta_sync_overlap: float = 2.0  # nextSince를 현재 시각보다 앞당기는 폭 (커밋 지연 대비, 초)
+
+    # 실시간 이벤트 (SSE, utils.common.event_bus)
+    sse_queue_size: int = 100  # 구독자별 대기 이벤트 수 (초과 시 resync 후 연결 종료)
+    sse_heartbeat_interval: float = 15.0  # 이벤트가 없을 때 keep-alive 전송 주기 (초)
+    sse_retry_ms: int = 3000  # 연결이 끊겼을 때 브라우저 재연결 대기 시간 (밀리초)
+
+    # 응답 압축 (CompressionMiddleware, br은 brotli 설치 시에만 사용)
+    compression_min_size: int = 1024  # 이보다 작은 본문은 압축하지 않음 (바이트)
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5  # 동적 응답용 (정적 파일은 precompress 시 최고 품질 사용)
+
     class Config:
         """Pydantic 설정"""
         env_file = ".env"
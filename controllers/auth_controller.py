@@ -1,15 +1,23 @@
 from typing import Dict
 from fastapi import Request
 from models.user_model import user_model
+from models.records import UserRecord
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
+from utils.common.image_variants import variant_urls
 from schemas import SignupRequest, LoginRequest, UserResponse, FieldError
 
 
 class AuthController:
     """인증 관련 비즈니스 로직"""
 
-    async def signup(self, req: SignupRequest) -> UserResponse:
+    def _formatUser(self, user: UserRecord) -> Dict:
+        """User 레코드를 API 응답 규격(UserResponse 모양의 dict)으로 변환"""
+        data = UserResponse.from_trusted(user)
+        data["profileImageVariants"] = variant_urls(user.profileImageUrl)
+        return data
+
+    async def signup(self, req: SignupRequest) -> Dict:
         """회원가입"""
         if await user_model.emailExists(req.email):
             raise APIError(ErrorCode.ALREADY_EXISTS, FieldError(field="email", value=req.email), message="이미 사용 중인 이메일입니다.")
@@ -17,28 +25,28 @@ class AuthController:
             raise APIError(ErrorCode.ALREADY_EXISTS, FieldError(field="nickname", value=req.nickname), message="이미 사용 중인 닉네임입니다.")
 
         user = await user_model.createUser(req.email, req.password, req.nickname, req.profileImageUrl)
-        return UserResponse.model_validate(user)
+        return self._formatUser(user)
 
-    async def login(self, req: LoginRequest, request: Request) -> UserResponse:
+    async def login(self, req: LoginRequest, request: Request) -> Dict:
         """로그인"""
         user = await user_model.authenticateUser(req.email, req.password)
         if not user:
             raise APIError(ErrorCode.INVALID_CREDENTIALS)
 
-        request.session["userId"] = user["userId"]
-        request.session["email"] = user["email"]
-        request.session["nickname"] = user["nickname"]
-        request.session["profileImageUrl"] = user.get("profileImageUrl")
-        return UserResponse.model_validate(user)
+        request.session["userId"] = user.userId
+        request.session["email"] = user.email
+        request.session["nickname"] = user.nickname
+        request.session["profileImageUrl"] = user.profileImageUrl
+        return self._formatUser(user)
 
     async def logout(self, request: Request) -> Dict:
         """로그아웃"""
         request.session.clear()
         return {}
 
-    async def getMe(self, user: Dict) -> UserResponse:
+    async def getMe(self, user: UserRecord) -> Dict:
         """내 정보 조회"""
-        return UserResponse.model_validate(user)
+        return self._formatUser(user)
 
     async def checkEmailAvailability(self, email: str) -> Dict:
         """이메일 중복 확인"""
@@ -1,38 +1,54 @@
 from typing import List, Dict, Union
+from models.records import CommentRecord, UserRecord
 from models.comment_model import comment_model
 from models.post_model import post_model
 from models.user_model import user_model
+from models.version_model import version_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
-from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, CommentAuthor, ResourceError
+from utils.common.etag import make_etag
+from utils.common.image_variants import variant_urls
+from utils.common.event_bus import event_bus, FEED_TOPIC, post_topic
+from utils.common.response_cache import feed_cache
+from utils.common.delta_sync import SinceMarker
+from utils.database.db import primary_reads
+from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, CommentAuthor, DeltaData, ResourceError
 
 
 class CommentController:
     """댓글 관련 비즈니스 로직"""
 
-    async def _formatComment(self, comment: Dict) -> CommentResponse:
-        """Comment 데이터를 API 응답 규격에 맞게 변환"""
-        author = await user_model.getUserById(comment["userId"])
+    async def _formatComment(self, comment: CommentRecord) -> Dict:
+        """Comment 데이터를 API 응답 규격(CommentResponse 모양의 dict)으로 변환"""
+        author = await user_model.getUserById(comment.userId)
         
         # 최신 닉네임 우선 사용
-        nickname = author.get("nickname") if author else comment["userNickname"]
+        nickname = author.nickname if author else comment.userNickname
         
-        author_data = CommentAuthor(
-            userId=comment["userId"],
+        author_data = CommentAuthor.from_trusted(
+            userId=comment.userId,
             nickname=nickname,
-            profileImageUrl=author.get("profileImageUrl") if author else None
+            profileImageUrl=author.profileImageUrl if author else None,
+            profileImageVariants=variant_urls(author.profileImageUrl) if author else None
         )
 
-        return CommentResponse(
-            commentId=comment["commentId"],
-            postId=comment["postId"],
-            content=comment["content"],
+        return CommentResponse.from_trusted(
+            commentId=comment.commentId,
+            postId=comment.postId,
+            content=comment.content,
             author=author_data,
-            createdAt=comment["createdAt"],
-            updatedAt=comment.get("updatedAt")
+            createdAt=comment.createdAt,
+            updatedAt=comment.updatedAt
         )
 
-    async def getCommentsByPost(self, postId: str) -> List[CommentResponse]:
+    async def getCommentsETag(self, postId: str) -> str:
+        """댓글 목록 ETag (댓글 버전 + 게시글 버전(삭제 반영) + 작성자 정보 버전)"""
+        commentsKey = version_model.comments(postId)
+        postKey = version_model.post(postId)
+        versions = await version_model.getVersions(commentsKey, postKey, version_model.USERS)
+        return make_etag("comments", postId, versions[commentsKey], versions[postKey], versions[version_model.USERS])
+
+    async def getCommentsByPost(self, postId: str) -> List[Dict]:
         """특정 게시글의 댓글 목록 조회"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -41,7 +57,23 @@ class CommentController:
         comments = await comment_model.getCommentsByPost(postId)
         return [await self._formatComment(c) for c in comments]
 
-    async def createComment(self, postId: str, req: CommentCreateRequest, user: Dict) -> CommentResponse:
+    async def getCommentChanges(self, postId: str, since: SinceMarker, limit: int) -> Dict:
+        """특정 게시글에서 since 이후 변경된 댓글 (목록 항목과 같은 모양 + 삭제된 댓글 ID)"""
+        post = await post_model.getPostById(postId)
+        if not post:
+            raise APIError(ErrorCode.POST_NOT_FOUND, ResourceError(resource="게시글", id=postId))
+
+        # replica 지연으로 nextSince 이전에 커밋된 변경을 놓치지 않도록 primary에서 조회
+        with primary_reads():
+            result = await comment_model.getCommentChanges(postId, since, limit=limit)
+        return DeltaData.from_trusted(
+            items=[await self._formatComment(c) for c in result["comments"]],
+            deletedIds=result["deletedIds"],
+            nextSince=result["nextSince"],
+            hasMore=result["hasMore"],
+        )
+
+    async def createComment(self, postId: str, req: CommentCreateRequest, user: UserRecord) -> Dict:
         """댓글 작성"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -49,17 +81,22 @@ class CommentController:
 
         comment_data = await comment_model.createComment(
             postId=postId,
-            userId=user["userId"],
-            userNickname=user["nickname"],
+            userId=user.userId,
+            userNickname=user.nickname,
             content=req.content
         )
         
         # 게시글의 댓글 수 캐시 업데이트
-        await post_model.updateCommentCount(postId, 1)
+        commentCount = await post_model.updateCommentCount(postId, 1)
+        await version_model.bump(version_model.POSTS, version_model.post(postId), version_model.comments(postId))
+        feed_cache.invalidate()
 
-        return await self._formatComment(comment_data)
+        formatted = await self._formatComment(comment_data)
+        event_bus.publish(post_topic(postId), "comment.created", formatted)
+        event_bus.publish(FEED_TOPIC, "post.commented", {"postId": postId, "commentCount": commentCount})
+        return formatted
 
-    async def updateComment(self, postId: str, commentId: str, req: CommentUpdateRequest, user: Dict) -> CommentResponse:
+    async def updateComment(self, postId: str, commentId: str, req: CommentUpdateRequest, user: UserRecord) -> Dict:
         """댓글 수정"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -69,20 +106,23 @@ class CommentController:
         if not comment:
             raise APIError(ErrorCode.COMMENT_NOT_FOUND, ResourceError(resource="댓글", id=commentId))
 
-        if str(comment["postId"]) != postId:
+        if comment.postId != postId:
             raise APIError(ErrorCode.COMMENT_NOT_FOUND, ResourceError(resource="댓글", id=commentId))
 
-        if str(comment["userId"]) != str(user["userId"]):
+        if comment.userId != user.userId:
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="댓글"))
 
         updated_comment = await comment_model.updateComment(
             commentId=commentId,
             content=req.content
         )
+        await version_model.bump(version_model.comments(postId))
 
-        return await self._formatComment(updated_comment)
+        formatted = await self._formatComment(updated_comment)
+        event_bus.publish(post_topic(postId), "comment.updated", formatted)
+        return formatted
 
-    async def deleteComment(self, postId: str, commentId: str, user: Dict) -> Dict:
+    async def deleteComment(self, postId: str, commentId: str, user: UserRecord) -> CommentRecord:
         """댓글 삭제"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -92,16 +132,20 @@ class CommentController:
         if not comment:
             raise APIError(ErrorCode.COMMENT_NOT_FOUND, ResourceError(resource="댓글", id=commentId))
 
-        if str(comment["postId"]) != postId:
+        if comment.postId != postId:
             raise APIError(ErrorCode.COMMENT_NOT_FOUND, ResourceError(resource="댓글", id=commentId))
 
-        if str(comment["userId"]) != str(user["userId"]):
+        if comment.userId != user.userId:
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="댓글"))
 
         await comment_model.deleteComment(commentId)
         
         # 게시글의 댓글 수 캐시 업데이트
-        await post_model.updateCommentCount(postId, -1)
+        commentCount = await post_model.updateCommentCount(postId, -1)
+        await version_model.bump(version_model.POSTS, version_model.post(postId), version_model.comments(postId))
+        feed_cache.invalidate()
+        event_bus.publish(post_topic(postId), "comment.deleted", {"postId": postId, "commentId": commentId})
+        event_bus.publish(FEED_TOPIC, "post.commented", {"postId": postId, "commentCount": commentCount})
 
         return comment
 
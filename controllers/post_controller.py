@@ -1,9 +1,17 @@
 from typing import List, Dict, Union, Optional
+from models.records import PostRecord, UserRecord
 from models.post_model import post_model
 from models.comment_model import comment_model
+from models.version_model import version_model
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
-from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostAuthor, PostFile, PaginatedData, PaginationMeta, ResourceError
+from utils.common.etag import make_etag
+from utils.common.response_cache import feed_cache
+from utils.common.event_bus import event_bus, FEED_TOPIC, post_topic
+from utils.common.delta_sync import SinceMarker
+from utils.database.db import primary_reads
+from utils.common.image_variants import variant_urls
+from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostAuthor, PostFile, PaginatedData, PaginationMeta, DeltaData, ResourceError
 
 
 class PostController:
@@ -11,47 +19,55 @@ class PostController:
 
     async def _formatPost(
         self,
-        post: Dict,
+        post: PostRecord,
         current_user_id: Optional[str] = None,
-    ) -> PostResponse:
-        """Post 데이터를 API 응답 규격에 맞게 변환"""
-        author_id = post["authorId"]
-
-        nickname = post.get("authorNickname")
-        profile_image_url = post.get("authorProfileImageUrl")
-        
-        author_data = PostAuthor(
-            userId=author_id,
-            nickname=nickname,
-            profileImageUrl=profile_image_url
+    ) -> Dict:
+        """Post 데이터를 API 응답 규격(PostResponse 모양의 dict)으로 변환"""
+        author_data = PostAuthor.from_trusted(
+            userId=post.authorId,
+            nickname=post.authorNickname,
+            profileImageUrl=post.authorProfileImageUrl,
+            profileImageVariants=variant_urls(post.authorProfileImageUrl)
         )
 
         post_file = None
-        if post.get("fileUrl"):
-            post_file = PostFile(
-                fileId=post["postId"],
-                fileUrl=post["fileUrl"]
+        if post.fileUrl:
+            post_file = PostFile.from_trusted(
+                fileId=post.postId,
+                fileUrl=post.fileUrl,
+                variants=variant_urls(post.fileUrl)
             )
 
         is_liked = None
         if current_user_id:
-            is_liked = await post_model.isLikedByUser(post["postId"], current_user_id)
-
-        return PostResponse(
-            postId=post["postId"],
-            title=post["title"],
-            content=post["content"],
-            likeCount=post.get("likeCount", 0), # 캐시된 값 사용
-            commentCount=post.get("commentCount", 0), # 캐시된 값 사용
-            hits=post["hits"],
+            is_liked = await post_model.isLikedByUser(post.postId, current_user_id)
+
+        return PostResponse.from_trusted(
+            postId=post.postId,
+            title=post.title,
+            content=post.content,
+            likeCount=post.likeCount, # 캐시된 값 사용
+            commentCount=post.commentCount, # 캐시된 값 사용
+            hits=post.hits,
             author=author_data,
             file=post_file,
-            createdAt=post["createdAt"],
-            updatedAt=post.get("updatedAt"),
+            createdAt=post.createdAt,
+            updatedAt=post.updatedAt,
             isLiked=is_liked,
         )
 
-    async def getAllPosts(self, limit: int = 10, offset: int = 0) -> PaginatedData[List[PostResponse]]:
+    async def getPostsETag(self, limit: int, offset: int) -> str:
+        """게시글 목록 ETag (목록 버전 + 작성자 정보 버전)"""
+        versions = await version_model.getVersions(version_model.POSTS, version_model.USERS)
+        return make_etag("posts", limit, offset, versions[version_model.POSTS], versions[version_model.USERS])
+
+    async def getPostETag(self, postId: str, current_user_id: Optional[str] = None) -> str:
+        """게시글 상세 ETag (isLiked가 사용자별로 달라지므로 사용자 ID 포함)"""
+        postKey = version_model.post(postId)
+        versions = await version_model.getVersions(postKey, version_model.USERS)
+        return make_etag("post", postId, versions[postKey], versions[version_model.USERS], current_user_id or "-")
+
+    async def getAllPosts(self, limit: int = 10, offset: int = 0) -> Dict:
         """게시글 목록 조회 로직 (페이징 메타데이터 포함)"""
         result = await post_model.getPosts(limit=limit, offset=offset)
         posts_data = result["posts"]
@@ -64,9 +80,9 @@ class PostController:
         current_page = (offset // limit) + 1
         has_next = offset + limit < total_count
 
-        return PaginatedData(
+        return PaginatedData.from_trusted(
             items=formatted_posts,
-            pagination=PaginationMeta(
+            pagination=PaginationMeta.from_trusted(
                 totalCount=total_count,
                 limit=limit,
                 offset=offset,
@@ -76,12 +92,24 @@ class PostController:
             )
         )
 
+    async def getPostChanges(self, since: SinceMarker, limit: int) -> Dict:
+        """since 이후 변경된 게시글 (목록 항목과 같은 모양 + 삭제된 게시글 ID)"""
+        # replica 지연으로 nextSince 이전에 커밋된 변경을 놓치지 않도록 primary에서 조회
+        with primary_reads():
+            result = await post_model.getPostChanges(since, limit=limit)
+        return DeltaData.from_trusted(
+            items=[await self._formatPost(post) for post in result["posts"]],
+            deletedIds=result["deletedIds"],
+            nextSince=result["nextSince"],
+            hasMore=result["hasMore"],
+        )
+
     async def getPostById(
         self,
         postId: str,
         incHits: bool = True,
         current_user_id: Optional[str] = None,
-    ) -> PostResponse:
+    ) -> Dict:
         """게시글 상세 조회 로직"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -91,26 +119,31 @@ class PostController:
             )
 
         # 조회수 증가 (필요한 경우만)
-        if incHits:
-            await post_model.incrementViewCount(postId)
-            # 증가된 데이터 반영을 위해 다시 조회
-            post = await post_model.getPostById(postId)
+        # - 목록 버전(POSTS)은 올리지 않아 목록 ETag/피드 캐시가 조회마다 바뀌지 않음 (목록의 조회수는 다른 변경 시 반영)
+        # - 다시 조회하지 않고 증가분만 반영 (쓰기 후 조회를 primary로 보내지 않음)
+        if incHits and await post_model.incrementViewCount(postId):
+            await version_model.bump(version_model.post(postId), readYourWrites=False)
+            post = post.replace(hits=post.hits + 1)
 
         return await self._formatPost(post, current_user_id=current_user_id)
 
-    async def createPost(self, req: PostCreateRequest, user: Dict) -> PostResponse:
+    async def createPost(self, req: PostCreateRequest, user: UserRecord) -> Dict:
         """게시글 생성 로직"""
         post_data = await post_model.createPost(
             title=req.title,
             content=req.content,
-            authorId=user["userId"],
-            authorNickname=user["nickname"],
+            authorId=user.userId,
+            authorNickname=user.nickname,
             fileUrl=req.fileUrl
         )
+        await version_model.bump(version_model.POSTS)
+        feed_cache.invalidate()
+        # 구독자에게는 목록과 같은 모양(isLiked 없음)으로 전송
+        event_bus.publish(FEED_TOPIC, "post.created", await self._formatPost(post_data))
 
-        return await self._formatPost(post_data, current_user_id=user["userId"])
+        return await self._formatPost(post_data, current_user_id=user.userId)
 
-    async def updatePost(self, postId: str, req: PostUpdateRequest, user: Dict) -> PostResponse:
+    async def updatePost(self, postId: str, req: PostUpdateRequest, user: UserRecord) -> Dict:
         """게시글 수정 로직"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -120,7 +153,7 @@ class PostController:
             )
 
         # 권한 확인 (작성자 확인)
-        if str(post["authorId"]) != str(user["userId"]):
+        if post.authorId != user.userId:
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="게시글"))
 
         updated_post = await post_model.updatePost(
@@ -129,10 +162,15 @@ class PostController:
             content=req.content,
             fileUrl=req.fileUrl
         )
+        await version_model.bump(version_model.POSTS, version_model.post(postId))
+        feed_cache.invalidate()
+        event_data = await self._formatPost(updated_post)
+        event_bus.publish(FEED_TOPIC, "post.updated", event_data)
+        event_bus.publish(post_topic(postId), "post.updated", event_data)
 
-        return await self._formatPost(updated_post, current_user_id=user["userId"])
+        return await self._formatPost(updated_post, current_user_id=user.userId)
 
-    async def deletePost(self, postId: str, user: Dict) -> Dict:
+    async def deletePost(self, postId: str, user: UserRecord) -> PostRecord:
         """게시글 삭제 로직"""
         post = await post_model.getPostById(postId)
         if not post:
@@ -142,7 +180,7 @@ class PostController:
             )
 
         # 권한 확인
-        if str(post["authorId"]) != str(user["userId"]):
+        if post.authorId != user.userId:
             raise APIError(ErrorCode.FORBIDDEN, ResourceError(resource="게시글"))
 
         # 게시글 삭제 시 관련 댓글들도 함께 삭제
@@ -150,6 +188,10 @@ class PostController:
 
         # Model을 통해 게시글 삭제
         await post_model.deletePost(postId)
+        await version_model.bump(version_model.POSTS, version_model.post(postId), version_model.comments(postId))
+        feed_cache.invalidate()
+        event_bus.publish(FEED_TOPIC, "post.deleted", {"postId": postId})
+        event_bus.publish(post_topic(postId), "post.deleted", {"postId": postId})
 
         return post
 
@@ -160,6 +202,11 @@ class PostController:
             raise APIError(ErrorCode.POST_NOT_FOUND, ResourceError(resource="게시글", id=postId))
             
         likeCount = await post_model.toggleLike(postId, userId)
+        await version_model.bump(version_model.POSTS, version_model.post(postId))
+        feed_cache.invalidate()
+        event_data = {"postId": postId, "likeCount": likeCount}
+        event_bus.publish(FEED_TOPIC, "post.liked", event_data)
+        event_bus.publish(post_topic(postId), "post.liked", event_data)
         return {"likeCount": likeCount}
 
 
@@ -1,8 +1,12 @@
 from typing import Dict, Union
 from fastapi import Request
 from models.user_model import user_model
+from models.records import UserRecord
 from models.post_model import post_model
 from models.comment_model import comment_model
+from models.version_model import version_model
+from utils.common.response_cache import feed_cache
+from utils.common.image_variants import variant_urls
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
 from schemas import UserUpdateRequest, PasswordChangeRequest, UserResponse, ResourceError, FieldError
@@ -11,21 +15,31 @@ from schemas import UserUpdateRequest, PasswordChangeRequest, UserResponse, Reso
 class UserController:
     """사용자 관련 비즈니스 로직"""
 
-    async def getUserById(self, userId: str) -> UserResponse:
+    def _formatUser(self, user: UserRecord) -> Dict:
+        """User 레코드를 API 응답 규격(UserResponse 모양의 dict)으로 변환"""
+        data = UserResponse.from_trusted(user)
+        data["profileImageVariants"] = variant_urls(user.profileImageUrl)
+        return data
+
+    async def getMe(self, user: UserRecord) -> Dict:
+        """내 정보 조회 (인증 단계에서 조회한 사용자 레코드 사용)"""
+        return self._formatUser(user)
+
+    async def getUserById(self, userId: str) -> Dict:
         """사용자 정보 조회"""
         user = await user_model.getUserById(userId)
         if not user:
             raise APIError(ErrorCode.USER_NOT_FOUND, ResourceError(resource="사용자", id=userId))
-        return UserResponse.model_validate(user)
+        return self._formatUser(user)
 
-    async def updateUser(self, userId: str, req: UserUpdateRequest, currentUser: Dict) -> UserResponse:
+    async def updateUser(self, userId: str, req: UserUpdateRequest, currentUser: UserRecord) -> Dict:
         """사용자 정보 수정"""
         # 본인 확인
-        if str(userId) != str(currentUser["userId"]):
+        if str(userId) != str(currentUser.userId):
             raise APIError(ErrorCode.FORBIDDEN)
 
         # 닉네임 중복 체크 (본인 닉네임과 다를 경우만)
-        if req.nickname != currentUser["nickname"] and await user_model.nicknameExists(req.nickname):
+        if req.nickname != currentUser.nickname and await user_model.nicknameExists(req.nickname):
             raise APIError(ErrorCode.ALREADY_EXISTS, FieldError(field="nickname", value=req.nickname), message="이미 사용 중인 닉네임입니다.")
 
         updateData = {
@@ -35,26 +49,33 @@ class UserController:
         updatedUser = await user_model.updateUser(userId, updateData)
 
         # 닉네임이 변경된 경우 게시글 및 댓글의 닉네임 동기화
-        if req.nickname != currentUser["nickname"]:
+        if req.nickname != currentUser.nickname:
             post_model.updateAuthorNickname(userId, req.nickname)
             comment_model.updateUserNickname(userId, req.nickname)
 
-        return UserResponse.model_validate(updatedUser)
+        # 게시글/댓글 목록의 작성자 정보가 바뀌므로 해당 ETag 무효화
+        if req.nickname != currentUser.nickname or req.profileImageUrl != currentUser.profileImageUrl:
+            await version_model.bump(version_model.USERS)
+            feed_cache.invalidate()
+
+        return self._formatUser(updatedUser)
 
-    async def changePassword(self, userId: str, req: PasswordChangeRequest, currentUser: Dict) -> Dict:
+    async def changePassword(self, userId: str, req: PasswordChangeRequest, currentUser: UserRecord) -> Dict:
         """비밀번호 변경"""
-        if str(userId) != str(currentUser["userId"]):
+        if str(userId) != str(currentUser.userId):
             raise APIError(ErrorCode.FORBIDDEN)
 
         await user_model.updateUser(userId, {"password": req.password})
         return {}
 
-    async def deleteUser(self, userId: str, currentUser: Dict, request: Request) -> Dict:
+    async def deleteUser(self, userId: str, currentUser: UserRecord, request: Request) -> Dict:
         """회원 탈퇴"""
-        if str(userId) != str(currentUser["userId"]):
+        if str(userId) != str(currentUser.userId):
             raise APIError(ErrorCode.FORBIDDEN)
 
         await user_model.deleteUser(userId)
+        await version_model.bump(version_model.USERS)
+        feed_cache.invalidate()
         request.session.clear()
         return {}
 
@@ -1,9 +1,17 @@
 import argparse
 import asyncio
+import hashlib
+import json
+import math
 import os
 import random
+import shutil
 import sys
-from typing import Iterable, List, Sequence, Tuple
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가하여 config, utils 등을 임포트할 수 있게 함
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,25 +19,25 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import bcrypt
 import aiomysql
 from faker import Faker
+from ulid import ULID
 
 from config import settings
-from utils.common.id_utils import generate_id
 
 
-def _chunks(items: Sequence[Tuple], size: int) -> Iterable[List[Tuple]]:
-    for idx in range(0, len(items), size):
-        yield list(items[idx:idx + size])
-
-
-async def _connect():
-    return await aiomysql.connect(
+async def _connect(local_infile: bool = False):
+    conn = await aiomysql.connect(
         host=settings.db_host,
         port=settings.db_port,
         user=settings.db_user,
         password=settings.db_password,
         db=settings.db_name,
         autocommit=False,
+        local_infile=local_infile,
     )
+    async with conn.cursor() as cursor:
+        # 생성된 시각은 UTC 문자열로 기록
+        await cursor.execute("SET time_zone = '+00:00'")
+    return conn
 
 
 async def _maybe_clear(cursor, clear: bool):
@@ -48,103 +56,6 @@ def _get_image_files(directory: str) -> List[str]:
     return [f for f in os.listdir(directory) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp'))]
 
 
-async def _insert_users(cursor, faker: Faker, total: int, batch_size: int) -> List[str]:
-    user_ids: List[str] = []
-    hashed_password = bcrypt.hashpw(b"password1234!", bcrypt.gensalt()).decode("utf-8")
-
-    # 프로필 이미지 목록 가져오기
-    profile_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "public", "image", "profile")
-    profile_images = _get_image_files(profile_dir)
-
-    insert_sql = """
-        INSERT INTO users (user_id, email, password, nickname, profile_image_url, created_at)
-        VALUES (%s, %s, %s, %s, %s, NOW())
-    """
-    while len(user_ids) < total:
-        batch = min(batch_size, total - len(user_ids))
-        rows: List[Tuple] = []
-        for _ in range(batch):
-            user_id = generate_id()
-            email = faker.unique.email()
-            nickname = faker.unique.user_name()[:50]
-
-            # 30% 확률로 프로필 이미지 할당
-            profile_image_url = None
-            if profile_images and random.random() < 0.3:
-                img_name = random.choice(profile_images)
-                profile_image_url = f"/public/image/profile/{img_name}"
-
-            rows.append((user_id, email, hashed_password, nickname, profile_image_url))
-            user_ids.append(user_id)
-        await cursor.executemany(insert_sql, rows)
-    return user_ids
-
-
-async def _insert_posts(
-    cursor,
-    faker: Faker,
-    user_ids: Sequence[str],
-    total: int,
-    batch_size: int,
-) -> List[str]:
-    post_ids: List[str] = []
-
-    # 게시글 이미지 목록 가져오기
-    post_img_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "public", "image", "post")
-    post_images = _get_image_files(post_img_dir)
-
-    insert_sql = """
-        INSERT INTO posts (post_id, user_id, title, content, post_image_url, hits, comment_count, created_at)
-        VALUES (%s, %s, %s, %s, %s, %s, 0, NOW())
-    """
-    while len(post_ids) < total:
-        batch = min(batch_size, total - len(post_ids))
-        rows: List[Tuple] = []
-        for _ in range(batch):
-            post_id = generate_id()
-            user_id = random.choice(user_ids)
-            title = faker.sentence(nb_words=8)[:300]
-            content = faker.paragraph(nb_sentences=5)
-            hits = random.randint(0, 500)
-
-            # 40% 확률로 게시글 이미지 할당
-            post_image_url = None
-            if post_images and random.random() < 0.4:
-                img_name = random.choice(post_images)
-                post_image_url = f"/public/image/post/{img_name}"
-
-            rows.append((post_id, user_id, title, content, post_image_url, hits))
-            post_ids.append(post_id)
-        await cursor.executemany(insert_sql, rows)
-    return post_ids
-
-
-async def _insert_comments(
-    cursor,
-    faker: Faker,
-    user_ids: Sequence[str],
-    post_ids: Sequence[str],
-    total: int,
-    batch_size: int,
-):
-    insert_sql = """
-        INSERT INTO comments (comment_id, post_id, user_id, content, created_at)
-        VALUES (%s, %s, %s, %s, NOW())
-    """
-    inserted = 0
-    while inserted < total:
-        batch = min(batch_size, total - inserted)
-        rows: List[Tuple] = []
-        for _ in range(batch):
-            comment_id = generate_id()
-            post_id = random.choice(post_ids)
-            user_id = random.choice(user_ids)
-            content = faker.sentence(nb_words=18)
-            rows.append((comment_id, post_id, user_id, content))
-        await cursor.executemany(insert_sql, rows)
-        inserted += batch
-
-
 async def _sync_comment_counts(cursor):
     await cursor.execute(
         """
@@ -175,41 +86,285 @@ async def _insert_admin(cursor):
     await cursor.execute(insert_sql, (admin_id, admin_email, admin_password, admin_nickname, None))
 
 
-async def main():
-    parser = argparse.ArgumentParser(description="Generate and insert dummy data.")
-    parser.add_argument("--users", type=int, default=10_000)
-    parser.add_argument("--posts", type=int, default=40_000)
-    parser.add_argument("--comments", type=int, default=50_000)
-    parser.add_argument("--batch-size", type=int, default=5_000)
-    parser.add_argument("--seed", type=int, default=42)
-    parser.add_argument(
-        "--clear",
-        action="store_true",
-        help="Delete existing data before inserting dummy data.",
-    )
-    args = parser.parse_args()
+# ---------------------------------------------------------------------------
+# 데이터 생성 (기본 모드와 bulk 모드가 공유)
+# - 모든 row는 (seed, 테이블, 인덱스)로부터 결정적으로 생성되므로 어느 프로세스에서든
+#   다른 테이블의 ID/시각을 재계산할 수 있음 (부모 프로세스가 ID 목록을 들고 있을 필요가 없음)
+# - --distribution zipf: 작성자별 게시글 수, 게시글별 댓글/좋아요 수, 사용자별 세션 수가 멱법칙을 따름
+# - --time-growth: 생성 시각이 최근으로 갈수록 조밀해짐 (서비스 성장 곡선)
+# ---------------------------------------------------------------------------
+
+TABLE_COLUMNS: Dict[str, Sequence[str]] = {
+    "users": ("user_id", "email", "password", "nickname", "profile_image_url", "created_at"),
+    "posts": ("post_id", "user_id", "title", "content", "post_image_url", "hits", "comment_count", "created_at"),
+    "comments": ("comment_id", "post_id", "user_id", "content", "created_at"),
+    "post_likes": ("post_id", "user_id", "created_at"),
+    "sessions": ("session_key", "user_id", "data", "expires_at", "created_at"),
+}
+# (post_id, user_id) PK 중복은 무시 (Zipf 분포에서는 같은 쌍이 여러 번 뽑힐 수 있음)
+IGNORE_DUPLICATES = {"post_likes"}
+TEXT_POOL_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """생성 파라미터 (워커 프로세스로 전달되므로 pickle 가능해야 함)"""
+    seed: int
+    users: int
+    posts: int
+    comments: int
+    likes: int
+    sessions: int
+    start_ts: int
+    end_ts: int
+    distribution: str
+    zipf_s: float
+    time_growth: float
+    session_timeout: int
+    hashed_password: str
+    profile_images: Tuple[str, ...]
+    post_images: Tuple[str, ...]
+
+    def count(self, table: str) -> int:
+        return {
+            "users": self.users,
+            "posts": self.posts,
+            "comments": self.comments,
+            "post_likes": self.likes,
+            "sessions": self.sessions,
+        }[table]
+
+
+def _stable_hash(text: str) -> int:
+    """프로세스 간에 동일한 해시 (내장 hash()는 PYTHONHASHSEED에 따라 달라짐)"""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+class Sampler:
+    """
+    [0, n) 인덱스 샘플러
+    - uniform: 균등 분포
+    - zipf: P(rank) ∝ 1 / rank^s 를 연속 근사 역변환으로 O(1) 메모리에 샘플링
+    순위(rank) -> 인덱스는 (seed, kind) 고정 순열로 섞어 인기 항목이 특정 구간(가장 오래된 row)에 몰리지 않게 함.
+    같은 kind의 Sampler는 모든 프로세스에서 같은 순열을 사용하므로 "인기 게시글"은 댓글과 좋아요 양쪽에서 일관됨.
+    """
 
-    random.seed(args.seed)
+    def __init__(self, spec: DatasetSpec, kind: str, n: int, rng: random.Random):
+        self.n = n
+        self.rng = rng
+        self.zipf = spec.distribution == "zipf" and n > 1
+        self.s = spec.zipf_s
+        salt = _stable_hash(f"{spec.seed}:{kind}")
+        self.offset = salt % max(n, 1)
+        stride = (salt >> 16) % max(n, 1) or 1
+        while math.gcd(stride, max(n, 1)) != 1:
+            stride += 1
+        self.stride = stride
+        self.upper = (n + 1) ** (1 - self.s) if self.s != 1 else 0.0
+
+    def pick(self) -> int:
+        if not self.zipf:
+            return self.rng.randrange(self.n)
+        u = self.rng.random()
+        if self.s == 1:
+            x = (self.n + 1) ** u
+        else:
+            x = ((self.upper - 1) * u + 1) ** (1 / (1 - self.s))
+        rank = min(int(x) - 1, self.n - 1)
+        return (rank * self.stride + self.offset) % self.n
+
+
+def _timeline_ts(spec: DatasetSpec, idx: int, total: int) -> int:
+    """idx번째 row의 생성 시각 (idx 순서 = 시간 순서, time_growth > 1 이면 최근일수록 조밀)"""
+    if total <= 1:
+        return spec.end_ts
+    frac = (idx / (total - 1)) ** (1 / spec.time_growth)
+    return spec.start_ts + int((spec.end_ts - spec.start_ts) * frac)
+
+
+def _dataset_id(spec: DatasetSpec, kind: str, idx: int, ts: int) -> str:
+    """생성 시각 + (seed, kind, idx) 해시로 만든 결정적 ULID (ULID 순서가 created_at 순서와 일치)"""
+    randomness = hashlib.blake2b(f"{spec.seed}:{kind}:{idx}".encode(), digest_size=10).digest()
+    return str(ULID.from_bytes((ts * 1000).to_bytes(6, "big") + randomness))
+
+
+def _user_id(spec: DatasetSpec, idx: int) -> str:
+    return _dataset_id(spec, "user", idx, _timeline_ts(spec, idx, spec.users))
+
+
+def _post_ts(spec: DatasetSpec, idx: int) -> int:
+    return _timeline_ts(spec, idx, spec.posts)
+
+
+def _post_id(spec: DatasetSpec, idx: int) -> str:
+    return _dataset_id(spec, "post", idx, _post_ts(spec, idx))
+
+
+def _format_ts(ts: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts))
+
+
+def _after(rng: random.Random, spec: DatasetSpec, ts: int) -> int:
+    """ts 이후의 시각 (최근 반응이 많도록 가까운 시각에 치우침)"""
+    span = max(spec.end_ts - ts, 0)
+    return ts + int(span * rng.random() ** 3)
+
+
+def _text_pools(faker: Faker) -> Tuple[List[str], List[str], List[str]]:
+    """Faker 호출 비용을 줄이기 위해 청크마다 문장 풀을 만들어 재사용"""
+    titles = [faker.sentence(nb_words=8)[:300] for _ in range(TEXT_POOL_SIZE)]
+    paragraphs = [faker.paragraph(nb_sentences=5) for _ in range(TEXT_POOL_SIZE)]
+    sentences = [faker.sentence(nb_words=18) for _ in range(TEXT_POOL_SIZE)]
+    return titles, paragraphs, sentences
+
+
+def _gen_users(spec: DatasetSpec, start: int, end: int, rng: random.Random, faker: Faker) -> Iterable[Tuple]:
+    for idx in range(start, end):
+        ts = _timeline_ts(spec, idx, spec.users)
+        name = faker.user_name()
+        # 30% 확률로 프로필 이미지 할당
+        profile_image_url = None
+        if spec.profile_images and rng.random() < 0.3:
+            profile_image_url = f"/public/image/profile/{rng.choice(spec.profile_images)}"
+        # idx 접미사로 프로세스 간 email/nickname 유니크 보장
+        yield (
+            _dataset_id(spec, "user", idx, ts),
+            f"{name}.{idx}@example.com",
+            spec.hashed_password,
+            f"{name[:38]}_{idx}",
+            profile_image_url,
+            _format_ts(ts),
+        )
+
+
+def _gen_posts(spec: DatasetSpec, start: int, end: int, rng: random.Random, faker: Faker) -> Iterable[Tuple]:
+    titles, paragraphs, _ = _text_pools(faker)
+    authors = Sampler(spec, "user", spec.users, rng)
+    for idx in range(start, end):
+        ts = _post_ts(spec, idx)
+        # 40% 확률로 게시글 이미지 할당
+        post_image_url = None
+        if spec.post_images and rng.random() < 0.4:
+            post_image_url = f"/public/image/post/{rng.choice(spec.post_images)}"
+        yield (
+            _dataset_id(spec, "post", idx, ts),
+            _user_id(spec, authors.pick()),
+            rng.choice(titles),
+            rng.choice(paragraphs),
+            post_image_url,
+            rng.randint(0, 500),
+            0,
+            _format_ts(ts),
+        )
+
+
+def _gen_comments(spec: DatasetSpec, start: int, end: int, rng: random.Random, faker: Faker) -> Iterable[Tuple]:
+    _, _, sentences = _text_pools(faker)
+    posts = Sampler(spec, "post", spec.posts, rng)
+    users = Sampler(spec, "user", spec.users, rng)
+    for idx in range(start, end):
+        post_idx = posts.pick()
+        ts = _after(rng, spec, _post_ts(spec, post_idx))
+        yield (
+            _dataset_id(spec, "comment", idx, ts),
+            _post_id(spec, post_idx),
+            _user_id(spec, users.pick()),
+            rng.choice(sentences),
+            _format_ts(ts),
+        )
+
+
+def _gen_likes(spec: DatasetSpec, start: int, end: int, rng: random.Random, faker: Faker) -> Iterable[Tuple]:
+    posts = Sampler(spec, "post", spec.posts, rng)
+    for _ in range(start, end):
+        post_idx = posts.pick()
+        # 좋아요를 누르는 사용자는 균등 분포 (같은 사용자의 중복 좋아요를 줄이기 위함)
+        yield (
+            _post_id(spec, post_idx),
+            _user_id(spec, rng.randrange(spec.users)),
+            _format_ts(_after(rng, spec, _post_ts(spec, post_idx))),
+        )
+
+
+def _gen_sessions(spec: DatasetSpec, start: int, end: int, rng: random.Random, faker: Faker) -> Iterable[Tuple]:
+    users = Sampler(spec, "user", spec.users, rng)
+    for _ in range(start, end):
+        user_id = _user_id(spec, users.pick())
+        # 최근 2 * session_timeout 구간에 생성 -> 약 절반은 만료된(정리되지 않은) 세션
+        created = spec.end_ts - rng.randint(0, 2 * spec.session_timeout)
+        yield (
+            f"{rng.getrandbits(256):064x}",
+            user_id,
+            json.dumps({"userId": user_id}),
+            _format_ts(created + spec.session_timeout),
+            _format_ts(created),
+        )
+
+
+GENERATORS: Dict[str, Callable[..., Iterable[Tuple]]] = {
+    "users": _gen_users,
+    "posts": _gen_posts,
+    "comments": _gen_comments,
+    "post_likes": _gen_likes,
+    "sessions": _gen_sessions,
+}
+
+
+def _chunk_rows(spec: DatasetSpec, table: str, start: int, end: int) -> Iterable[Tuple]:
+    chunk_seed = _stable_hash(f"{spec.seed}:{table}:{start}") & 0xFFFFFFFF
+    rng = random.Random(chunk_seed)
     faker = Faker("en_US")
-    faker.seed_instance(args.seed)
+    faker.seed_instance(chunk_seed)
+    return GENERATORS[table](spec, start, end, rng, faker)
+
+
+def _insert_sql(table: str) -> str:
+    columns = TABLE_COLUMNS[table]
+    ignore = " IGNORE" if table in IGNORE_DUPLICATES else ""
+    return f"INSERT{ignore} INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+
+def _build_spec(args) -> DatasetSpec:
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    end_ts = int(time.time())
+    return DatasetSpec(
+        seed=args.seed,
+        users=args.users,
+        posts=args.posts,
+        comments=args.comments,
+        likes=args.likes,
+        sessions=args.sessions,
+        start_ts=end_ts - args.days * 86400,
+        end_ts=end_ts,
+        distribution=args.distribution,
+        zipf_s=args.zipf_s,
+        time_growth=args.time_growth,
+        session_timeout=settings.session_timeout,
+        hashed_password=bcrypt.hashpw(b"password1234!", bcrypt.gensalt()).decode("utf-8"),
+        profile_images=tuple(_get_image_files(os.path.join(base_dir, "public", "image", "profile"))),
+        post_images=tuple(_get_image_files(os.path.join(base_dir, "public", "image", "post"))),
+    )
+
+
+def _tables(spec: DatasetSpec) -> List[str]:
+    return [t for t in TABLE_COLUMNS if spec.count(t) > 0]
+
 
+async def _run_batched(args, spec: DatasetSpec) -> None:
+    """기본 모드: 단일 커넥션에서 batch_size 단위 executemany"""
     conn = await _connect()
     try:
         async with conn.cursor() as cursor:
             await _maybe_clear(cursor, args.clear)
-
             await _insert_admin(cursor)
-            user_ids = await _insert_users(cursor, faker, args.users, args.batch_size)
-            await conn.commit()
-            print(f"Inserted users: {len(user_ids)}")
-
-            post_ids = await _insert_posts(cursor, faker, user_ids, args.posts, args.batch_size)
-            await conn.commit()
-            print(f"Inserted posts: {len(post_ids)}")
-
-            await _insert_comments(cursor, faker, user_ids, post_ids, args.comments, args.batch_size)
-            await conn.commit()
-            print(f"Inserted comments: {args.comments}")
+            for table in _tables(spec):
+                insert_sql = _insert_sql(table)
+                total = spec.count(table)
+                for start in range(0, total, args.batch_size):
+                    rows = list(_chunk_rows(spec, table, start, min(start + args.batch_size, total)))
+                    await cursor.executemany(insert_sql, rows)
+                await conn.commit()
+                print(f"Inserted {table}: {total}")
 
             await _sync_comment_counts(cursor)
             await conn.commit()
@@ -218,5 +373,256 @@ async def main():
         conn.close()
 
 
+# ---------------------------------------------------------------------------
+# 대량 적재(bulk) 모드
+# - 프로세스 풀에서 인덱스 구간(chunk) 단위로 row를 생성해 TSV로 기록
+# - 여러 커넥션에서 병렬로 LOAD DATA LOCAL INFILE (또는 대형 multi-row INSERT) 적재
+# ---------------------------------------------------------------------------
+
+
+def _tsv_value(value) -> str:
+    if value is None:
+        return "\\N"
+    text = str(value)
+    if "\\" in text or "\t" in text or "\n" in text:
+        text = text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+    return text
+
+
+def _write_tsv(path: str, rows: Iterable[Tuple]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for row in rows:
+            f.write("\t".join(_tsv_value(v) for v in row))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _generate_chunk(spec: DatasetSpec, out_dir: str, table: str, start: int, end: int) -> Tuple[str, str, int]:
+    """워커 프로세스 진입점: [start, end) 구간의 row를 TSV 파일로 기록"""
+    path = os.path.join(out_dir, f"{table}_{start:012d}.tsv")
+    count = _write_tsv(path, _chunk_rows(spec, table, start, end))
+    return table, path, count
+
+
+async def _bulk_connect(local_infile: bool):
+    conn = await _connect(local_infile=local_infile)
+    async with conn.cursor() as cursor:
+        # 적재 중 FK/유니크 검사 생략 (생성 로직이 정합성을 보장)
+        await cursor.execute("SET foreign_key_checks = 0")
+        await cursor.execute("SET unique_checks = 0")
+    return conn
+
+
+async def _load_infile(cursor, table: str, path: str, batch_size: int) -> None:
+    columns = ", ".join(TABLE_COLUMNS[table])
+    ignore = "IGNORE" if table in IGNORE_DUPLICATES else ""
+    await cursor.execute(
+        f"""
+        LOAD DATA LOCAL INFILE %s {ignore} INTO TABLE {table}
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+        LINES TERMINATED BY '\\n'
+        ({columns})
+        """,
+        (os.path.abspath(path),),
+    )
+
+
+def _read_tsv(path: str) -> Iterable[Tuple]:
+    unescape = {"\\\\": "\\", "\\t": "\t", "\\n": "\n"}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            values = []
+            for field in line.rstrip("\n").split("\t"):
+                if field == "\\N":
+                    values.append(None)
+                elif "\\" in field:
+                    for escaped, raw in unescape.items():
+                        field = field.replace(escaped, raw)
+                    values.append(field)
+                else:
+                    values.append(field)
+            yield tuple(values)
+
+
+async def _load_insert(cursor, table: str, path: str, batch_size: int) -> None:
+    # pymysql executemany가 하나의 multi-row INSERT로 재작성함
+    insert_sql = _insert_sql(table)
+    batch: List[Tuple] = []
+    for row in _read_tsv(path):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            await cursor.executemany(insert_sql, batch)
+            batch = []
+    if batch:
+        await cursor.executemany(insert_sql, batch)
+
+
+async def _drop_secondary_indexes(cursor, tables: Sequence[str]) -> List[Tuple[str, str, str]]:
+    """PK/UNIQUE를 제외한 보조 인덱스를 삭제하고 재생성용 정의를 반환 (FK가 필요로 하는 인덱스는 유지)"""
+    await cursor.execute(
+        """
+        SELECT table_name, index_name, column_name, collation, sub_part
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name IN %s
+          AND non_unique = 1
+        ORDER BY table_name, index_name, seq_in_index
+        """,
+        (tuple(tables),),
+    )
+    definitions: Dict[Tuple[str, str], List[str]] = {}
+    for table, index, column, collation, sub_part in await cursor.fetchall():
+        part = f"{column}({sub_part})" if sub_part else column
+        definitions.setdefault((table, index), []).append(part + (" DESC" if collation == "D" else ""))
+
+    dropped: List[Tuple[str, str, str]] = []
+    for (table, index), parts in definitions.items():
+        try:
+            await cursor.execute(f"ALTER TABLE {table} DROP INDEX {index}")
+            dropped.append((table, index, ", ".join(parts)))
+        except aiomysql.Error as e:
+            # 1553: FK 제약이 사용하는 인덱스
+            print(f"  인덱스 유지: {table}.{index} ({e.args[1] if len(e.args) > 1 else e})")
+    return dropped
+
+
+async def _rebuild_indexes(cursor, dropped: Sequence[Tuple[str, str, str]]) -> None:
+    """테이블별로 한 번의 ALTER로 재생성 (테이블 재구성 1회)"""
+    by_table: Dict[str, List[str]] = {}
+    for table, index, columns in dropped:
+        by_table.setdefault(table, []).append(f"ADD INDEX {index} ({columns})")
+    for table, clauses in by_table.items():
+        started = time.perf_counter()
+        await cursor.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
+        print(f"  인덱스 재생성: {table} ({len(clauses)}개, {time.perf_counter() - started:.1f}s)")
+
+
+async def _bulk_clear(cursor, clear: bool):
+    if not clear:
+        return
+    for table in ("post_likes", "comments", "posts", "sessions", "users"):
+        await cursor.execute(f"TRUNCATE TABLE {table}")
+
+
+async def _run_bulk(args, spec: DatasetSpec) -> None:
+    out_dir = args.tsv_dir or tempfile.mkdtemp(prefix="dummy_data_")
+    os.makedirs(out_dir, exist_ok=True)
+    loader = _load_infile if args.load_method == "infile" else _load_insert
+    tables = _tables(spec)
+
+    admin_conn = await _bulk_connect(local_infile=False)
+    dropped: List[Tuple[str, str, str]] = []
+    started = time.perf_counter()
+    try:
+        async with admin_conn.cursor() as cursor:
+            await _bulk_clear(cursor, args.clear)
+            await _insert_admin(cursor)
+            if args.drop_indexes:
+                dropped = await _drop_secondary_indexes(cursor, ("posts", "comments", "post_likes", "sessions"))
+        await admin_conn.commit()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=args.connections * 2)
+        loaded: Dict[str, int] = {t: 0 for t in tables}
+
+        async def load_worker():
+            conn = await _bulk_connect(local_infile=args.load_method == "infile")
+            try:
+                async with conn.cursor() as cursor:
+                    while True:
+                        item = await queue.get()
+                        if item is None:
+                            return
+                        table, path, count = item
+                        await loader(cursor, table, path, args.batch_size)
+                        await conn.commit()
+                        loaded[table] += count
+                        if not args.keep_tsv:
+                            os.remove(path)
+                        print(f"  {table}: {loaded[table]:,}/{spec.count(table):,} ({time.perf_counter() - started:.1f}s)")
+            finally:
+                conn.close()
+
+        loaders = [asyncio.create_task(load_worker()) for _ in range(args.connections)]
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [
+                loop.run_in_executor(
+                    pool, _generate_chunk, spec, out_dir, table, start, min(start + args.chunk_size, spec.count(table))
+                )
+                for table in tables
+                for start in range(0, spec.count(table), args.chunk_size)
+            ]
+            for future in asyncio.as_completed(futures):
+                await queue.put(await future)
+        for _ in loaders:
+            await queue.put(None)
+        await asyncio.gather(*loaders)
+
+        async with admin_conn.cursor() as cursor:
+            if dropped:
+                await _rebuild_indexes(cursor, dropped)
+            await _sync_comment_counts(cursor)
+        await admin_conn.commit()
+        print(f"Synced comment_count for posts. 총 {time.perf_counter() - started:.1f}s")
+    finally:
+        admin_conn.close()
+        if not args.keep_tsv and not args.tsv_dir:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Generate and insert dummy data.")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--posts", type=int, default=40_000)
+    parser.add_argument("--comments", type=int, default=50_000)
+    parser.add_argument("--likes", type=int, default=100_000, help="post_likes rows to attempt (duplicates are skipped).")
+    parser.add_argument("--sessions", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--clear",
+        action="store_true",
+        help="Delete existing data before inserting dummy data.",
+    )
+    shape = parser.add_argument_group("data shape")
+    shape.add_argument(
+        "--distribution",
+        choices=("uniform", "zipf"),
+        default="zipf",
+        help="Posts per author, comments/likes per post and sessions per user.",
+    )
+    shape.add_argument("--zipf-s", type=float, default=1.1, help="Zipf exponent (higher = more skewed).")
+    shape.add_argument("--days", type=int, default=365, help="Spread created_at over the last N days.")
+    shape.add_argument(
+        "--time-growth",
+        type=float,
+        default=2.0,
+        help="1.0 = uniform over time, >1.0 = more rows in recent days.",
+    )
+    bulk = parser.add_argument_group("bulk mode (10M+ rows)")
+    bulk.add_argument("--bulk", action="store_true", help="Generate rows in a process pool and bulk-load them in parallel.")
+    bulk.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Row generator processes.")
+    bulk.add_argument("--connections", type=int, default=4, help="Parallel loading connections.")
+    bulk.add_argument("--chunk-size", type=int, default=100_000, help="Rows per generated TSV file.")
+    bulk.add_argument(
+        "--load-method",
+        choices=("infile", "insert"),
+        default="infile",
+        help="LOAD DATA LOCAL INFILE (requires local_infile=ON) or multi-row INSERT.",
+    )
+    bulk.add_argument("--drop-indexes", action="store_true", help="Drop secondary indexes during load and rebuild after.")
+    bulk.add_argument("--tsv-dir", help="Directory for generated TSV files (default: temp dir).")
+    bulk.add_argument("--keep-tsv", action="store_true", help="Keep TSV files after loading.")
+    args = parser.parse_args()
+
+    spec = _build_spec(args)
+    if args.bulk:
+        await _run_bulk(args, spec)
+    else:
+        await _run_batched(args, spec)
+
+
 if __name__ == "__main__":
     asyncio.run(main())
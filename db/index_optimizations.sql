@@ -9,3 +9,7 @@ CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at,
 
 -- 댓글 목록(사용자): user_id + deleted_at + created_at 정렬 최적화
 CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC);
+
+-- 업로드 파일 정리(utils/common/upload_gc.py): 파일 URL 배치의 사용 여부 조회 (IN 조건)
+CREATE INDEX idx_posts_image_url ON posts(post_image_url);
+CREATE INDEX idx_users_profile_image_url ON users(profile_image_url);
@@ -0,0 +1,10 @@
+-- 변경분 동기화(since 조회)용 changed_at 컬럼 추가 (db/schema.sql 이전에 생성한 DB에 1회 적용)
+-- 기존 행은 적용 시각으로 채워지므로, 적용 이전의 since로 조회하면 모든 행이 한 번 전송됩니다.
+
+ALTER TABLE posts
+    ADD COLUMN changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+CREATE INDEX idx_posts_changed ON posts(changed_at, post_id);
+
+ALTER TABLE comments
+    ADD COLUMN changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+CREATE INDEX idx_comments_post_changed ON comments(post_id, changed_at, comment_id);
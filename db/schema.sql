@@ -22,12 +22,15 @@ CREATE TABLE IF NOT EXISTS posts (
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL,
     deleted_at TIMESTAMP NULL,
+    -- 변경분 동기화(since)용: 행이 바뀔 때마다(수정/삭제/조회수/댓글 수, 좋아요는 직접 갱신) DB가 갱신
+    changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     CONSTRAINT fk_posts_user FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE INDEX idx_author_created ON posts(user_id, created_at DESC);
 CREATE INDEX idx_created ON posts(created_at DESC);
 CREATE INDEX idx_posts_deleted_created ON posts(deleted_at, created_at DESC);
+CREATE INDEX idx_posts_changed ON posts(changed_at, post_id);
 
 CREATE TABLE IF NOT EXISTS comments (
     comment_id VARCHAR(26) PRIMARY KEY,
@@ -37,6 +40,7 @@ CREATE TABLE IF NOT EXISTS comments (
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL,
     deleted_at TIMESTAMP NULL,
+    changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
     CONSTRAINT fk_comments_post FOREIGN KEY (post_id) REFERENCES posts(post_id) ON DELETE CASCADE,
     CONSTRAINT fk_comments_user FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -45,6 +49,7 @@ CREATE INDEX idx_post_created ON comments(post_id, created_at ASC);
 CREATE INDEX idx_user ON comments(user_id);
 CREATE INDEX idx_comments_post_deleted_created ON comments(post_id, deleted_at, created_at DESC);
 CREATE INDEX idx_comments_user_deleted_created ON comments(user_id, deleted_at, created_at DESC);
+CREATE INDEX idx_comments_post_changed ON comments(post_id, changed_at, comment_id);
 
 CREATE TABLE IF NOT EXISTS post_likes (
     post_id VARCHAR(26) NOT NULL,
@@ -69,3 +74,11 @@ CREATE TABLE IF NOT EXISTS sessions (
 
 CREATE INDEX idx_expires ON sessions(expires_at);
 CREATE INDEX idx_user_expires ON sessions(user_id, expires_at);
+
+-- 리소스별 버전 카운터 (ETag/조건부 GET용, 쓰기 시 증가)
+-- resource_key 예: posts, post:{postId}, comments:{postId}, users
+CREATE TABLE IF NOT EXISTS resource_versions (
+    resource_key VARCHAR(64) PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -1,18 +1,30 @@
+import asyncio
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
 
 from utils.common.response import StandardResponse
-from utils.errors.error_codes import SuccessCode
+from utils.common.static_files import PrecompressedStaticFiles
+from utils.errors.error_codes import ErrorCode, SuccessCode
+from utils.errors.exceptions import APIError
 from utils.middleware.auth_middleware import AuthMiddleware
 from utils.middleware.db_session_middleware import DBSessionMiddleware
 from utils.middleware.request_id_middleware import RequestIDMiddleware, request_id_ctx
 from utils.middleware.access_log_middleware import AccessLogMiddleware
+from utils.middleware.compression_middleware import CompressionMiddleware
+from utils.middleware.admission_middleware import AdmissionControlMiddleware
+from utils.middleware.rate_limit_middleware import RateLimitMiddleware
+from utils.middleware.read_routing_middleware import ReadRoutingMiddleware
+from utils.middleware.deadline_middleware import DeadlineMiddleware
+from utils.middleware.body_limit_middleware import BodyLimitMiddleware
 from utils.errors.exception_handlers import register_exception_handlers
-from utils.database.db import init_pool, close_pool
+from utils.database.db import init_pool, close_pool, warm_pool, ping as db_ping
+from utils.common.image_variants import shutdown_pool as shutdown_image_pool
+from utils.common.upload_gc import run_periodically as run_upload_gc
 
 # 로깅 필터: 로그에 request_id 추가
 class RequestIDFilter(logging.Filter):
@@ -40,21 +52,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 트래픽 캡처 설정: 구조화된 액세스 로그를 별도 JSON Lines 파일로 기록 (test/load/replay_access_log.py 입력)
+if settings.access_log_capture_path:
+    capture_handler = logging.FileHandler(settings.access_log_capture_path, encoding="utf-8")
+    capture_handler.setFormatter(logging.Formatter("%(message)s"))
+    capture_logger = logging.getLogger("access_capture")
+    capture_logger.addHandler(capture_handler)
+    capture_logger.setLevel(logging.INFO)
+    capture_logger.propagate = False
+
+async def _warm_up(app: FastAPI) -> None:
+    """
+    미리 연 커넥션 확인 + 자주 쓰는 조회 실행 (완료 전에는 /health/ready가 503)
+    - 실패해도 서버는 그대로 동작 (readiness는 DB 연결을 따로 확인)
+    """
+    started = time.monotonic()
+    try:
+        await warm_pool()
+        if settings.startup_warm_queries:
+            from routers.post_router import warm_feed
+            await warm_feed()
+    except Exception:
+        logger.exception("Warm-up failed")
+    app.state.warmed_up = True
+    logger.info(f"Warm-up finished in {time.monotonic() - started:.2f}s")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.warmed_up = False
+    await init_pool()
+    background_tasks = [asyncio.create_task(_warm_up(app))]
+    if settings.upload_gc_interval > 0:
+        background_tasks.append(asyncio.create_task(run_upload_gc(settings.upload_gc_interval)))
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        await close_pool()
+        shutdown_image_pool()
+
+
 app = FastAPI(
     title="AWS AI School 2기 Backend",
     description="FastAPI 기반 커뮤니티 백엔드 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
-@app.on_event("startup")
-async def startup_event():
-    await init_pool()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    await close_pool()
-
 # 정적 파일 서빙
 UPLOAD_DIR = "public"
 if not os.path.exists(UPLOAD_DIR):
@@ -62,11 +108,22 @@ if not os.path.exists(UPLOAD_DIR):
     os.makedirs(os.path.join(UPLOAD_DIR, "image/post"))
     os.makedirs(os.path.join(UPLOAD_DIR, "image/profile"))
 
-app.mount("/public", StaticFiles(directory=UPLOAD_DIR), name="public")
+# .br/.gz 사이드카가 있으면 우선 전송 (생성: python -m utils.common.static_files public)
+app.mount("/public", PrecompressedStaticFiles(directory=UPLOAD_DIR), name="public")
 
-# 미들웨어 등록 (LIFO 순서로 실행됨: RequestID -> AccessLog -> CORS -> Session -> Auth -> App)
+# 미들웨어 등록 (LIFO 순서로 실행됨: RequestID -> AccessLog -> Compression -> CORS -> Deadline -> BodyLimit -> Admission -> ReadRouting -> Session -> Auth -> RateLimit -> App)
+# Deadline: 수락 대기 중 연결이 끊긴 요청도 취소하도록 Admission 바깥에 위치
+# BodyLimit: 큰 업로드를 수락 자리/세션 조회 전에 거절하되, 본문 수신 중 초과는 앱의 예외 핸들러가 처리하도록 Deadline 안쪽에 위치
+# Admission: 세션 조회(DB)보다 먼저 수락 여부를 결정하고, 거절 응답에도 CORS 헤더가 붙도록 CORS 안쪽에 위치
+# ReadRouting: 세션 조회/갱신(DB)도 조회 라우팅과 쓰기 표시 대상에 포함되도록 Session 바깥에 위치
+# RateLimit: 로그인한 사용자는 사용자 ID로 식별하도록 Auth 안쪽에 위치
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(AuthMiddleware)
 app.add_middleware(DBSessionMiddleware)
+app.add_middleware(ReadRoutingMiddleware)
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(BodyLimitMiddleware)
+app.add_middleware(DeadlineMiddleware)
 app.add_middleware(CORSMiddleware,
                    allow_origins=[
                        "http://localhost:5500", 
@@ -77,6 +134,7 @@ app.add_middleware(CORSMiddleware,
                    allow_credentials=True,
                    allow_methods=["*"],
                    allow_headers=["*"])
+app.add_middleware(CompressionMiddleware)
 app.add_middleware(AccessLogMiddleware)
 app.add_middleware(RequestIDMiddleware)
 
@@ -88,6 +146,15 @@ async def health_check():
     logger.info("Health check endpoint called")
     return StandardResponse.success(SuccessCode.SUCCESS, {"status": "healthy"})
 
+@app.get("/health/ready")
+async def readiness_check():
+    """트래픽을 받을 준비 여부 (warm-up 완료 + DB 연결 가능, 아니면 503)"""
+    if not getattr(app.state, "warmed_up", False):
+        raise APIError(ErrorCode.SERVICE_UNAVAILABLE, {"status": "warming_up"}, message="서버를 준비하고 있습니다.")
+    if not await db_ping():
+        raise APIError(ErrorCode.SERVICE_UNAVAILABLE, {"status": "db_unavailable"}, message="DB에 연결할 수 없습니다.")
+    return StandardResponse.success(SuccessCode.SUCCESS, {"status": "ready"})
+
 # 라우터 등록
 from routers import post_router, comment_router, auth_router, user_router
 app.include_router(post_router)
@@ -2,10 +2,15 @@
 from .user_model import UserModel, user_model
 from .post_model import PostModel, post_model
 from .comment_model import CommentModel, comment_model
+from .version_model import VersionModel, version_model
+from .file_model import FileModel, file_model
+from .records import PostRecord, CommentRecord, UserRecord
 
 __all__ = [
     # Model classes
-    "UserModel", "PostModel", "CommentModel",
+    "UserModel", "PostModel", "CommentModel", "VersionModel", "FileModel",
     # Model instances
-    "user_model", "post_model", "comment_model"
+    "user_model", "post_model", "comment_model", "version_model", "file_model",
+    # Row records
+    "PostRecord", "CommentRecord", "UserRecord"
 ]
\ No newline at end of file
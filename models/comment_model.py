@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional, Union
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.database.db import fetch_one, fetch_all, fetch_one_tuple, fetch_all_tuples, execute
+from utils.database.single_flight import single_flight
+from utils.common.delta_sync import SinceMarker, fetch_cutoff, next_since
+from models.records import CommentRecord
 
 
 class CommentModel:
@@ -10,24 +13,6 @@ class CommentModel:
         """ID 정규화 (문자열로 변환)"""
         return str(idVal)
 
-    def _format_datetime(self, value) -> Optional[str]:
-        if not value:
-            return None
-        return value.isoformat()
-
-    def _row_to_comment(self, row: Optional[Dict]) -> Optional[Dict]:
-        if not row:
-            return None
-        return {
-            "commentId": row["comment_id"],
-            "postId": row["post_id"],
-            "userId": row["user_id"],
-            "userNickname": row.get("user_nickname"),
-            "content": row["content"],
-            "createdAt": self._format_datetime(row.get("created_at")),
-            "updatedAt": self._format_datetime(row.get("updated_at")),
-        }
-
     async def clear(self):
         """저장소 초기화 (테스트용)"""
         await execute("DELETE FROM comments")
@@ -42,7 +27,7 @@ class CommentModel:
         userId: Union[str, any],
         userNickname: str,
         content: str,
-    ) -> Dict:
+    ) -> Optional[CommentRecord]:
         """댓글 생성"""
         commentId = self.getNextCommentId()
         postIdStr = self._normalizeId(postId)
@@ -58,13 +43,14 @@ class CommentModel:
 
         comment = await self.getCommentById(commentId)
         if comment:
-            comment["userNickname"] = userNickname
+            comment.userNickname = userNickname
         return comment
 
-    async def getCommentsByPost(self, postId: Union[str, any]) -> List[Dict]:
+    @single_flight
+    async def getCommentsByPost(self, postId: Union[str, any]) -> List[CommentRecord]:
         """특정 게시글의 모든 댓글 조회 (최신순)"""
         postIdStr = self._normalizeId(postId)
-        rows = await fetch_all(
+        rows = await fetch_all_tuples(
             """
             SELECT
                 c.comment_id,
@@ -81,12 +67,50 @@ class CommentModel:
             """,
             (postIdStr,),
         )
-        return [self._row_to_comment(row) for row in rows]
+        return [CommentRecord(*row) for row in rows]
 
-    async def getCommentById(self, commentId: Union[str, any]) -> Optional[Dict]:
+    async def getCommentChanges(
+        self, postId: Union[str, any], since: SinceMarker, limit: int = 100
+    ) -> Dict[str, Union[List[CommentRecord], List[str], str, bool]]:
+        """특정 게시글에서 since 이후 작성/수정/삭제된 댓글 (변경 순, 삭제된 댓글은 ID만)"""
+        postIdStr = self._normalizeId(postId)
+        cutoff = await fetch_cutoff()
+        condition, params = since.where("c.changed_at", "c.comment_id")
+        rows = await fetch_all_tuples(
+            f"""
+            SELECT
+                c.comment_id,
+                c.post_id,
+                c.user_id,
+                u.nickname AS user_nickname,
+                c.content,
+                c.created_at,
+                c.updated_at,
+                c.changed_at,
+                c.deleted_at IS NOT NULL AS is_deleted
+            FROM comments c
+            LEFT JOIN users u ON u.user_id = c.user_id
+            WHERE c.post_id = %s AND {condition}
+            ORDER BY c.changed_at ASC, c.comment_id ASC
+            LIMIT %s
+            """,
+            [postIdStr] + params + [limit + 1],
+        )
+
+        hasMore = len(rows) > limit
+        rows = rows[:limit]
+        last = rows[-1] if rows else None
+        return {
+            "comments": [CommentRecord(*row[:7]) for row in rows if not row[8]],
+            "deletedIds": [row[0] for row in rows if row[8]],
+            "nextSince": next_since(cutoff, last and last[7], last and last[0], hasMore),
+            "hasMore": hasMore,
+        }
+
+    async def getCommentById(self, commentId: Union[str, any]) -> Optional[CommentRecord]:
         """ID로 댓글 조회"""
         commentIdStr = self._normalizeId(commentId)
-        row = await fetch_one(
+        row = await fetch_one_tuple(
             """
             SELECT
                 c.comment_id,
@@ -102,9 +126,9 @@ class CommentModel:
             """,
             (commentIdStr,),
         )
-        return self._row_to_comment(row)
+        return CommentRecord.from_row(row)
 
-    async def updateComment(self, commentId: Union[str, any], content: str) -> Optional[Dict]:
+    async def updateComment(self, commentId: Union[str, any], content: str) -> Optional[CommentRecord]:
         """댓글 수정"""
         commentIdStr = self._normalizeId(commentId)
         await execute(
@@ -126,10 +150,10 @@ class CommentModel:
         )
         return affected > 0
 
-    async def getCommentsByUser(self, userId: Union[str, any]) -> List[Dict]:
+    async def getCommentsByUser(self, userId: Union[str, any]) -> List[CommentRecord]:
         """특정 사용자의 모든 댓글 조회"""
         userIdStr = self._normalizeId(userId)
-        rows = await fetch_all(
+        rows = await fetch_all_tuples(
             """
             SELECT
                 c.comment_id,
@@ -146,7 +170,7 @@ class CommentModel:
             """,
             (userIdStr,),
         )
-        return [self._row_to_comment(row) for row in rows]
+        return [CommentRecord(*row) for row in rows]
 
     async def getCommentsCountByPost(self, postId: Union[str, any]) -> int:
         """특정 게시글의 댓글 수 조회"""
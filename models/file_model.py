@@ -0,0 +1,30 @@
+from typing import Iterable, Set
+from utils.database.db import fetch_all_tuples
+
+
+class FileModel:
+    """
+    업로드 파일 Model
+    - 업로드 파일은 내용 해시로 저장되므로 같은 파일 URL을 여러 게시글/프로필이 공유
+    - 사용 여부는 게시글/프로필 테이블에서 직접 확인 (getReferencedUrls, upload_gc에서 사용)
+    """
+
+    async def getReferencedUrls(self, urls: Iterable[str]) -> Set[str]:
+        """주어진 URL 중 게시글/프로필에서 사용 중인 URL (삭제된 게시글/사용자는 제외)"""
+        urls = list(urls)
+        if not urls:
+            return set()
+        placeholders = ", ".join(["%s"] * len(urls))
+        rows = await fetch_all_tuples(
+            f"""
+            SELECT post_image_url FROM posts WHERE post_image_url IN ({placeholders}) AND deleted_at IS NULL
+            UNION
+            SELECT profile_image_url FROM users WHERE profile_image_url IN ({placeholders}) AND deleted_at IS NULL
+            """,
+            urls + urls,
+        )
+        return {row[0] for row in rows}
+
+
+# Model 인스턴스 생성
+file_model = FileModel()
@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional, Union
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.database.db import fetch_one, fetch_all, fetch_one_tuple, fetch_all_tuples, execute
+from utils.database.single_flight import single_flight
+from utils.common.delta_sync import SinceMarker, fetch_cutoff, next_since
+from models.records import PostRecord
 
 
 class PostModel:
@@ -10,29 +13,6 @@ class PostModel:
         """ID 정규화 (문자열로 변환)"""
         return str(idVal)
 
-    def _format_datetime(self, value) -> Optional[str]:
-        if not value:
-            return None
-        return value.isoformat()
-
-    def _row_to_post(self, row: Optional[Dict]) -> Optional[Dict]:
-        if not row:
-            return None
-        return {
-            "postId": row["post_id"],
-            "title": row["title"],
-            "content": row["content"],
-            "authorId": row["author_id"],
-            "authorNickname": row.get("author_nickname"),
-            "authorProfileImageUrl": row.get("author_profile_image_url"),
-            "fileUrl": row.get("post_image_url"),
-            "createdAt": self._format_datetime(row.get("created_at")),
-            "updatedAt": self._format_datetime(row.get("updated_at")),
-            "hits": row.get("hits", 0),
-            "likeCount": row.get("like_count", 0),
-            "commentCount": row.get("comment_count", 0),
-        }
-
     async def clear(self):
         """저장소 초기화 (테스트용)"""
         await execute("DELETE FROM post_likes")
@@ -49,7 +29,7 @@ class PostModel:
         authorId: Union[str, any],
         authorNickname: str,
         fileUrl: Optional[str] = None,
-    ) -> Dict:
+    ) -> Optional[PostRecord]:
         """게시글 생성"""
         postId = self.getNextPostId()
         authorIdStr = self._normalizeId(authorId)
@@ -63,13 +43,12 @@ class PostModel:
         )
 
         post = await self.getPostById(postId)
-        if post:
-            post["authorNickname"] = authorNickname
-        return post
+        return post.replace(authorNickname=authorNickname) if post else None
 
-    async def getPosts(self, limit: int = 10, offset: int = 0) -> Dict[str, Union[List[Dict], int]]:
+    @single_flight
+    async def getPosts(self, limit: int = 10, offset: int = 0) -> Dict[str, Union[List[PostRecord], int]]:
         """게시글 목록 조회 (페이징 지원)"""
-        rows = await fetch_all(
+        rows = await fetch_all_tuples(
             """
             SELECT
                 p.post_id,
@@ -110,14 +89,70 @@ class PostModel:
         totalCount = total_row["total"] if total_row else 0
 
         return {
-            "posts": [self._row_to_post(row) for row in rows],
+            "posts": [PostRecord(*row) for row in rows],
             "totalCount": totalCount,
         }
 
-    async def getPostById(self, postId: Union[str, any]) -> Optional[Dict]:
+    async def getPostChanges(self, since: SinceMarker, limit: int = 100) -> Dict[str, Union[List[PostRecord], List[str], str, bool]]:
+        """since 이후 작성/수정/삭제된 게시글 (변경 순, 삭제된 게시글은 ID만)"""
+        cutoff = await fetch_cutoff()
+        condition, params = since.where("p.changed_at", "p.post_id")
+        rows = await fetch_all_tuples(
+            f"""
+            SELECT
+                p.post_id,
+                p.user_id AS author_id,
+                u.nickname AS author_nickname,
+                u.profile_image_url AS author_profile_image_url,
+                p.title,
+                p.content,
+                p.post_image_url,
+                p.created_at,
+                p.updated_at,
+                p.hits,
+                p.comment_count,
+                COUNT(pl.user_id) AS like_count,
+                p.changed_at,
+                p.deleted_at IS NOT NULL AS is_deleted
+            FROM posts p
+            LEFT JOIN users u ON u.user_id = p.user_id
+            LEFT JOIN post_likes pl ON pl.post_id = p.post_id
+            WHERE {condition}
+            GROUP BY
+                p.post_id,
+                p.user_id,
+                u.nickname,
+                u.profile_image_url,
+                p.title,
+                p.content,
+                p.post_image_url,
+                p.created_at,
+                p.updated_at,
+                p.hits,
+                p.comment_count,
+                p.changed_at,
+                p.deleted_at
+            ORDER BY p.changed_at ASC, p.post_id ASC
+            LIMIT %s
+            """,
+            params + [limit + 1],
+        )
+
+        hasMore = len(rows) > limit
+        rows = rows[:limit]
+        last = rows[-1] if rows else None
+        return {
+            "posts": [PostRecord(*row[:12]) for row in rows if not row[13]],
+            "deletedIds": [row[0] for row in rows if row[13]],
+            "nextSince": next_since(cutoff, last and last[12], last and last[0], hasMore),
+            "hasMore": hasMore,
+        }
+
+    @single_flight
+    async def getPostById(self, postId: Union[str, any]) -> Optional[PostRecord]:
         """게시글 ID로 조회"""
         postIdStr = self._normalizeId(postId)
-        row = await fetch_one(
+        row = await fetch_one_tuple(
             """
             SELECT
                 p.post_id,
@@ -151,14 +186,19 @@ class PostModel:
             """,
             (postIdStr,),
         )
-        return self._row_to_post(row)
+        return PostRecord.from_row(row)
 
     async def incrementViewCount(self, postId: Union[str, any]) -> bool:
-        """조회수 증가"""
+        """
+        조회수 증가
+        - 조회에 딸린 쓰기이므로 read-your-writes 대상에서 제외
+        - changed_at을 현재 값으로 지정해 자동 갱신(ON UPDATE)을 막음 (조회만 된 게시글이 변경분 동기화에 포함되지 않도록)
+        """
         postIdStr = self._normalizeId(postId)
         affected = await execute(
-            "UPDATE posts SET hits = hits + 1 WHERE post_id = %s AND deleted_at IS NULL",
+            "UPDATE posts SET hits = hits + 1, changed_at = changed_at WHERE post_id = %s AND deleted_at IS NULL",
             (postIdStr,),
+            read_your_writes=False,
         )
         return affected > 0
 
@@ -168,10 +208,10 @@ class PostModel:
         title: str,
         content: str,
         fileUrl: Optional[str] = None,
-    ) -> Optional[Dict]:
+    ) -> Optional[PostRecord]:
         """게시글 수정"""
         postIdStr = self._normalizeId(postId)
-        fields = ["title = %s", "content = %s", "updated_at = NOW()"]
+        fields = ["title = %s", "content = %s", "updated_at = NOW()", "changed_at = CURRENT_TIMESTAMP(6)"]
         params = [title, content]
 
         if fileUrl is not None:
@@ -224,6 +264,12 @@ class PostModel:
                 (postIdStr, userIdStr),
             )
 
+        # 좋아요 수는 post_likes에서 계산하므로 변경분 동기화(since)에 포함되도록 변경 시각 갱신
+        await execute(
+            "UPDATE posts SET changed_at = CURRENT_TIMESTAMP(6) WHERE post_id = %s",
+            (postIdStr,),
+        )
+
         count_row = await fetch_one(
             "SELECT COUNT(*) AS cnt FROM post_likes WHERE post_id = %s",
             (postIdStr,),
@@ -234,7 +280,10 @@ class PostModel:
         """댓글 수 업데이트 (캐시)"""
         postIdStr = self._normalizeId(postId)
         await execute(
-            "UPDATE posts SET comment_count = comment_count + %s WHERE post_id = %s AND deleted_at IS NULL",
+            """
+            UPDATE posts SET comment_count = comment_count + %s, changed_at = CURRENT_TIMESTAMP(6)
+            WHERE post_id = %s AND deleted_at IS NULL
+            """,
             (delta, postIdStr),
         )
         row = await fetch_one(
@@ -0,0 +1,127 @@
+"""
+DB row 레코드
+- 모델은 일반 커서로 tuple row를 조회하고 SELECT 컬럼 순서대로 레코드를 생성 (row마다 dict 2개를 만들지 않음)
+- __slots__로 인스턴스 dict 없이 속성만 저장
+- 컨트롤러는 속성 접근(post.postId)으로 사용
+"""
+
+from typing import Any, Optional, Sequence
+
+
+def _iso(value) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class _Record:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if name != "password")
+        return f"{type(self).__name__}({fields})"
+
+    def replace(self, **changes: Any):
+        """일부 속성만 바꾼 복사본 (single-flight로 공유되는 레코드는 직접 수정하지 않음)"""
+        record = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(record, name, changes.get(name, getattr(self, name)))
+        return record
+
+
+class PostRecord(_Record):
+    """게시글 (작성자 정보와 좋아요 수 포함)"""
+
+    # PostModel SELECT 컬럼 순서와 동일
+    __slots__ = (
+        "postId", "authorId", "authorNickname", "authorProfileImageUrl", "title", "content",
+        "fileUrl", "createdAt", "updatedAt", "hits", "commentCount", "likeCount",
+    )
+
+    def __init__(
+        self,
+        postId: str,
+        authorId: str,
+        authorNickname: Optional[str],
+        authorProfileImageUrl: Optional[str],
+        title: str,
+        content: str,
+        fileUrl: Optional[str],
+        createdAt: Any,
+        updatedAt: Any,
+        hits: int,
+        commentCount: int,
+        likeCount: int,
+    ):
+        self.postId = postId
+        self.authorId = authorId
+        self.authorNickname = authorNickname
+        self.authorProfileImageUrl = authorProfileImageUrl
+        self.title = title
+        self.content = content
+        self.fileUrl = fileUrl
+        self.createdAt = _iso(createdAt)
+        self.updatedAt = _iso(updatedAt)
+        self.hits = hits
+        self.commentCount = commentCount
+        self.likeCount = likeCount
+
+    @classmethod
+    def from_row(cls, row: Optional[Sequence]) -> Optional["PostRecord"]:
+        return cls(*row) if row else None
+
+
+class CommentRecord(_Record):
+    """댓글 (작성자 닉네임 포함)"""
+
+    # CommentModel SELECT 컬럼 순서와 동일
+    __slots__ = ("commentId", "postId", "userId", "userNickname", "content", "createdAt", "updatedAt")
+
+    def __init__(
+        self,
+        commentId: str,
+        postId: str,
+        userId: str,
+        userNickname: Optional[str],
+        content: str,
+        createdAt: Any,
+        updatedAt: Any,
+    ):
+        self.commentId = commentId
+        self.postId = postId
+        self.userId = userId
+        self.userNickname = userNickname
+        self.content = content
+        self.createdAt = _iso(createdAt)
+        self.updatedAt = _iso(updatedAt)
+
+    @classmethod
+    def from_row(cls, row: Optional[Sequence]) -> Optional["CommentRecord"]:
+        return cls(*row) if row else None
+
+
+class UserRecord(_Record):
+    """사용자 (password는 bcrypt 해시, 응답에는 UserResponse 필드만 노출)"""
+
+    # UserModel SELECT 컬럼 순서와 동일
+    __slots__ = ("userId", "email", "password", "nickname", "profileImageUrl", "createdAt", "updatedAt")
+
+    def __init__(
+        self,
+        userId: str,
+        email: str,
+        password: str,
+        nickname: str,
+        profileImageUrl: Optional[str],
+        createdAt: Any,
+        updatedAt: Any,
+    ):
+        self.userId = userId
+        self.email = email
+        self.password = password
+        self.nickname = nickname
+        self.profileImageUrl = profileImageUrl
+        self.createdAt = _iso(createdAt)
+        self.updatedAt = _iso(updatedAt)
+
+    @classmethod
+    def from_row(cls, row: Optional[Sequence]) -> Optional["UserRecord"]:
+        return cls(*row) if row else None
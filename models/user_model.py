@@ -1,7 +1,8 @@
 from typing import Dict, Optional, List, Union
 import bcrypt
 from utils.common.id_utils import generate_id
-from utils.database.db import fetch_one, fetch_all, execute
+from utils.database.db import fetch_one, fetch_all, fetch_one_tuple, fetch_all_tuples, execute
+from models.records import UserRecord
 
 
 class UserModel:
@@ -11,24 +12,6 @@ class UserModel:
         """ID 정규화 (문자열로 변환)"""
         return str(idVal)
 
-    def _format_datetime(self, value) -> Optional[str]:
-        if not value:
-            return None
-        return value.isoformat()
-
-    def _row_to_user(self, row: Optional[Dict]) -> Optional[Dict]:
-        if not row:
-            return None
-        return {
-            "userId": row["user_id"],
-            "email": row["email"],
-            "password": row["password"],
-            "nickname": row["nickname"],
-            "profileImageUrl": row.get("profile_image_url"),
-            "createdAt": self._format_datetime(row.get("created_at")),
-            "updatedAt": self._format_datetime(row.get("updated_at")),
-        }
-
     def hashPassword(self, password: str) -> str:
         """비밀번호 해싱 (bcrypt 직접 사용)"""
         salt = bcrypt.gensalt()
@@ -49,7 +32,7 @@ class UserModel:
         """다음 사용자 ID 생성 (ULID)"""
         return generate_id()
 
-    async def createUser(self, email: str, password: str, nickname: str, profileImageUrl: Optional[str] = None) -> Dict:
+    async def createUser(self, email: str, password: str, nickname: str, profileImageUrl: Optional[str] = None) -> Optional[UserRecord]:
         """사용자 생성"""
         userId = self.getNextUserId()
         hashedPassword = self.hashPassword(password)
@@ -64,10 +47,10 @@ class UserModel:
 
         return await self.getUserById(userId)
 
-    async def getUserById(self, userId: Union[str, any]) -> Optional[Dict]:
+    async def getUserById(self, userId: Union[str, any]) -> Optional[UserRecord]:
         """ID로 사용자 조회"""
         userIdStr = self._normalizeId(userId)
-        row = await fetch_one(
+        row = await fetch_one_tuple(
             """
             SELECT user_id, email, password, nickname, profile_image_url, created_at, updated_at
             FROM users
@@ -75,11 +58,11 @@ class UserModel:
             """,
             (userIdStr,),
         )
-        return self._row_to_user(row)
+        return UserRecord.from_row(row)
 
-    async def getUserByEmail(self, email: str) -> Optional[Dict]:
+    async def getUserByEmail(self, email: str) -> Optional[UserRecord]:
         """이메일로 사용자 조회"""
-        row = await fetch_one(
+        row = await fetch_one_tuple(
             """
             SELECT user_id, email, password, nickname, profile_image_url, created_at, updated_at
             FROM users
@@ -87,7 +70,7 @@ class UserModel:
             """,
             (email,),
         )
-        return self._row_to_user(row)
+        return UserRecord.from_row(row)
 
     async def emailExists(self, email: str) -> bool:
         """이메일 중복 체크"""
@@ -105,7 +88,7 @@ class UserModel:
         )
         return row is not None
 
-    async def updateUser(self, userId: Union[str, any], updateData: Dict) -> Optional[Dict]:
+    async def updateUser(self, userId: Union[str, any], updateData: Dict) -> Optional[UserRecord]:
         """사용자 정보 수정"""
         userIdStr = self._normalizeId(userId)
         fields = []
@@ -146,21 +129,21 @@ class UserModel:
         )
         return affected > 0
 
-    async def getAllUsers(self) -> List[Dict]:
+    async def getAllUsers(self) -> List[UserRecord]:
         """모든 사용자 조회"""
-        rows = await fetch_all(
+        rows = await fetch_all_tuples(
             """
             SELECT user_id, email, password, nickname, profile_image_url, created_at, updated_at
             FROM users
             WHERE deleted_at IS NULL
             """
         )
-        return [self._row_to_user(row) for row in rows]
+        return [UserRecord(*row) for row in rows]
 
-    async def authenticateUser(self, email: str, password: str) -> Optional[Dict]:
+    async def authenticateUser(self, email: str, password: str) -> Optional[UserRecord]:
         """사용자 인증"""
         user = await self.getUserByEmail(email)
-        if user and self.verifyPassword(password, user["password"]):
+        if user and self.verifyPassword(password, user.password):
             return user
         return None
 
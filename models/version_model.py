@@ -0,0 +1,46 @@
+from typing import Dict
+from utils.database.db import fetch_all_tuples, execute
+
+
+class VersionModel:
+    """
+    리소스 버전 카운터 Model (ETag 계산용)
+    - 쓰기 시 bump로 관련 키의 버전을 1 증가
+    - 조회 시 PK 조회 한 번으로 여러 키의 버전을 가져와 무거운 목록/상세 쿼리 없이 변경 여부 판단
+    """
+
+    POSTS = "posts"
+    USERS = "users"
+
+    def post(self, postId: str) -> str:
+        return f"post:{postId}"
+
+    def comments(self, postId: str) -> str:
+        return f"comments:{postId}"
+
+    async def getVersions(self, *keys: str) -> Dict[str, int]:
+        """키별 현재 버전 조회 (한 번도 증가하지 않은 키는 0)"""
+        placeholders = ", ".join(["%s"] * len(keys))
+        rows = await fetch_all_tuples(
+            f"SELECT resource_key, version FROM resource_versions WHERE resource_key IN ({placeholders})",
+            keys,
+        )
+        versions = {key: 0 for key in keys}
+        versions.update(rows)
+        return versions
+
+    async def bump(self, *keys: str, readYourWrites: bool = True) -> None:
+        """키별 버전 1 증가 (없으면 생성, readYourWrites=False면 이후 조회를 primary로 보내지 않음)"""
+        placeholders = ", ".join(["(%s, 1)"] * len(keys))
+        await execute(
+            f"""
+            INSERT INTO resource_versions (resource_key, version) VALUES {placeholders}
+            ON DUPLICATE KEY UPDATE version = version + 1
+            """,
+            keys,
+            read_your_writes=readYourWrites,
+        )
+
+
+# Model 인스턴스 생성
+version_model = VersionModel()
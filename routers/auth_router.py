@@ -5,6 +5,8 @@ from utils.errors.error_codes import SuccessCode
 from controllers.auth_controller import auth_controller
 from schemas import SignupRequest, LoginRequest, UserResponse, EmailAvailabilityResponse, NicknameAvailabilityResponse, UserProfileImageResponse, StandardResponse as StandardResponseSchema
 from utils.common.file_utils import save_upload_file
+from utils.common.image_variants import variant_urls
+from models.records import UserRecord
 from utils.middleware.auth_middleware import get_current_user
 
 router = APIRouter(prefix="/v1/auth", tags=["인증"])
@@ -32,7 +34,7 @@ async def logout(request: Request):
 
 
 @router.get("/me", response_model=StandardResponseSchema[UserResponse], status_code=status.HTTP_200_OK)
-async def get_me(user: Dict = Depends(get_current_user)):
+async def get_me(user: UserRecord = Depends(get_current_user)):
     """내 정보 조회 (로그인 상태 검증)"""
     data = await auth_controller.getMe(user)
     return StandardResponse.success(SuccessCode.SUCCESS, data)
@@ -55,5 +57,5 @@ async def check_nickname_availability(nickname: str = Query(..., description="
 @router.post("/profile-image", response_model=StandardResponseSchema[UserProfileImageResponse], status_code=status.HTTP_201_CREATED)
 async def upload_signup_profile_image(profileImage: UploadFile = File(...)):
     """회원가입용 프로필 이미지 업로드 (인증 불필요)"""
-    fileUrl = save_upload_file(profileImage, "profile")
-    return StandardResponse.success(SuccessCode.UPDATED, {"profileImageUrl": fileUrl})
+    fileUrl = await save_upload_file(profileImage, "profile")
+    return StandardResponse.success(SuccessCode.UPDATED, {"profileImageUrl": fileUrl, "profileImageVariants": variant_urls(fileUrl)})
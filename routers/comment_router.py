@@ -1,34 +1,57 @@
-from fastapi import APIRouter, Depends, status
-from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from typing import Dict, List, Optional, Union
 from utils.common.response import StandardResponse
 from utils.errors.error_codes import SuccessCode
 from controllers.comment_controller import comment_controller
-from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, StandardResponse as StandardResponseSchema
+from schemas import CommentCreateRequest, CommentUpdateRequest, CommentResponse, StandardResponse as StandardResponseSchema, DeltaResponse as DeltaResponseSchema
+from models.records import UserRecord
 from utils.middleware.auth_middleware import get_current_user
+from utils.common.etag import is_not_modified, not_modified, set_etag
+from utils.common.delta_sync import parse_since
 
 router = APIRouter(prefix="/v1/posts", tags=["댓글"])
 
 
-@router.get("/{postId}/comments", response_model=StandardResponseSchema[List[CommentResponse]], status_code=status.HTTP_200_OK)
-async def get_comments(postId: str):
+@router.get(
+    "/{postId}/comments",
+    response_model=Union[StandardResponseSchema[List[CommentResponse]], DeltaResponseSchema[List[CommentResponse]]],
+    status_code=status.HTTP_200_OK,
+)
+async def get_comments(
+    request: Request,
+    postId: str,
+    since: Optional[str] = Query(None, description="이전 응답의 nextSince, ISO 8601 시각 또는 ULID (변경분만 조회)"),
+    limit: int = Query(100, ge=1, le=100, description="since 조회 시 최대 항목 수"),
+):
     """
     댓글 목록 조회
+    - If-None-Match가 현재 ETag와 같으면 댓글 조회 없이 304
+    - since 지정 시 그 이후 작성/수정/삭제된 댓글만 변경 순으로 최대 limit개 반환
+      응답의 nextSince를 다음 요청의 since로 사용하고, hasMore면 바로 이어서 조회
     """
+    sinceMarker = parse_since(since)
+    if sinceMarker is not None:
+        data = await comment_controller.getCommentChanges(postId, sinceMarker, limit=limit)
+        return StandardResponse.fast(SuccessCode.SUCCESS, data)
+
+    etag = await comment_controller.getCommentsETag(postId)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
     data = await comment_controller.getCommentsByPost(postId)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return set_etag(StandardResponse.fast(SuccessCode.SUCCESS, data), etag)
 
 
 @router.post("/{postId}/comments", response_model=StandardResponseSchema[Dict], status_code=status.HTTP_201_CREATED)
-async def create_comment(postId: str, req: CommentCreateRequest, user: Dict = Depends(get_current_user)):
+async def create_comment(postId: str, req: CommentCreateRequest, user: UserRecord = Depends(get_current_user)):
     """
     댓글 작성
     """
     data = await comment_controller.createComment(postId, req, user)
-    return StandardResponse.success(SuccessCode.CREATED, {"commentId": data.commentId})
+    return StandardResponse.success(SuccessCode.CREATED, {"commentId": data["commentId"]})
 
 
 @router.patch("/{postId}/comments/{commentId}", response_model=StandardResponseSchema[CommentResponse], status_code=status.HTTP_200_OK)
-async def update_comment(postId: str, commentId: str, req: CommentUpdateRequest, user: Dict = Depends(get_current_user)):
+async def update_comment(postId: str, commentId: str, req: CommentUpdateRequest, user: UserRecord = Depends(get_current_user)):
     """
     댓글 수정
     """
@@ -37,12 +60,12 @@ async def update_comment(postId: str, commentId: str, req: CommentUpdateRequest,
 
 
 @router.delete("/{postId}/comments/{commentId}", response_model=StandardResponseSchema[Dict], status_code=status.HTTP_200_OK)
-async def delete_comment(postId: str, commentId: str, user: Dict = Depends(get_current_user)):
+async def delete_comment(postId: str, commentId: str, user: UserRecord = Depends(get_current_user)):
     """
     댓글 삭제
     """
     deletedComment = await comment_controller.deleteComment(postId, commentId, user)
     return StandardResponse.success(
         SuccessCode.DELETED,
-        {"commentId": deletedComment["commentId"], "message": "댓글이 삭제되었습니다"}
+        {"commentId": deletedComment.commentId, "message": "댓글이 삭제되었습니다"}
     )
@@ -1,47 +1,163 @@
-from fastapi import APIRouter, Depends, status, Query, UploadFile, File
-from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Request, Response, status, Query, UploadFile, File
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Optional, Tuple, Union
+from config import settings
 from utils.common.response import StandardResponse
 from utils.errors.error_codes import SuccessCode
 from controllers.post_controller import post_controller
-from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostImageUploadResponse, StandardResponse as StandardResponseSchema, PaginatedResponse as PaginatedResponseSchema
+from schemas import PostCreateRequest, PostUpdateRequest, PostResponse, PostImageUploadResponse, StandardResponse as StandardResponseSchema, PaginatedResponse as PaginatedResponseSchema, DeltaResponse as DeltaResponseSchema
+from models.records import UserRecord
 from utils.middleware.auth_middleware import get_current_user, get_optional_user
 from utils.common.file_utils import save_upload_file
+from utils.common.image_variants import variant_urls
+from utils.common.etag import is_not_modified, not_modified, set_etag
+from utils.common.response_cache import feed_cache
+from utils.common.event_bus import stream_events, FEED_TOPIC, post_topic
+from utils.common.delta_sync import parse_since
+from utils.database.db import has_replicas, primary_reads, reads_from_primary
 
 router = APIRouter(prefix="/v1/posts", tags=["게시글"])
 
 
-@router.get("", response_model=PaginatedResponseSchema[List[PostResponse]], status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=Union[PaginatedResponseSchema[List[PostResponse]], DeltaResponseSchema[List[PostResponse]]],
+    status_code=status.HTTP_200_OK,
+)
 async def get_posts(
+    request: Request,
     offset: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=100)
+    limit: int = Query(10, ge=1, le=100),
+    since: Optional[str] = Query(None, description="이전 응답의 nextSince, ISO 8601 시각 또는 ULID (변경분만 조회)"),
 ):
     """
     게시글 목록 조회 (페이징 메타데이터 포함)
     - 모든 게시글을 최신순으로 반환
+    - If-None-Match가 현재 ETag와 같으면 목록 조회 없이 304
+    - 앞쪽 페이지는 직렬화된 응답을 캐시 (목록에는 사용자별 필드가 없으므로 모든 사용자가 공유)
+      replica 사용 중 primary로 조회해야 하는 요청(read-your-writes)은 캐시를 거치지 않음
+    - since 지정 시 그 이후 작성/수정/삭제된 게시글만 변경 순으로 최대 limit개 반환 (offset 무시)
+      응답의 nextSince를 다음 요청의 since로 사용하고, hasMore면 바로 이어서 조회
     - 인증 불필요
     """
+    sinceMarker = parse_since(since)
+    if sinceMarker is not None:
+        data = await post_controller.getPostChanges(sinceMarker, limit=limit)
+        return StandardResponse.fast(SuccessCode.SUCCESS, data)
+
+    if _use_feed_cache(offset):
+        cached = await feed_cache.get((offset, limit), lambda: _render_posts_page(limit, offset))
+        if is_not_modified(request, cached.etag):
+            return not_modified(cached.etag)
+        return set_etag(Response(cached.body, media_type="application/json"), cached.etag)
+
+    etag = await post_controller.getPostsETag(limit=limit, offset=offset)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    data = await post_controller.getAllPosts(limit=limit, offset=offset)
+    return set_etag(StandardResponse.fast(SuccessCode.SUCCESS, data), etag)
+
+
+def _use_feed_cache(offset: int) -> bool:
+    """
+    목록 캐시 사용 여부
+    - 방금 쓰기를 한 클라이언트(primary 조회)에는 캐시를 거치지 않고 primary 결과 반환
+      (다른 클라이언트의 요청이 replica에서 읽어 저장한 이전 목록을 받지 않도록)
+    """
+    if not settings.feed_cache_enabled or offset >= settings.feed_cache_max_offset:
+        return False
+    return not (has_replicas() and reads_from_primary())
+
+
+async def _render_posts_page(limit: int, offset: int) -> Tuple[bytes, str]:
+    """
+    목록 캐시 로더 (ETag는 본문 조회 전에 계산)
+    - 무효화 직후(db_read_your_writes_window 이내)에는 replica 지연으로 이전 목록이 캐시되지 않도록 primary에서 조회
+    """
+    if has_replicas() and feed_cache.invalidated_within(settings.db_read_your_writes_window):
+        with primary_reads():
+            return await _load_posts_page(limit, offset)
+    return await _load_posts_page(limit, offset)
+
+
+async def _load_posts_page(limit: int, offset: int) -> Tuple[bytes, str]:
+    etag = await post_controller.getPostsETag(limit=limit, offset=offset)
     data = await post_controller.getAllPosts(limit=limit, offset=offset)
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    return StandardResponse.fast(SuccessCode.SUCCESS, data).body, etag
+
+
+async def warm_feed(limit: int = 10) -> None:
+    """첫 페이지 목록 미리 조회 (서버 시작 warm-up, 목록 캐시를 사용하면 캐시에 저장)"""
+    if settings.feed_cache_enabled:
+        await feed_cache.get((0, limit), lambda: _render_posts_page(limit, 0))
+    else:
+        await _render_posts_page(limit, 0)
+
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # 리버스 프록시(nginx) 버퍼링 비활성화
+}
+
+
+def _event_stream(topic: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_events(topic),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/events", status_code=status.HTTP_200_OK)
+async def stream_feed_events():
+    """
+    게시글 목록 실시간 이벤트 (Server-Sent Events)
+    - post.created(게시글), post.updated(게시글), post.deleted, post.liked(likeCount), post.commented(commentCount)
+    - resync 이벤트를 받으면 목록을 다시 조회한 뒤 재연결 (전송하지 못한 이벤트가 있음)
+    - 인증 불필요
+    """
+    return _event_stream(FEED_TOPIC)
+
+
+@router.get("/{postId}/events", status_code=status.HTTP_200_OK)
+async def stream_post_events(postId: str):
+    """
+    게시글 상세 실시간 이벤트 (Server-Sent Events)
+    - comment.created/comment.updated(댓글), comment.deleted, post.updated(게시글), post.deleted, post.liked(likeCount)
+    - 인증 불필요
+    """
+    await post_controller.getPostById(postId, incHits=False)
+    return _event_stream(post_topic(postId))
 
 
 @router.get("/{postId}", response_model=StandardResponseSchema[PostResponse], status_code=status.HTTP_200_OK)
 async def get_post(
+    request: Request,
     postId: str,
     incHits: bool = Query(True, description="조회수 증가 여부"),
-    user: Optional[Dict] = Depends(get_optional_user),
+    user: Optional[UserRecord] = Depends(get_optional_user),
 ):
     """
     게시글 상세 조회
     - 특정 게시글의 상세 정보 반환
     - incHits=false 시 조회수가 증가하지 않음
+    - incHits=false(폴링) 요청은 ETag 조건부 GET 지원 (조회수가 증가하는 요청은 매번 본문이 달라짐)
     - 인증 불필요
     """
-    data = await post_controller.getPostById(postId, incHits=incHits, current_user_id=(user or {}).get("userId"))
-    return StandardResponse.success(SuccessCode.SUCCESS, data)
+    current_user_id = user.userId if user else None
+    if not incHits:
+        etag = await post_controller.getPostETag(postId, current_user_id=current_user_id)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+        data = await post_controller.getPostById(postId, incHits=False, current_user_id=current_user_id)
+        return set_etag(StandardResponse.fast(SuccessCode.SUCCESS, data), etag)
+
+    data = await post_controller.getPostById(postId, incHits=True, current_user_id=current_user_id)
+    return StandardResponse.fast(SuccessCode.SUCCESS, data)
 
 
 @router.post("", response_model=StandardResponseSchema[PostResponse], status_code=status.HTTP_201_CREATED)
-async def create_post(req: PostCreateRequest, user: Dict = Depends(get_current_user)):
+async def create_post(req: PostCreateRequest, user: UserRecord = Depends(get_current_user)):
     """
     게시글 생성
     - 인증된 사용자만 작성 가능
@@ -51,7 +167,7 @@ async def create_post(req: PostCreateRequest, user: Dict = Depends(get_current_u
 
 
 @router.patch("/{postId}", response_model=StandardResponseSchema[PostResponse], status_code=status.HTTP_200_OK)
-async def update_post(postId: str, req: PostUpdateRequest, user: Dict = Depends(get_current_user)):
+async def update_post(postId: str, req: PostUpdateRequest, user: UserRecord = Depends(get_current_user)):
     """
     게시글 수정
     - 작성자만 수정 가능
@@ -61,7 +177,7 @@ async def update_post(postId: str, req: PostUpdateRequest, user: Dict = Depends(
 
 
 @router.delete("/{postId}", response_model=StandardResponseSchema[Dict], status_code=status.HTTP_200_OK)
-async def delete_post(postId: str, user: Dict = Depends(get_current_user)):
+async def delete_post(postId: str, user: UserRecord = Depends(get_current_user)):
     """
     게시글 삭제
     - 작성자만 삭제 가능
@@ -69,24 +185,24 @@ async def delete_post(postId: str, user: Dict = Depends(get_current_user)):
     deletedPost = await post_controller.deletePost(postId, user)
     return StandardResponse.success(
         SuccessCode.DELETED, 
-        {"postId": deletedPost["postId"], "message": "게시글이 삭제되었습니다"}
+        {"postId": deletedPost.postId, "message": "게시글이 삭제되었습니다"}
     )
 
 
 @router.post("/image", response_model=StandardResponseSchema[PostImageUploadResponse], status_code=status.HTTP_201_CREATED)
-async def upload_post_image(postFile: UploadFile = File(...), user: Dict = Depends(get_current_user)):
+async def upload_post_image(postFile: UploadFile = File(...), user: UserRecord = Depends(get_current_user)):
     """
     게시글 이미지 업로드
-    - 실제 로컬 폴더에 이미지 저장 및 URL 반환
+    - 실제 로컬 폴더에 이미지 저장 및 URL 반환 (full 파생본 URL과 thumbnail/card/full 파생본 URL)
     """
-    fileUrl = save_upload_file(postFile, "post")
-    return StandardResponse.success(SuccessCode.UPDATED, {"postFileUrl": fileUrl})
+    fileUrl = await save_upload_file(postFile, "post")
+    return StandardResponse.success(SuccessCode.UPDATED, {"postFileUrl": fileUrl, "postFileVariants": variant_urls(fileUrl)})
 
 
 @router.post("/{postId}/likes", response_model=StandardResponseSchema[Dict], status_code=status.HTTP_201_CREATED)
-async def toggle_post_like(postId: str, user: Dict = Depends(get_current_user)):
+async def toggle_post_like(postId: str, user: UserRecord = Depends(get_current_user)):
     """
     게시글 좋아요 토글
     """
-    data = await post_controller.togglePostLike(postId, user["userId"])
+    data = await post_controller.togglePostLike(postId, user.userId)
     return StandardResponse.success(SuccessCode.UPDATED, data)
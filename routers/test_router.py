@@ -1,12 +1,21 @@
 from fastapi import APIRouter, status
-from utils.test.test_utils import seed_database
+from utils.test.test_utils import reseed_database, restore_database, snapshot_database
 from utils.common.response import StandardResponse
 from utils.errors.error_codes import SuccessCode
 
 router = APIRouter(prefix="/v1/test", tags=["테스트 유틸리티"])
 
 @router.post("/reset", status_code=status.HTTP_200_OK)
-def reset_database():
-    """인메모리 데이터베이스 초기화 및 시드 데이터 삽입 (테스트용)"""
-    data = seed_database()
+async def reset_database(reseed: bool = False):
+    """데이터베이스를 시드 스냅샷 상태로 복원 (테스트용, reseed=true면 다시 시드 후 스냅샷)"""
+    if reseed:
+        data = await reseed_database()
+    else:
+        data = await restore_database()
     return StandardResponse.success(SuccessCode.SUCCESS, data)
+
+@router.post("/snapshot", status_code=status.HTTP_200_OK)
+async def take_snapshot():
+    """현재 데이터베이스 상태를 이후 /reset의 복원 지점으로 저장 (테스트용)"""
+    data = await snapshot_database()
+    return StandardResponse.success(SuccessCode.SUCCESS, {"tables": data})
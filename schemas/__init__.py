@@ -1,4 +1,4 @@
-from .base_schema import BaseSchema, StandardResponse, PaginationMeta, PaginatedData, PaginatedResponse
+from .base_schema import BaseSchema, ImageVariants, StandardResponse, PaginationMeta, PaginatedData, PaginatedResponse, DeltaData, DeltaResponse
 from .auth_schema import SignupRequest, LoginRequest, EmailAvailabilityResponse, NicknameAvailabilityResponse
 from .user_schema import UserUpdateRequest, PasswordChangeRequest, UserProfileImageResponse, UserResponse
 from .post_schema import PostCreateRequest, PostUpdateRequest, PostResponse, PostAuthor, PostFile, PostImageUploadResponse
@@ -7,7 +7,7 @@ from .error_schema import FieldError, ValidationErrorDetail, ResourceError
 
 __all__ = [
     # Base
-    "BaseSchema", "StandardResponse", "PaginationMeta", "PaginatedData", "PaginatedResponse",
+    "BaseSchema", "ImageVariants", "StandardResponse", "PaginationMeta", "PaginatedData", "PaginatedResponse", "DeltaData", "DeltaResponse",
     # Auth
     "SignupRequest", "LoginRequest", "EmailAvailabilityResponse", "NicknameAvailabilityResponse",
     # User
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pydantic import BaseModel, ConfigDict
-from typing import Generic, TypeVar, Optional, Any, Dict
+from typing import Generic, TypeVar, Optional, Any, Dict, List, Tuple
+from config import settings
 
 T = TypeVar("T")
 
@@ -10,6 +12,32 @@ class BaseSchema(BaseModel):
         populate_by_name=True
     )
 
+    @classmethod
+    def from_trusted(cls, source: Any = None, **data: Any) -> Dict[str, Any]:
+        """
+        우리 테이블에서 읽어 모델 계층이 이미 정규화한 데이터를 스키마 모양의 dict로 변환 (검증/객체 생성 생략)
+        - source: 같은 이름의 속성을 가진 레코드(models.records), 또는 키워드 인자로 필드 전달
+        - 스키마 필드만 필드 순서대로 포함 (password 등 스키마 외 값은 제외, 누락 필드는 기본값)
+        - 사용자 입력에는 사용 금지
+        - debug 또는 validate_trusted_data 설정 시 스키마 검증을 수행해 DB/스키마 불일치를 조기에 검출
+        """
+        if source is not None:
+            shaped = {name: getattr(source, name, default) for name, default in _trusted_fields(cls)}
+        else:
+            shaped = {name: data.get(name, default) for name, default in _trusted_fields(cls)}
+        if settings.debug or settings.validate_trusted_data:
+            cls.model_validate(shaped)
+        return shaped
+
+
+@lru_cache(maxsize=None)
+def _trusted_fields(cls: type) -> Tuple[Tuple[str, Any], ...]:
+    """스키마별 (필드명, 기본값) 목록 (필수 필드는 None)"""
+    return tuple(
+        (name, None if field.is_required() else field.get_default(call_default_factory=True))
+        for name, field in cls.model_fields.items()
+    )
+
 class StandardResponse(BaseSchema, Generic[T]):
     """모든 API 응답의 표준 Pydantic 모델"""
     code: str
@@ -17,6 +45,12 @@ class StandardResponse(BaseSchema, Generic[T]):
     data: Optional[T] = None
     details: Optional[Dict[str, Any]] = None
 
+class ImageVariants(BaseSchema):
+    """업로드 이미지 파생본 URL (utils.common.image_variants)"""
+    thumbnail: str
+    card: str
+    full: str
+
 class PaginationMeta(BaseSchema):
     """페이징 메타데이터"""
     totalCount: int
@@ -34,3 +68,14 @@ class PaginatedData(BaseSchema, Generic[T]):
 class PaginatedResponse(StandardResponse, Generic[T]):
     """페이징이 적용된 표준 API 응답"""
     data: Optional[PaginatedData[T]] = None
+
+class DeltaData(BaseSchema, Generic[T]):
+    """변경분 동기화(since) 데이터 (items: 작성/수정된 항목, deletedIds: 삭제된 항목 ID)"""
+    items: T
+    deletedIds: List[str]
+    nextSince: str
+    hasMore: bool
+
+class DeltaResponse(StandardResponse, Generic[T]):
+    """변경분 동기화(since)가 적용된 표준 API 응답"""
+    data: Optional[DeltaData[T]] = None
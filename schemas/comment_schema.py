@@ -1,6 +1,6 @@
 from pydantic import Field
 from typing import Optional
-from .base_schema import BaseSchema
+from .base_schema import BaseSchema, ImageVariants
 
 class CommentCreateRequest(BaseSchema):
     content: str = Field(..., min_length=1)
@@ -12,6 +12,7 @@ class CommentAuthor(BaseSchema):
     userId: str
     nickname: str
     profileImageUrl: Optional[str] = None
+    profileImageVariants: Optional[ImageVariants] = None
 
 class CommentResponse(BaseSchema):
     commentId: str
@@ -1,6 +1,6 @@
 from pydantic import Field
 from typing import Optional
-from .base_schema import BaseSchema
+from .base_schema import BaseSchema, ImageVariants
 
 class PostCreateRequest(BaseSchema):
     title: str = Field(..., min_length=1, max_length=100)
@@ -16,10 +16,12 @@ class PostAuthor(BaseSchema):
     userId: str
     nickname: str
     profileImageUrl: Optional[str] = None
+    profileImageVariants: Optional[ImageVariants] = None
 
 class PostFile(BaseSchema):
     fileId: str
     fileUrl: str
+    variants: Optional[ImageVariants] = None
 
 class PostResponse(BaseSchema):
     postId: str
@@ -36,3 +38,4 @@ class PostResponse(BaseSchema):
 
 class PostImageUploadResponse(BaseSchema):
     postFileUrl: str
+    postFileVariants: Optional[ImageVariants] = None
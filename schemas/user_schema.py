@@ -1,6 +1,6 @@
 from pydantic import Field, EmailStr
 from typing import Optional
-from .base_schema import BaseSchema
+from .base_schema import BaseSchema, ImageVariants
 
 class UserUpdateRequest(BaseSchema):
     nickname: str = Field(..., min_length=1)
@@ -11,11 +11,13 @@ class PasswordChangeRequest(BaseSchema):
 
 class UserProfileImageResponse(BaseSchema):
     profileImageUrl: str
+    profileImageVariants: Optional[ImageVariants] = None
 
 class UserResponse(BaseSchema):
     userId: str
     email: EmailStr
     nickname: str
     profileImageUrl: Optional[str] = None
+    profileImageVariants: Optional[ImageVariants] = None
     createdAt: str
     updatedAt: Optional[str] = None
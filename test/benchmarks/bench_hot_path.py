@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+요청 처리 핫패스 마이크로 벤치마크 (DB 불필요):
+- PostRecord: DB tuple row -> __slots__ 레코드 변환
+- PostController._formatPost: 응답 스키마 모양의 dict 생성 (from_trusted)
+- StandardResponse.success: 응답 envelope 생성
+- response_model 검증 + 직렬화: FastAPI serialize_response + JSONResponse 렌더링
+- 빠른 응답 경로: StandardResponse.fast (검증 없이 pydantic_core로 1회 직렬화)
+- 미들웨어 체인: main.py 앱 전체 vs 미들웨어 없는 앱 (/health)
+
+각 단계를 합성 데이터로 격리 측정하고, 기준값(baseline) 대비 threshold 이상 느려지면 실패 코드로 종료합니다.
+
+사용 예:
+    python test/benchmarks/bench_hot_path.py --save-baseline     # 현재 결과를 기준값으로 저장
+    python test/benchmarks/bench_hot_path.py --threshold 0.15    # 기준값 대비 15% 이상 느려지면 exit 1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+# 프로젝트 루트를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# 설정 검증을 통과시키기 위한 더미 값 (벤치마크 경로는 DB에 접속하지 않음)
+for key, value in {"SECRET_KEY": "bench", "DB_HOST": "localhost", "DB_USER": "bench", "DB_PASSWORD": "bench", "DB_NAME": "bench"}.items():
+    os.environ.setdefault(key, value)
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from main import app, health_check
+from models.records import PostRecord
+from controllers.post_controller import post_controller
+from schemas import PaginatedData, PaginationMeta
+from utils.common.response import StandardResponse
+from utils.errors.error_codes import SuccessCode
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+PAGE_SIZE = 100
+
+
+def make_rows(count: int = PAGE_SIZE) -> List[Tuple]:
+    """getPosts SELECT 결과와 동일한 형태(컬럼 순서)의 합성 tuple row"""
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        (
+            f"01JBENCH{idx:018d}",
+            f"01JUSER{idx % 37:019d}",
+            f"user{idx % 37}",
+            "/public/image/profile/sample.jpg" if idx % 3 == 0 else None,
+            f"Benchmark title {idx}",
+            "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8,
+            "/public/image/post/sample.jpg" if idx % 2 == 0 else None,
+            base - timedelta(minutes=idx),
+            base if idx % 5 == 0 else None,
+            idx * 7,
+            idx % 11,
+            idx % 13,
+        )
+        for idx in range(count)
+    ]
+
+
+def make_page(formatted) -> PaginatedData:
+    """getAllPosts와 동일한 PaginatedData 구성 (DB 조회 제외)"""
+    return PaginatedData(
+        items=formatted,
+        pagination=PaginationMeta(totalCount=1000, limit=PAGE_SIZE, offset=0, currentPage=1, totalPage=10, hasNext=True),
+    )
+
+
+def _find_route(path: str, method: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods:
+            return route
+    raise LookupError(f"{method} {path} route not found")
+
+
+def build_stages() -> Dict[str, Callable[[], None]]:
+    """단계 이름 -> 1회 실행 함수 (목록 1페이지(100건) 기준)"""
+    loop = asyncio.new_event_loop()
+    rows = make_rows()
+    posts = [PostRecord(*row) for row in rows]
+
+    async def format_page():
+        return [await post_controller._formatPost(post) for post in posts]
+
+    formatted = loop.run_until_complete(format_page())
+    page = make_page(formatted)
+    envelope = StandardResponse.success(SuccessCode.SUCCESS, page)
+    list_field = _find_route("/v1/posts", "GET").response_field
+
+    async def validate_and_render():
+        content = await serialize_response(field=list_field, response_content=envelope)
+        return JSONResponse(content).body
+
+    # 빠른 경로는 response_model 경로와 같은 본문을 만들어야 함
+    fast_body = StandardResponse.fast(SuccessCode.SUCCESS, page).body
+    if json.loads(fast_body) != json.loads(loop.run_until_complete(validate_and_render())):
+        raise AssertionError("StandardResponse.fast body differs from the response_model output")
+
+    full_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    # 미들웨어 없이 동일한 /health 엔드포인트만 가진 앱 (미들웨어 체인 비용 분리용)
+    bare_app = FastAPI()
+    bare_app.add_api_route("/health", health_check, methods=["GET"])
+    bare_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=bare_app), base_url="http://bench")
+
+    return {
+        "post_record[100]": lambda: [PostRecord(*row) for row in rows],
+        "formatPost[100]": lambda: loop.run_until_complete(format_page()),
+        "StandardResponse.success": lambda: StandardResponse.success(SuccessCode.SUCCESS, page),
+        "response_model_validate+render[100]": lambda: loop.run_until_complete(validate_and_render()),
+        "fast_render[100]": lambda: StandardResponse.fast(SuccessCode.SUCCESS, page).body,
+        "health_request_full_stack": lambda: loop.run_until_complete(full_client.get("/health")),
+        "health_request_no_middleware": lambda: loop.run_until_complete(bare_client.get("/health")),
+    }
+
+
+def measure(fn: Callable[[], None], min_time: float, repeat: int) -> float:
+    """1회 실행 시간(µs)의 최솟값 (timeit과 동일하게 min을 사용해 노이즈 제거)"""
+    # 보정: min_time 이상 걸리는 반복 횟수 결정
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= min_time:
+            break
+        number *= 2
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the per-request hot path.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.20, help="허용 성능 저하 비율 (0.20 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="단계별 1라운드 최소 측정 시간(초)")
+    parser.add_argument("--only", help="이름에 해당 문자열이 포함된 단계만 실행")
+    args = parser.parse_args()
+
+    # 벤치마크 중 INFO 로그(backend.log 기록)로 인한 측정 왜곡 방지
+    logging.disable(logging.INFO)
+
+    stages = build_stages()
+    results: Dict[str, float] = {}
+    for name, fn in stages.items():
+        if args.only and args.only not in name:
+            continue
+        results[name] = measure(fn, args.min_time, args.repeat)
+
+    if "health_request_full_stack" in results and "health_request_no_middleware" in results:
+        results["middleware_chain_overhead"] = results["health_request_full_stack"] - results["health_request_no_middleware"]
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    regressions = []
+    print(f"{'stage':<40} {'current':>12} {'baseline':>12} {'delta':>8}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base:
+            delta = (value - base) / base
+            flag = "  REGRESSION" if delta > args.threshold else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:<40} {value:>10.1f}µs {base:>10.1f}µs {delta:>+7.1%}{flag}")
+        else:
+            print(f"{name:<40} {value:>10.1f}µs {'-':>12} {'-':>8}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"\n⚠️  {len(regressions)}개 단계가 기준값 대비 {args.threshold:.0%} 이상 느려졌습니다: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
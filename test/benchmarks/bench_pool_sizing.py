@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+커넥션 풀 크기 자동 조절 벤치마크 (DB 불필요):
+- 고정 크기 풀(db_pool_adaptive=false)과 자동 조절 풀을 같은 부하에서 비교
+- DB는 시뮬레이션: 쿼리 1개에 --query-ms가 걸리고, 동시 실행 쿼리가 --db-cores를 넘으면 그 비율만큼 느려짐
+  (새 커넥션 연결에는 --connect-ms 소요)
+- 부하 시나리오
+  - quiet: 한산한 시간대 / peak: 혼잡 시간대 / quiet_peak_quiet: 한산 → 혼잡 → 한산
+  - --log: test/load/replay_access_log.py와 같은 액세스 로그/캡처의 도착 간격을 --speed 배속으로 재생
+- 요청마다 커넥션 1개로 --queries-per-request개 쿼리 실행, 처리량/지연 시간/503(획득 시간 초과)/최종 크기 출력
+
+사용 예:
+    python test/benchmarks/bench_pool_sizing.py
+    python test/benchmarks/bench_pool_sizing.py --scenario peak --db-cores 32
+    python test/benchmarks/bench_pool_sizing.py --log access_capture.jsonl --speed 20
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, List, Set
+
+# 프로젝트 루트와 리플레이 도구 경로를 path에 추가 (test/benchmarks 내부이므로 두 단계 위로)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "test", "load")):
+    if path not in sys.path:
+        sys.path.append(path)
+
+# 설정 검증을 통과시키기 위한 더미 값 (벤치마크는 DB에 접속하지 않음)
+for key, value in {"SECRET_KEY": "bench", "DB_HOST": "localhost", "DB_USER": "bench", "DB_PASSWORD": "bench", "DB_NAME": "bench"}.items():
+    os.environ.setdefault(key, value)
+
+from config import settings
+from utils.database.adaptive_pool import AdaptivePool
+
+# 시나리오: (구간 길이(초), 초당 요청 수) 목록
+SCENARIOS: Dict[str, List[tuple]] = {
+    "quiet": [(10, 100)],
+    "peak": [(10, 1200)],
+    "quiet_peak_quiet": [(5, 100), (10, 1200), (5, 100)],
+}
+
+
+class SimulatedDatabase:
+    """동시 실행 쿼리가 코어 수를 넘으면 느려지는 DB"""
+
+    def __init__(self, cores: int, query_ms: float, connect_ms: float):
+        self.cores = cores
+        self.query_s = query_ms / 1000
+        self.connect_s = connect_ms / 1000
+        self.running = 0
+        self.connections = 0
+        self.peak_connections = 0
+
+    async def query(self) -> None:
+        self.running += 1
+        try:
+            await asyncio.sleep(self.query_s * max(1.0, self.running / self.cores))
+        finally:
+            self.running -= 1
+
+
+class FakeConnection:
+    def __init__(self, db: SimulatedDatabase):
+        self.db = db
+        self.closed = False
+        db.connections += 1
+        db.peak_connections = max(db.peak_connections, db.connections)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.db.connections -= 1
+
+
+class FakePool:
+    """aiomysql.Pool과 같은 acquire/release 동작 (빈 커넥션이 없으면 maxsize까지 새로 연결)"""
+
+    def __init__(self, db: SimulatedDatabase, minsize: int, maxsize: int, preopen: int):
+        self.db = db
+        self.minsize = minsize
+        self.maxsize = maxsize
+        # 서버 시작 warm-up(warm_pool)처럼 시작 크기만큼 미리 연결
+        self._free: Deque[FakeConnection] = deque(FakeConnection(db) for _ in range(max(minsize, preopen)))
+        self._used: Set[FakeConnection] = set()
+        self._connecting = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def size(self) -> int:
+        return len(self._free) + len(self._used) + self._connecting
+
+    @property
+    def freesize(self) -> int:
+        return len(self._free)
+
+    async def acquire(self) -> FakeConnection:
+        async with self._cond:
+            while True:
+                if self._free:
+                    conn = self._free.popleft()
+                    self._used.add(conn)
+                    return conn
+                if self.size < self.maxsize:
+                    self._connecting += 1
+                    try:
+                        await asyncio.sleep(self.db.connect_s)
+                        conn = FakeConnection(self.db)
+                    finally:
+                        self._connecting -= 1
+                    self._used.add(conn)
+                    return conn
+                await self._cond.wait()
+
+    async def release(self, conn: FakeConnection) -> None:
+        self._used.discard(conn)
+        if conn.closed:
+            return
+        self._free.append(conn)
+        async with self._cond:
+            self._cond.notify()
+
+    def close(self) -> None:
+        for conn in list(self._free) + list(self._used):
+            conn.close()
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def scenario_offsets(phases: List[tuple], seed: int) -> List[float]:
+    """구간별 요청 수에 맞춘 도착 시각 (포아송 도착)"""
+    rng = random.Random(seed)
+    offsets, start = [], 0.0
+    for duration, rate in phases:
+        now = start
+        while True:
+            now += rng.expovariate(rate)
+            if now >= start + duration:
+                break
+            offsets.append(now)
+        start += duration
+    return offsets
+
+
+def log_offsets(paths: List[str], speed: float, max_gap: float) -> List[float]:
+    """액세스 로그 도착 간격 (replay_access_log와 같은 파싱/유휴 구간 압축)"""
+    from replay_access_log import compress_gaps, parse_events
+
+    lines: List[str] = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines.extend(f)
+    events = parse_events(lines)
+    if max_gap > 0:
+        events = compress_gaps(events, max_gap)
+    return [event.offset / speed for event in events]
+
+
+async def run(offsets: List[float], adaptive: bool, args: argparse.Namespace) -> Dict[str, float]:
+    settings.db_pool_adaptive = adaptive
+    db = SimulatedDatabase(args.db_cores, args.query_ms, args.connect_ms)
+    minsize = min(settings.db_pool_min_size, args.pool_size)
+    maxsize = max(settings.db_pool_max_size, args.pool_size)
+    pool = AdaptivePool("bench", FakePool(db, minsize, maxsize, args.pool_size), minsize, maxsize, args.pool_size)
+
+    latencies: List[float] = []
+    timeouts = 0
+
+    async def handle() -> None:
+        nonlocal timeouts
+        started = time.perf_counter()
+        try:
+            conn = await pool.acquire()
+        except asyncio.TimeoutError:
+            timeouts += 1
+            return
+        try:
+            for _ in range(args.queries_per_request):
+                await db.query()
+        finally:
+            await pool.release(conn)
+        latencies.append(time.perf_counter() - started)
+
+    loop = asyncio.get_running_loop()
+    begin = loop.time()
+    tasks = []
+    for offset in offsets:
+        delay = begin + offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(handle()))
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - begin
+
+    return {
+        "requests": len(offsets),
+        "completed": len(latencies),
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "timeouts": timeouts,
+        "final_limit": pool.limit,
+        "final_connections": db.connections,
+        "peak_connections": db.peak_connections,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare adaptive and fixed-size DB pools under simulated load.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append", help="반복 지정 가능 (기본: 전체)")
+    parser.add_argument("--log", nargs="+", help="액세스 로그/캡처 파일 (지정하면 시나리오 대신 사용)")
+    parser.add_argument("--speed", type=float, default=1.0, help="--log 재생 배속")
+    parser.add_argument("--max-gap", type=float, default=5.0, help="--log에서 이 값(초)보다 긴 유휴 구간은 압축")
+    parser.add_argument("--pool-size", type=int, default=settings.db_pool_size, help="시작 크기 (고정 풀은 이 크기 유지)")
+    parser.add_argument("--db-cores", type=int, default=16, help="성능 저하 없이 동시에 실행되는 쿼리 수")
+    parser.add_argument("--query-ms", type=float, default=4.0)
+    parser.add_argument("--connect-ms", type=float, default=20.0)
+    parser.add_argument("--queries-per-request", type=int, default=2)
+    parser.add_argument("--resize-interval", type=float, default=1.0, help="크기 조절 판단 주기 (짧은 벤치마크용, 초)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    settings.db_pool_resize_interval = args.resize_interval
+    # 크기 조절 로그는 출력, 그 외 INFO 로그는 생략
+    logging.basicConfig(level=logging.WARNING, format="  %(message)s")
+    logging.getLogger("db").setLevel(logging.INFO)
+
+    if args.log:
+        workloads = {"replay": log_offsets(args.log, args.speed, args.max_gap)}
+    else:
+        workloads = {name: scenario_offsets(SCENARIOS[name], args.seed) for name in (args.scenario or SCENARIOS)}
+
+    rows = []
+    for name, offsets in workloads.items():
+        for adaptive in (False, True):
+            mode = "adaptive" if adaptive else "fixed"
+            print(f"[{name} / {mode}] {len(offsets)} requests")
+            rows.append((name, mode, asyncio.run(run(offsets, adaptive, args))))
+
+    print(
+        f"\n{'scenario':<18} {'pool':<9} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} "
+        f"{'503':>6} {'limit':>6} {'conns':>6} {'peak':>6}"
+    )
+    for name, mode, r in rows:
+        print(
+            f"{name:<18} {mode:<9} {r['throughput']:>8.1f} {r['p50_ms']:>6.1f}ms {r['p95_ms']:>6.1f}ms "
+            f"{r['p99_ms']:>6.1f}ms {r['timeouts']:>6} {r['final_limit']:>6} {r['final_connections']:>6} "
+            f"{r['peak_connections']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,13 +10,41 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "../2-owen-community-be"
 # 각 테스트별 API 호출 로그를 저장할 전역 변수
 test_call_logs = {}
 
-@pytest.fixture
-def api_client(request):
-    """API 호출 입출력을 기록하는 래퍼 클라이언트 피스처"""
+def pytest_configure(config):
+    """pytest-xdist 병렬 실행 시 워커별 전용 DB 사용 (워커 간 데이터 간섭 방지)"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return
+    import asyncio
+    from config import settings
+    from utils.test.test_utils import prepare_worker_database
+
+    settings.db_name = asyncio.run(prepare_worker_database(worker))
+
+@pytest.fixture(scope="session")
+def test_client():
+    """세션 전체에서 공유하는 TestClient (lifespan으로 DB 풀을 한 번만 초기화)"""
     from fastapi.testclient import TestClient
     from main import app
-    
-    client = TestClient(app)
+
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def reset_db(test_client):
+    """테스트마다 시드 스냅샷으로 복원 (최초 1회만 시드 후 스냅샷 생성)"""
+    from utils.test.test_utils import restore_database
+    from utils.middleware.rate_limit_middleware import rate_limiter
+
+    test_client.portal.call(restore_database)
+    test_client.cookies.clear()
+    # 모든 요청이 같은 클라이언트 IP이므로 테스트마다 요청 빈도 제한 버킷 초기화
+    rate_limiter.reset()
+
+@pytest.fixture
+def api_client(request, test_client):
+    """API 호출 입출력을 기록하는 래퍼 클라이언트 피스처"""
+    client = test_client
     nodeid = request.node.nodeid
     test_call_logs[nodeid] = []
 
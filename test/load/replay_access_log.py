@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+액세스 로그 기반 트래픽 리플레이 도구:
+- backend.log의 `Request: METHOD PATH` 라인 또는 구조화 캡처(JSON Lines) 파싱
+- 요청 구성(route mix)과 도착 간격(inter-arrival) 재구성
+- 원본 ULID를 테스트 인스턴스의 시드 데이터 ID로 치환
+- 1x / Nx 속도로 재생 후 라우트별 상태 코드와 지연 시간 요약
+
+사용 예:
+    python test/load/replay_access_log.py backend.log --dry-run
+    python test/load/replay_access_log.py access_capture.jsonl --speed 4 --base-url http://localhost:8000
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+import zlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+
+BASE_URL = "http://localhost:8000"
+
+# backend.log 포맷: '%(asctime)s - [%(request_id)s] - %(name)s - %(levelname)s - %(message)s'
+LOG_LINE_RE = re.compile(
+    r"^(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - \[(?P<rid>[^\]]*)\] - access_logger - INFO - "
+    r"Request: (?P<method>[A-Z]+) (?P<path>\S+) - IP: (?P<ip>\S+)"
+)
+ULID_RE = re.compile(r"^[0-9A-HJKMNP-TV-Z]{26}$")
+
+# 경로 세그먼트 바로 앞의 컬렉션 이름으로 ID 종류를 판별
+ID_KIND_BY_COLLECTION = {"posts": "post", "comments": "comment", "users": "user"}
+
+# 리플레이 시 세션을 깨뜨리거나 본문을 재구성할 수 없는 요청
+SKIPPED_ROUTES = {
+    "POST /v1/auth/login",
+    "POST /v1/auth/logout",
+    "POST /v1/auth/signup",
+    "POST /v1/auth/profile-image",
+    "POST /v1/posts/image",
+    "POST /v1/users/me/profile-image",
+    "PATCH /v1/users/me",
+    "DELETE /v1/users/me",
+    "PATCH /v1/users/password",
+    "POST /v1/test/reset",
+}
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@dataclass
+class ReplayEvent:
+    offset: float  # 첫 요청 기준 경과 시간(초)
+    method: str
+    path: str
+    query: str = ""
+
+
+def _parse_log_timestamp(value: str) -> float:
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S,%f").timestamp()
+
+
+def parse_events(lines: Iterable[str], include_static: bool = False) -> List[ReplayEvent]:
+    """텍스트 로그와 JSON Lines 캡처를 모두 읽어 시간순 이벤트 목록으로 변환"""
+    raw = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            raw.append((record["ts"], record["method"], record["path"], record.get("query", "")))
+            continue
+        match = LOG_LINE_RE.match(line)
+        if match:
+            raw.append((_parse_log_timestamp(match["ts"]), match["method"], match["path"], ""))
+
+    if not include_static:
+        raw = [r for r in raw if not r[2].startswith("/public")]
+    if not raw:
+        return []
+
+    raw.sort(key=lambda r: r[0])
+    start = raw[0][0]
+    return [ReplayEvent(offset=ts - start, method=method, path=path, query=query) for ts, method, path, query in raw]
+
+
+def route_template(method: str, path: str) -> str:
+    """ID 세그먼트를 {kind}Id 로 치환한 라우트 템플릿"""
+    segments = path.split("/")
+    for idx, segment in enumerate(segments):
+        if ULID_RE.match(segment):
+            kind = ID_KIND_BY_COLLECTION.get(segments[idx - 1], "id") if idx > 0 else "id"
+            segments[idx] = f"{{{kind}Id}}"
+    return f"{method} {'/'.join(segments)}"
+
+
+def compress_gaps(events: List[ReplayEvent], max_gap: float) -> List[ReplayEvent]:
+    """긴 유휴 구간(서버 재시작, 야간 등)을 max_gap 초로 압축 (버스트 패턴은 유지)"""
+    if max_gap <= 0 or not events:
+        return events
+    shifted = 0.0
+    prev = events[0].offset
+    result = []
+    for event in events:
+        gap = event.offset - prev
+        if gap > max_gap:
+            shifted += gap - max_gap
+        prev = event.offset
+        result.append(ReplayEvent(event.offset - shifted, event.method, event.path, event.query))
+    return result
+
+
+class IdMapper:
+    """원본 ID -> 시드 데이터 ID 결정적 매핑 (같은 원본 ID는 항상 같은 대상 ID로 치환되어 핫스팟이 보존됨)"""
+
+    def __init__(self, pools: Dict[str, List[str]]):
+        self.pools = pools
+        self.mapping: Dict[str, str] = {}
+
+    def map_path(self, path: str) -> Optional[str]:
+        segments = path.split("/")
+        for idx, segment in enumerate(segments):
+            if not ULID_RE.match(segment):
+                continue
+            kind = ID_KIND_BY_COLLECTION.get(segments[idx - 1], "post") if idx > 0 else "post"
+            pool = self.pools.get(kind)
+            if not pool:
+                return None
+            if segment not in self.mapping:
+                self.mapping[segment] = pool[zlib.crc32(segment.encode()) % len(pool)]
+            segments[idx] = self.mapping[segment]
+        return "/".join(segments)
+
+
+async def load_id_pools(client: httpx.AsyncClient, max_posts: int) -> Dict[str, List[str]]:
+    """테스트 인스턴스의 공개 API로부터 시드 데이터 ID 풀 수집 (DB 접속 정보 불필요)"""
+    post_ids: List[str] = []
+    user_ids: List[str] = []
+    offset = 0
+    while len(post_ids) < max_posts:
+        resp = await client.get("/v1/posts", params={"offset": offset, "limit": 100})
+        resp.raise_for_status()
+        items = resp.json()["data"]["items"]
+        if not items:
+            break
+        for item in items:
+            post_ids.append(item["postId"])
+            user_ids.append(item["author"]["userId"])
+        offset += len(items)
+
+    comment_ids: List[str] = []
+    for post_id in post_ids[:20]:
+        resp = await client.get(f"/v1/posts/{post_id}/comments")
+        if resp.status_code == 200:
+            comment_ids.extend(c["commentId"] for c in resp.json()["data"])
+
+    return {
+        "post": post_ids[:max_posts],
+        "user": sorted(set(user_ids)),
+        "comment": comment_ids,
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _request_body(method: str, template: str) -> Optional[Dict]:
+    """본문이 기록되지 않으므로 쓰기 요청은 최소 유효 본문으로 재구성"""
+    if method not in ("POST", "PATCH"):
+        return None
+    if "/comments" in template:
+        return {"content": "replayed comment"}
+    if template in ("POST /v1/posts", "PATCH /v1/posts/{postId}"):
+        return {"title": "replay", "content": "replayed traffic"}
+    return None
+
+
+def print_mix(events: List[ReplayEvent]) -> None:
+    mix = Counter(route_template(e.method, e.path) for e in events)
+    duration = events[-1].offset if events else 0.0
+    gaps = [b.offset - a.offset for a, b in zip(events, events[1:])]
+    print(f"요청 수: {len(events)} / 구간: {duration:.1f}s / 평균 RPS: {len(events) / duration if duration else 0:.2f}")
+    if gaps:
+        print(
+            f"도착 간격(s): p50={_percentile(gaps, 50):.3f} p90={_percentile(gaps, 90):.3f} "
+            f"p99={_percentile(gaps, 99):.3f} max={max(gaps):.3f}"
+        )
+    print("\n라우트 구성:")
+    for template, count in mix.most_common():
+        print(f"  {count:>7}  {count * 100 / len(events):5.1f}%  {template}")
+
+
+async def replay(args, events: List[ReplayEvent]) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        if args.email:
+            resp = await client.post("/v1/auth/login", json={"email": args.email, "password": args.password})
+            resp.raise_for_status()
+
+        mapper = IdMapper(await load_id_pools(client, args.id_pool))
+        if not mapper.pools["post"]:
+            print("❌ 대상 인스턴스에 게시글이 없습니다. 시드 데이터를 먼저 생성하세요.")
+            return 1
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        statuses: Dict[str, Counter] = defaultdict(Counter)
+        lags: List[float] = []
+        skipped = Counter()
+
+        async def fire(seq: int, event: ReplayEvent, template: str, path: str):
+            async with semaphore:
+                headers = {"X-Request-ID": f"replay-{seq:08d}"}
+                if event.method == "OPTIONS":
+                    headers.update({"Origin": "http://localhost:5500", "Access-Control-Request-Method": "POST"})
+                url = f"{path}?{event.query}" if event.query else path
+                began = time.perf_counter()
+                try:
+                    resp = await client.request(event.method, url, json=_request_body(event.method, template), headers=headers)
+                    statuses[template][resp.status_code] += 1
+                except httpx.HTTPError as e:
+                    statuses[template][type(e).__name__] += 1
+                latencies[template].append((time.perf_counter() - began) * 1000)
+
+        start = time.perf_counter()
+        tasks = []
+        for event in events:
+            template = route_template(event.method, event.path)
+            if template in SKIPPED_ROUTES or (event.method not in SAFE_METHODS and not args.include_writes):
+                skipped[template] += 1
+                continue
+            path = mapper.map_path(event.path)
+            if path is None:
+                skipped[template] += 1
+                continue
+
+            delay = event.offset / args.speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                lags.append(-delay)
+            tasks.append(asyncio.create_task(fire(len(tasks), event, template, path)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    print(f"\n재생 완료: {len(tasks)}건 / {elapsed:.1f}s (x{args.speed}) / 스케줄 지연 max={max(lags, default=0) * 1000:.1f}ms")
+    print(f"{'route':<48} {'count':>7} {'p50':>8} {'p90':>8} {'p99':>8}  status")
+    for template in sorted(latencies, key=lambda t: -len(latencies[t])):
+        values = latencies[template]
+        status_text = ", ".join(f"{code}:{cnt}" for code, cnt in statuses[template].most_common())
+        print(
+            f"{template:<48} {len(values):>7} {_percentile(values, 50):>7.1f}ms "
+            f"{_percentile(values, 90):>7.1f}ms {_percentile(values, 99):>7.1f}ms  {status_text}"
+        )
+    if skipped:
+        print("\n건너뛴 요청:")
+        for template, count in skipped.most_common():
+            print(f"  {count:>7}  {template}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay captured access logs against a test instance.")
+    parser.add_argument("logs", nargs="+", help="backend.log 또는 access_log_capture_path JSON Lines 파일")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (2.0 = 2배 빠르게)")
+    parser.add_argument("--max-gap", type=float, default=5.0, help="이 값(초)보다 긴 유휴 구간은 압축 (0: 압축 안 함)")
+    parser.add_argument("--limit", type=int, default=0, help="앞에서부터 N건만 재생")
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--id-pool", type=int, default=1000, help="치환에 사용할 시드 게시글 ID 수")
+    parser.add_argument("--include-static", action="store_true", help="/public 정적 파일 요청 포함")
+    parser.add_argument("--include-writes", action="store_true", help="POST/PATCH/DELETE 요청도 재생 (--email 권장)")
+    parser.add_argument("--email", help="쓰기 요청 재생 시 로그인할 계정")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--dry-run", action="store_true", help="요청 구성과 도착 간격만 출력")
+    args = parser.parse_args()
+
+    lines: List[str] = []
+    for log_path in args.logs:
+        with open(log_path, encoding="utf-8") as f:
+            lines.extend(f)
+
+    events = compress_gaps(parse_events(lines, include_static=args.include_static), args.max_gap)
+    if args.limit:
+        events = events[:args.limit]
+    if not events:
+        print("❌ 재생할 요청이 없습니다.")
+        return 1
+
+    print_mix(events)
+    if args.dry_run:
+        return 0
+    return asyncio.run(replay(args, events))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""커넥션 풀 크기 자동 조절 테스트 (DB 불필요, 가짜 aiomysql 풀과 가짜 시계 사용)"""
+import asyncio
+import types
+import pytest
+
+from utils.database import adaptive_pool
+from utils.database.adaptive_pool import AdaptivePool
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRawPool:
+    """aiomysql 풀처럼 size는 열린 커넥션 수(사용 중 포함), 닫힌 커넥션은 반환 시 버림"""
+
+    def __init__(self):
+        self.free = []
+        self.used = set()
+
+    @property
+    def size(self):
+        return len(self.free) + len(self.used)
+
+    @property
+    def freesize(self):
+        return len(self.free)
+
+    async def acquire(self):
+        conn = self.free.pop() if self.free else FakeConnection()
+        self.used.add(conn)
+        return conn
+
+    async def release(self, conn):
+        self.used.discard(conn)
+        if not conn.closed:
+            self.free.append(conn)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """크기 조절 주기 판단에 쓰는 시각 (조절 주기 1초, 확장 기준 대기 5ms, 축소 기준 50%)"""
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(adaptive_pool, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(adaptive_pool.settings, "db_pool_adaptive", True)
+    monkeypatch.setattr(adaptive_pool.settings, "db_pool_resize_interval", 1.0)
+    monkeypatch.setattr(adaptive_pool.settings, "db_pool_grow_wait", 0.005)
+    monkeypatch.setattr(adaptive_pool.settings, "db_pool_shrink_utilization", 0.5)
+    monkeypatch.setattr(adaptive_pool.settings, "db_acquire_timeout", 1.0)
+    return clock
+
+
+def _pool(initial, minsize=1, maxsize=8):
+    return AdaptivePool("test", FakeRawPool(), minsize, maxsize, initial)
+
+
+async def _waited_acquire(pool, clock, wait):
+    """limit이 가득 찬 상태에서 wait초 기다린 뒤 얻은 획득 1회 만들기"""
+    held = [await pool.acquire() for _ in range(pool.limit)]
+    waiter = asyncio.ensure_future(pool.acquire())
+    await asyncio.sleep(0)
+    clock.now += wait
+    await pool.release(held.pop())
+    held.append(await waiter)
+    for conn in held:
+        await pool.release(conn)
+
+
+def test_grows_by_half_after_waited_acquires(clock):
+    pool = _pool(initial=4)
+
+    async def run():
+        await _waited_acquire(pool, clock, 0.01)
+        assert pool.limit == 4  # 조절 주기 전에는 유지
+        clock.now = 1.5
+        conn = await pool.acquire()
+        await pool.release(conn)
+
+    asyncio.run(run())
+    assert pool.limit == 6
+
+
+def test_growth_is_capped_at_maxsize(clock):
+    pool = _pool(initial=6, maxsize=7)
+
+    async def run():
+        await _waited_acquire(pool, clock, 0.01)
+        clock.now = 1.5
+        await pool.release(await pool.acquire())
+
+    asyncio.run(run())
+    assert pool.limit == 7
+
+
+def test_short_waits_do_not_grow(clock):
+    """grow_wait 미만의 대기는 확장 근거가 아님 (동시 사용 수가 높으므로 축소도 하지 않음)"""
+    pool = _pool(initial=2)
+
+    async def run():
+        await _waited_acquire(pool, clock, 0.001)
+        clock.now = 1.5
+        await pool.release(await pool.acquire())
+
+    asyncio.run(run())
+    assert pool.limit == 2
+
+
+def test_shrinks_one_step_per_interval_down_to_minsize(clock):
+    pool = _pool(initial=4, minsize=2)
+    limits = []
+
+    async def run():
+        for step in range(1, 5):
+            clock.now = step * 1.5
+            await pool.release(await pool.acquire())
+            limits.append(pool.limit)
+
+    asyncio.run(run())
+    assert limits == [3, 2, 2, 2]
+
+
+def test_release_closes_connections_above_limit(clock):
+    """줄어든 limit보다 열린 커넥션이 많으면 반환되는 커넥션을 닫아 실제 연결 수를 줄임"""
+    pool = _pool(initial=4)
+
+    async def run():
+        held = [await pool.acquire() for _ in range(4)]
+        pool.limiter.resize(2)
+        for conn in held:
+            await pool.release(conn)
+        return held
+
+    held = asyncio.run(run())
+    assert [conn.closed for conn in held] == [True, True, False, False]
+    assert pool.size == 2
+    assert pool.limiter.active == 0
+
+
+def test_fixed_size_when_adaptive_disabled(clock, monkeypatch):
+    monkeypatch.setattr(adaptive_pool.settings, "db_pool_adaptive", False)
+    pool = _pool(initial=3)
+
+    async def run():
+        await _waited_acquire(pool, clock, 0.01)
+        clock.now = 1.5
+        await pool.release(await pool.acquire())
+        clock.now = 3.0
+        await pool.release(await pool.acquire())
+
+    asyncio.run(run())
+    assert pool.limit == 3
+
+
+def test_acquire_times_out_when_limit_is_full(clock, monkeypatch):
+    monkeypatch.setattr(adaptive_pool.settings, "db_acquire_timeout", 0.05)
+    pool = _pool(initial=1)
+
+    async def run():
+        conn = await pool.acquire()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.acquire()
+        await pool.release(conn)
+
+    asyncio.run(run())
+    assert pool.limiter.active == 0
+    assert pool.limiter.waiting == 0
@@ -0,0 +1,115 @@
+"""요청 수락 제어 테스트 (DB 불필요, 최소 ASGI 앱 사용)"""
+import asyncio
+import json
+import pytest
+
+from utils.common.concurrency import ConcurrencyLimiter
+from utils.middleware import admission_middleware
+from utils.middleware.admission_middleware import AdmissionControlMiddleware, route_class
+
+
+@pytest.fixture
+def middleware(monkeypatch):
+    """분류별 한도 1, 대기열 1, 대기 시간 0.05초 / 앱은 release가 set될 때까지 응답을 붙잡음"""
+    monkeypatch.setattr(admission_middleware, "limiters", {
+        name: ConcurrencyLimiter(name, 1, 1, 0.05) for name in ("read", "write", "auth")
+    })
+    monkeypatch.setattr(admission_middleware.settings, "admission_control_enabled", True)
+    monkeypatch.setattr(admission_middleware.settings, "admission_retry_after", 7)
+    state = {"started": [], "release": None}
+
+    async def app(scope, receive, send):
+        state["started"].append(scope["path"])
+        await state["release"].wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return AdmissionControlMiddleware(app), state
+
+
+async def _request(middleware, method, path):
+    """(상태, 헤더 dict, 본문) 반환"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await middleware({"type": "http", "method": method, "path": path, "headers": []}, receive, send)
+    headers = {k.decode().lower(): v.decode() for k, v in messages[0]["headers"]}
+    return messages[0]["status"], headers, b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def _run(middleware, state, requests, hold=0.0):
+    """요청을 순서대로 시작하고 hold초 뒤 앱 응답을 풀어 결과를 요청 순서대로 반환"""
+    async def run():
+        state["release"] = asyncio.Event()
+        tasks = []
+        for method, path in requests:
+            tasks.append(asyncio.ensure_future(_request(middleware, method, path)))
+            await asyncio.sleep(0)
+        await asyncio.sleep(hold)
+        state["release"].set()
+        return await asyncio.gather(*tasks)
+
+    return asyncio.run(run())
+
+
+def test_route_class():
+    assert route_class("GET", "/v1/posts") == "read"
+    assert route_class("POST", "/v1/posts") == "write"
+    assert route_class("POST", "/v1/auth/login") == "auth"
+    assert route_class("PATCH", "/v1/users/password") == "auth"
+    assert route_class("GET", "/public/image/a.png") is None
+    assert route_class("GET", "/health") is None
+    assert route_class("GET", "/v1/posts/1/events") is None
+
+
+def test_queued_request_is_admitted_when_slot_frees(middleware):
+    app, state = middleware
+    results = _run(app, state, [("GET", "/v1/posts/1"), ("GET", "/v1/posts/2")])
+    assert [status for status, _, _ in results] == [200, 200]
+    assert state["started"] == ["/v1/posts/1", "/v1/posts/2"]
+    assert admission_middleware.limiters["read"].active == 0
+
+
+def test_full_queue_is_rejected_with_retry_after(middleware):
+    """실행 1 + 대기 1이 찬 상태의 세 번째 요청은 기다리지 않고 429"""
+    app, state = middleware
+    results = _run(app, state, [("GET", "/v1/posts/1"), ("GET", "/v1/posts/2"), ("GET", "/v1/posts/3")])
+    status, headers, body = results[2]
+    assert [status for status, _, _ in results] == [200, 200, 429]
+    assert headers["retry-after"] == "7"
+    assert json.loads(body)["code"] == "TOO_MANY_REQUEST"
+    assert "/v1/posts/3" not in state["started"]
+
+
+def test_queue_timeout_is_rejected_with_retry_after(middleware):
+    """대기 시간(0.05초) 안에 자리가 나지 않으면 429"""
+    app, state = middleware
+    results = _run(app, state, [("GET", "/v1/posts/1"), ("GET", "/v1/posts/2")], hold=0.2)
+    assert [status for status, _, _ in results] == [200, 429]
+    assert results[1][1]["retry-after"] == "7"
+    assert state["started"] == ["/v1/posts/1"]
+    assert admission_middleware.limiters["read"].rejected == 1
+    assert admission_middleware.limiters["read"].waiting == 0
+
+
+def test_classes_are_limited_separately(middleware):
+    """조회가 한도를 채워도 쓰기/인증과 제한 없는 경로는 바로 실행"""
+    app, state = middleware
+    results = _run(app, state, [
+        ("GET", "/v1/posts/1"), ("GET", "/v1/posts/2"),
+        ("POST", "/v1/posts"), ("POST", "/v1/auth/login"), ("GET", "/health"),
+    ])
+    assert [status for status, _, _ in results] == [200] * 5
+    assert state["started"][1:4] == ["/v1/posts", "/v1/auth/login", "/health"]
+
+
+def test_disabled_admission_control_passes_through(middleware, monkeypatch):
+    app, state = middleware
+    monkeypatch.setattr(admission_middleware.settings, "admission_control_enabled", False)
+    results = _run(app, state, [("GET", f"/v1/posts/{i}") for i in range(4)])
+    assert [status for status, _, _ in results] == [200] * 4
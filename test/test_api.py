@@ -1,6 +1,9 @@
 import pytest
+import io
 import os
 import sys
+import time
+from PIL import Image
 
 # 프로젝트 루트를 path에 추가하여 utils, models 등을 가져올 수 있게 함
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../2-owen-community-be"))
@@ -11,14 +14,27 @@ from utils.common.id_utils import generate_id
 from models.user_model import user_model
 from models.post_model import post_model
 from models.comment_model import comment_model
-from utils.test.test_utils import seed_database
 
 @pytest.fixture(autouse=True)
-def setup_and_teardown():
-    # 데이터베이스 초기화
-    seed_database()
+def setup_and_teardown(reset_db):
+    # 데이터베이스 초기화 (conftest의 스냅샷 복원)
     yield
 
+# --- Health API Tests ---
+
+def test_readiness_after_warm_up(api_client):
+    """readiness: warm-up(커넥션 확인, 첫 페이지 조회)이 끝나면 200, liveness는 항상 200"""
+    assert api_client.get("/health").status_code == 200
+
+    deadline = time.monotonic() + 10
+    resp = api_client.get("/health/ready")
+    while resp.status_code == 503 and time.monotonic() < deadline:
+        assert resp.json()["details"]["status"] == "warming_up"
+        time.sleep(0.1)
+        resp = api_client.get("/health/ready")
+    assert resp.status_code == 200
+    assert resp.json()["data"]["status"] == "ready"
+
 # --- Auth API Tests ---
 
 def test_signup_success(api_client):
@@ -126,6 +142,20 @@ def test_login_failure(api_client):
     })
     assert resp.status_code == 401
 
+def test_login_rate_limit(api_client):
+    """로그인 요청 빈도 제한: 버킷 용량을 넘으면 인증 검사 없이 429와 Retry-After"""
+    from config import settings
+    capacity = int(settings.rate_limit_rules["POST /v1/auth/login"].split("/")[0])
+
+    for _ in range(capacity):
+        resp = api_client.post("/v1/auth/login", json={"email": "none@example.com", "password": "Password123!"})
+        assert resp.status_code == 401
+
+    resp = api_client.post("/v1/auth/login", json={"email": "none@example.com", "password": "Password123!"})
+    assert resp.status_code == 429
+    assert resp.json()["code"] == "RATE_LIMIT_EXCEEDED"
+    assert int(resp.headers["retry-after"]) >= 1
+
 # --- User API Tests ---
 
 def test_user_update_success(api_client):
@@ -266,6 +296,118 @@ def test_post_full_lifecycle(api_client):
     resp = api_client.get(f"/v1/posts/{postId}")
     assert resp.status_code == 404
 
+def test_post_conditional_get(api_client):
+    """ETag 조건부 조회: 변경 없으면 304, 수정 후에는 200과 새 ETag"""
+    api_client.post("/v1/auth/signup", json={"email": "etag@t.com", "password": "Password123!", "nickname": "etagger"})
+    api_client.post("/v1/auth/login", json={"email": "etag@t.com", "password": "Password123!"})
+    resp = api_client.post("/v1/posts", json={"title": "ETag Title", "content": "ETag Content"})
+    postId = resp.json()["data"]["postId"]
+
+    # 목록: 같은 ETag로 다시 요청하면 304
+    resp = api_client.get("/v1/posts")
+    etag = resp.headers["ETag"]
+    resp = api_client.get("/v1/posts", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    # 상세 조회(조회수 증가)는 목록 ETag를 바꾸지 않음
+    api_client.get(f"/v1/posts/{postId}")
+    resp = api_client.get("/v1/posts", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    # 상세(폴링): incHits=false 요청만 조건부 조회
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false")
+    post_etag = resp.headers["ETag"]
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"If-None-Match": post_etag})
+    assert resp.status_code == 304
+
+    # 수정 후에는 목록/상세 모두 200
+    api_client.patch(f"/v1/posts/{postId}", json={"title": "Changed", "content": "ETag Content"})
+    resp = api_client.get("/v1/posts", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    resp = api_client.get(f"/v1/posts/{postId}?incHits=false", headers={"If-None-Match": post_etag})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["title"] == "Changed"
+    assert resp.headers["ETag"] != post_etag
+
+def test_post_list_cache_invalidation(api_client):
+    """목록 캐시: 작성/좋아요/삭제 직후 목록에 바로 반영"""
+    api_client.post("/v1/auth/signup", json={"email": "feed@t.com", "password": "Password123!", "nickname": "feeder"})
+    api_client.post("/v1/auth/login", json={"email": "feed@t.com", "password": "Password123!"})
+
+    resp = api_client.get("/v1/posts")
+    assert resp.json()["data"]["pagination"]["totalCount"] == 0
+
+    resp = api_client.post("/v1/posts", json={"title": "Cached", "content": "Feed Content"})
+    postId = resp.json()["data"]["postId"]
+    resp = api_client.get("/v1/posts")
+    assert [p["postId"] for p in resp.json()["data"]["items"]] == [postId]
+
+    # 좋아요(목록 버전 증가)도 캐시 무효화
+    api_client.post(f"/v1/posts/{postId}/likes")
+    resp = api_client.get("/v1/posts")
+    assert resp.json()["data"]["items"][0]["likeCount"] == 1
+
+    api_client.delete(f"/v1/posts/{postId}")
+    resp = api_client.get("/v1/posts")
+    assert resp.json()["data"]["items"] == []
+
+def test_post_and_comment_delta_sync(api_client):
+    """since 조회: 이후 작성/수정된 항목과 삭제된 항목 ID만 반환, hasMore면 nextSince로 이어서 조회"""
+    api_client.post("/v1/auth/signup", json={"email": "delta@t.com", "password": "Password123!", "nickname": "delta"})
+    api_client.post("/v1/auth/login", json={"email": "delta@t.com", "password": "Password123!"})
+
+    first = api_client.post("/v1/posts", json={"title": "First", "content": "Content"}).json()["data"]["postId"]
+    second = api_client.post("/v1/posts", json={"title": "Second", "content": "Content"}).json()["data"]["postId"]
+
+    # 1. limit 단위로 변경 순 조회
+    resp = api_client.get("/v1/posts", params={"since": "2000-01-01T00:00:00", "limit": 1})
+    assert resp.status_code == 200
+    page = resp.json()["data"]
+    assert [p["postId"] for p in page["items"]] == [first] and page["hasMore"] is True
+    page = api_client.get("/v1/posts", params={"since": page["nextSince"], "limit": 1}).json()["data"]
+    assert [p["postId"] for p in page["items"]] == [second] and page["hasMore"] is False
+
+    # 2. 댓글 작성/삭제 후 변경분 (삭제된 댓글은 deletedIds)
+    since = page["nextSince"]
+    kept = api_client.post(f"/v1/posts/{second}/comments", json={"content": "Kept"}).json()["data"]["commentId"]
+    removed = api_client.post(f"/v1/posts/{second}/comments", json={"content": "Removed"}).json()["data"]["commentId"]
+    api_client.delete(f"/v1/posts/{second}/comments/{removed}")
+    delta = api_client.get(f"/v1/posts/{second}/comments", params={"since": since}).json()["data"]
+    assert [c["commentId"] for c in delta["items"]] == [kept]
+    assert delta["deletedIds"] == [removed]
+
+    # 3. 게시글 삭제는 목록 변경분의 deletedIds로 전달
+    api_client.delete(f"/v1/posts/{first}")
+    delta = api_client.get("/v1/posts", params={"since": since}).json()["data"]
+    assert first in delta["deletedIds"]
+    assert second in [p["postId"] for p in delta["items"]]  # 댓글 수 변경
+
+    # 4. 조회수 증가는 변경분에 포함되지 않음 (좋아요는 포함)
+    time.sleep(0.01)
+    since = generate_id()
+    api_client.get(f"/v1/posts/{second}")
+    delta = api_client.get("/v1/posts", params={"since": since}).json()["data"]
+    assert second not in [p["postId"] for p in delta["items"]]
+    api_client.post(f"/v1/posts/{second}/likes")
+    delta = api_client.get("/v1/posts", params={"since": since}).json()["data"]
+    assert second in [p["postId"] for p in delta["items"]]
+
+    resp = api_client.get("/v1/posts", params={"since": "not-a-marker"})
+    assert resp.status_code == 422
+
+def test_request_deadline_timeout(api_client, monkeypatch):
+    """경로별 처리 시간 한도를 넘은 쿼리는 504(REQUEST_TIMEOUT), 이후 요청은 정상 처리"""
+    from utils.common.deadline import route_timeouts, parse_timeouts
+    monkeypatch.setattr(route_timeouts, "rules", parse_timeouts({"GET /v1/posts/": 0.000001}))
+
+    resp = api_client.get(f"/v1/posts/{generate_id()}/comments")
+    assert resp.status_code == 504
+    assert resp.json()["code"] == "REQUEST_TIMEOUT"
+
+    monkeypatch.undo()
+    resp = api_client.get(f"/v1/posts/{generate_id()}/comments")
+    assert resp.status_code == 404
+
 # --- Comment API Tests ---
 
 def test_comment_list(api_client):
@@ -328,19 +470,56 @@ def test_comment_lifecycle_and_cache(api_client):
 
 # --- File Upload Tests ---
 
+def _image_bytes(fmt: str, size=(800, 600)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
 def test_image_upload_and_directory_creation(api_client):
     """이미지 업로드 기능 검증"""
     api_client.post("/v1/auth/signup", json={"email": "f@t.com", "password": "Password123!", "nickname": "file"})
     api_client.post("/v1/auth/login", json={"email": "f@t.com", "password": "Password123!"})
     
     # 프로필 이미지 업로드
-    files = {"profileImage": ("profile.png", b"fake_image_content", "image/png")}
+    files = {"profileImage": ("profile.png", _image_bytes("PNG"), "image/png")}
     resp = api_client.post("/v1/users/me/profile-image", files=files)
     assert resp.status_code == 201
-    assert "profileImageUrl" in resp.json()["data"]
+    data = resp.json()["data"]
+    assert data["profileImageUrl"].endswith("_full.webp")
+    assert set(data["profileImageVariants"]) == {"thumbnail", "card", "full"}
     
-    # 게시글 이미지 업로드
-    files = {"postFile": ("post.jpg", b"fake_post_image", "image/jpeg")}
+    # 게시글 이미지 업로드 (확장자가 아니라 매직 바이트로 형식 판별)
+    files = {"postFile": ("post.png", _image_bytes("JPEG"), "image/png")}
     resp = api_client.post("/v1/posts/image", files=files)
     assert resp.status_code == 201
-    assert "postFileUrl" in resp.json()["data"]
+    data = resp.json()["data"]
+    assert os.path.exists(data["postFileVariants"]["card"].lstrip("/"))
+    with Image.open(data["postFileVariants"]["thumbnail"].lstrip("/")) as thumbnail:
+        assert max(thumbnail.size) == 160
+
+    # 같은 내용은 같은 URL로 한 번만 저장 (내용 해시 기반, 장기 캐시 가능)
+    files = {"postFile": ("again.jpg", _image_bytes("JPEG"), "image/jpeg")}
+    resp = api_client.post("/v1/posts/image", files=files)
+    assert resp.json()["data"]["postFileUrl"] == data["postFileUrl"]
+    resp = api_client.get(data["postFileUrl"])
+    assert resp.status_code == 200
+    assert "immutable" in resp.headers["Cache-Control"]
+    assert api_client.get(data["postFileUrl"], headers={"If-None-Match": resp.headers["ETag"]}).status_code == 304
+    resp = api_client.get(data["postFileUrl"], headers={"Range": "bytes=0-9"})
+    assert resp.status_code == 206
+    assert len(resp.content) == 10
+
+    # 게시글 응답에 파생본 URL 포함
+    resp = api_client.post("/v1/posts", json={"title": "Image", "content": "Content", "fileUrl": data["postFileUrl"]})
+    assert resp.json()["data"]["file"]["variants"] == data["postFileVariants"]
+
+    # 이미지가 아닌 파일과 5MB 초과 파일은 거절
+    files = {"postFile": ("fake.jpg", b"not an image", "image/jpeg")}
+    resp = api_client.post("/v1/posts/image", files=files)
+    assert resp.status_code == 400
+    files = {"postFile": ("broken.png", b"\x89PNG\r\n\x1a\n" + b"truncated", "image/png")}
+    resp = api_client.post("/v1/posts/image", files=files)
+    assert resp.status_code == 400
+    files = {"postFile": ("big.png", b"\x89PNG\r\n\x1a\n" + b"0" * (5 * 1024 * 1024), "image/png")}
+    resp = api_client.post("/v1/posts/image", files=files)
+    assert resp.status_code == 413
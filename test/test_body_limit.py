@@ -0,0 +1,70 @@
+"""업로드 요청 본문 크기 제한 테스트 (DB 불필요, 최소 FastAPI 앱 사용)"""
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from config import settings
+from utils.errors.exception_handlers import register_exception_handlers
+from utils.middleware.body_limit_middleware import BodyLimitMiddleware
+
+LIMIT = 64 * 1024
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "upload_max_body_size", LIMIT)
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        app.state.calls += 1
+        return {"size": len(await file.read())}
+
+    register_exception_handlers(app)
+    app.add_middleware(BodyLimitMiddleware)
+    with TestClient(app) as client:
+        client.app_state = app.state
+        yield client
+
+
+def _multipart(size: int):
+    return {"file": ("a.png", b"x" * size, "image/png")}
+
+
+def test_upload_within_limit(client):
+    resp = client.post("/upload", files=_multipart(1024))
+    assert resp.status_code == 200
+    assert resp.json() == {"size": 1024}
+
+
+def test_content_length_over_limit_rejected_before_route(client):
+    """Content-Length가 한도를 넘으면 본문을 읽지 않고 413"""
+    resp = client.post("/upload", files=_multipart(LIMIT * 2))
+    assert resp.status_code == 413
+    assert resp.json()["code"] == "PAYLOAD_TOO_LARGE"
+    assert client.app_state.calls == 0
+
+
+def test_streamed_body_over_limit_rejected_while_receiving(client):
+    """Content-Length 없는(chunked) 본문도 받는 중에 한도를 넘으면 413"""
+    boundary = "limit-test"
+    head = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"a.png\"\r\n"
+        "Content-Type: image/png\r\n\r\n"
+    ).encode()
+
+    def chunks():
+        yield head
+        for _ in range(4):
+            yield b"x" * (LIMIT // 2)
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    resp = client.post(
+        "/upload",
+        content=chunks(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    assert resp.status_code == 413
+    assert resp.json()["code"] == "PAYLOAD_TOO_LARGE"
+    assert client.app_state.calls == 0
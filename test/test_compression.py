@@ -0,0 +1,132 @@
+"""응답 압축 미들웨어 테스트 (DB 불필요, 최소 ASGI 앱 사용)"""
+import asyncio
+import gzip
+import types
+import pytest
+
+from utils.middleware import compression_middleware
+from utils.middleware.compression_middleware import CompressionMiddleware, choose_encoding
+
+BODY = b'{"items": [' + b'{"title": "hello"}, ' * 200 + b"]}"
+
+
+def _send_body(body, headers=None, status=200, chunks=1):
+    """본문을 chunks개 메시지로 나눠 보내는 ASGI 앱"""
+    async def app(scope, receive, send):
+        raw = [(b"content-type", b"application/json")] + [(k.encode(), v.encode()) for k, v in (headers or {}).items()]
+        await send({"type": "http.response.start", "status": status, "headers": raw})
+        size = len(body) // chunks + 1
+        for i in range(chunks):
+            part = body[i * size:(i + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": i < chunks - 1})
+
+    return app
+
+
+def _request(app, accept_encoding):
+    """(상태, 응답 헤더 dict, 본문) 반환"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=100)(scope, receive, send))
+    start = messages[0]
+    headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], headers, body
+
+
+# --- 인코딩 협상 ---
+
+def test_choose_encoding_prefers_br_when_available(monkeypatch):
+    monkeypatch.setattr(compression_middleware, "brotli", types.SimpleNamespace())
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("gzip, br;q=0") == "gzip"
+
+
+def test_choose_encoding_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression_middleware, "brotli", None)
+    assert choose_encoding("gzip, br") == "gzip"
+    assert choose_encoding("br") is None
+    assert choose_encoding("*") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+
+
+def test_gzip_response(monkeypatch):
+    monkeypatch.setattr(compression_middleware, "brotli", None)
+    status, headers, body = _request(_send_body(BODY), "gzip, br")
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert "Accept-Encoding" in headers["vary"]
+    assert gzip.decompress(body) == BODY
+
+
+def test_brotli_response():
+    brotli = pytest.importorskip("brotli")
+    _, headers, body = _request(_send_body(BODY), "gzip, br")
+    assert headers["content-encoding"] == "br"
+    assert brotli.decompress(body) == BODY
+
+
+def test_identity_when_not_accepted():
+    _, headers, body = _request(_send_body(BODY), "identity")
+    assert "content-encoding" not in headers
+    assert body == BODY
+
+
+# --- ETag ---
+
+def test_strong_etag_weakened_when_compressed():
+    _, headers, _ = _request(_send_body(BODY, {"etag": '"v1"'}), "gzip")
+    assert headers["etag"] == 'W/"v1"'
+
+
+def test_weak_etag_kept():
+    _, headers, _ = _request(_send_body(BODY, {"etag": 'W/"v1"'}), "gzip")
+    assert headers["etag"] == 'W/"v1"'
+
+
+def test_etag_untouched_when_not_compressed():
+    _, headers, _ = _request(_send_body(b"{}", {"etag": '"v1"'}), "gzip")
+    assert headers["etag"] == '"v1"'
+    assert "content-encoding" not in headers
+
+
+# --- 압축하지 않고 그대로 전달 ---
+
+def test_already_encoded_response_passes_through():
+    encoded = gzip.compress(BODY)
+    _, headers, body = _request(_send_body(encoded, {"content-encoding": "gzip"}), "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert body == encoded
+
+
+def test_streamed_response_passes_through():
+    """more_body로 나눠 오는 스트리밍 응답(SSE/FileResponse 등)은 압축하지 않음"""
+    _, headers, body = _request(_send_body(BODY, chunks=3), "gzip")
+    assert "content-encoding" not in headers
+    assert body == BODY
+
+
+def test_non_compressible_type_passes_through():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"image/png")]})
+        await send({"type": "http.response.body", "body": BODY})
+
+    _, headers, body = _request(app, "gzip")
+    assert "content-encoding" not in headers
+    assert body == BODY
+
+
+def test_partial_content_passes_through():
+    status, headers, body = _request(_send_body(BODY, status=206), "gzip")
+    assert status == 206
+    assert "content-encoding" not in headers
+    assert body == BODY
@@ -0,0 +1,199 @@
+"""요청 마감 시각 테스트: DB 쿼리 시간 한도/중단, 연결 종료 시 취소 (DB 불필요, 가짜 풀/ASGI 앱 사용)"""
+import asyncio
+import pytest
+import aiomysql
+
+from utils.common import deadline
+from utils.database import db
+from utils.errors.exceptions import APIError
+from utils.middleware.deadline_middleware import DeadlineMiddleware
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 1
+
+    async def execute(self, query, params=()):
+        self.conn.pool.executed.append((self.conn.threadId, query, params))
+        if self.conn.behaviour == "slow":
+            await asyncio.sleep(10)
+        if self.conn.behaviour == "server_timeout":
+            raise aiomysql.OperationalError(db.ER_QUERY_TIMEOUT, "Query execution was interrupted")
+
+    async def fetchall(self):
+        return []
+
+    async def fetchone(self):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, pool, threadId, behaviour):
+        self.pool = pool
+        self.threadId = threadId
+        self.behaviour = behaviour
+        self.closed = False
+
+    def thread_id(self):
+        return self.threadId
+
+    def close(self):
+        self.closed = True
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self)
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        assert not self.closed
+
+
+class FakePool:
+    """AdaptivePool과 같은 acquire/release (서버마다 thread id가 겹치도록 같은 번호부터 발급)"""
+
+    limit = size = freesize = 5
+
+    def __init__(self, name):
+        self.name = name
+        self.behaviours = []
+        self.executed = []
+        self._nextId = 100
+
+    async def acquire(self):
+        self._nextId += 1
+        return FakeConnection(self, self._nextId, self.behaviours.pop(0) if self.behaviours else "ok")
+
+    async def release(self, conn):
+        pass
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    primary, replica = FakePool("primary"), FakePool("replica")
+    monkeypatch.setattr(db, "_pool", primary)
+    monkeypatch.setattr(db, "_replica_pools", [replica])
+    monkeypatch.setattr(db.settings, "db_deadline_grace", 0.05)
+    return primary, replica
+
+
+async def _with_deadline(timeout, coro):
+    token = deadline.set_deadline(timeout)
+    try:
+        return await coro
+    finally:
+        deadline.reset_deadline(token)
+
+
+# --- DB 계층 ---
+
+def test_select_gets_max_execution_time_hint(pools):
+    """마감 시각이 있으면 SELECT에만 MAX_EXECUTION_TIME 힌트, 없으면 원래 쿼리"""
+    primary, replica = pools
+
+    async def run():
+        await _with_deadline(2, db.fetch_all("  SELECT * FROM posts"))
+        await _with_deadline(2, db.execute("UPDATE posts SET hits = hits + 1"))
+        await db.fetch_all("SELECT 1")
+
+    asyncio.run(run())
+    assert replica.executed[0][1].startswith("SELECT /*+ MAX_EXECUTION_TIME(")
+    assert primary.executed[0][1] == "UPDATE posts SET hits = hits + 1"
+    assert replica.executed[1][1] == "SELECT 1"
+
+
+def test_server_side_timeout_maps_to_504(pools):
+    """MAX_EXECUTION_TIME으로 서버가 중단한 SELECT(ER_QUERY_TIMEOUT)는 504"""
+    _, replica = pools
+    replica.behaviours = ["server_timeout"]
+    with pytest.raises(APIError) as exc:
+        asyncio.run(_with_deadline(2, db.fetch_all("SELECT 1")))
+    assert exc.value.code.name == "REQUEST_TIMEOUT"
+
+
+def test_slow_replica_query_is_killed_on_replica(pools):
+    """한도를 넘긴 replica 조회는 커넥션을 닫고 같은 replica에서 KILL QUERY (primary에는 보내지 않음)"""
+    primary, replica = pools
+    replica.behaviours = ["slow"]
+
+    async def run():
+        with pytest.raises(APIError) as exc:
+            await _with_deadline(0.05, db.fetch_all("SELECT 1"))
+        await asyncio.sleep(0.01)
+        return exc.value
+
+    error = asyncio.run(run())
+    assert error.code.name == "REQUEST_TIMEOUT"
+    assert primary.executed == []
+    assert replica.executed[-1] == (102, "KILL QUERY %s", (101,))
+
+
+def test_cancelled_write_is_killed_on_primary(pools):
+    """요청 취소 시 실행 중인 쓰기도 primary에서 KILL QUERY"""
+    primary, _ = pools
+    primary.behaviours = ["slow"]
+
+    async def run():
+        task = asyncio.ensure_future(_with_deadline(5, db.execute("UPDATE posts SET title = 't'")))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert primary.executed[-1] == (102, "KILL QUERY %s", (101,))
+
+
+# --- 미들웨어 ---
+
+def _run_middleware(method, disconnect_after):
+    """본문 1개 전송 후 disconnect_after초 뒤 연결 종료, (전송된 응답 상태, 앱 완료 여부) 반환"""
+    events = []
+
+    async def app(scope, receive, send):
+        await receive()
+        await asyncio.sleep(0.1)
+        events.append("finished")
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def run():
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        statuses = []
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await asyncio.sleep(disconnect_after)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        await DeadlineMiddleware(app)({"type": "http", "method": method, "path": "/v1/posts/1"}, receive, send)
+        return statuses
+
+    return asyncio.run(run()), events == ["finished"]
+
+
+def test_disconnected_get_is_cancelled():
+    statuses, finished = _run_middleware("GET", 0.01)
+    assert statuses == [499]
+    assert not finished
+
+
+def test_disconnected_post_runs_to_completion():
+    """쓰기 요청은 연결이 끊겨도 취소하지 않음 (여러 단계 쓰기가 일부만 반영되지 않도록)"""
+    statuses, finished = _run_middleware("POST", 0.01)
+    assert statuses == [200]
+    assert finished
@@ -0,0 +1,103 @@
+"""실시간 이벤트(SSE) 발행/구독 테스트 (DB 불필요)"""
+import asyncio
+import json
+import pytest
+
+from utils.common import event_bus as event_bus_module
+from utils.common.event_bus import FEED_TOPIC, RESYNC_EVENT, EventBus, post_topic, stream_events
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    """테스트마다 새 버스 (stream_events도 이 버스를 사용), 큐 크기 3"""
+    bus = EventBus()
+    monkeypatch.setattr(event_bus_module, "event_bus", bus)
+    monkeypatch.setattr(event_bus_module.settings, "sse_queue_size", 3)
+    monkeypatch.setattr(event_bus_module.settings, "sse_heartbeat_interval", 0.05)
+    return bus
+
+
+async def _drain(subscription):
+    """대기 중인 이벤트를 모두 꺼냄 (resync 포함)"""
+    events = []
+    while True:
+        item = await subscription.next(0.01)
+        if item is None:
+            return events
+        events.append(item)
+        if item[1] == RESYNC_EVENT:
+            return events
+
+
+def _parse(chunk: bytes):
+    """SSE 메시지 1개 -> (id, event, data)"""
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().split("\n"))
+    return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+
+def test_publish_fans_out_to_topic_subscribers(bus):
+    async def run():
+        first, second = bus.subscribe(FEED_TOPIC), bus.subscribe(FEED_TOPIC)
+        other = bus.subscribe(post_topic("1"))
+        bus.publish(FEED_TOPIC, "post_created", {"postId": "2"})
+        return [await _drain(subscription) for subscription in (first, second, other)]
+
+    first, second, other = asyncio.run(run())
+    assert first == second == [(1, "post_created", {"postId": "2"})]
+    assert other == []
+
+
+def test_publish_without_subscribers_is_noop(bus):
+    bus.publish(FEED_TOPIC, "post_created", {})
+    assert bus.subscriberCount() == 0
+
+
+def test_slow_consumer_gets_resync_without_blocking_others(bus):
+    """큐가 가득 찬 구독은 해제되고 밀린 이벤트 뒤에 resync, 다른 구독자는 계속 받음"""
+    async def run():
+        slow, fast = bus.subscribe(FEED_TOPIC), bus.subscribe(FEED_TOPIC)
+        for i in range(3):
+            bus.publish(FEED_TOPIC, "like", {"n": i})
+        await _drain(fast)
+        bus.publish(FEED_TOPIC, "like", {"n": 3})
+        assert bus.subscriberCount(FEED_TOPIC) == 1
+        return await _drain(slow), await _drain(fast)
+
+    slowEvents, fastEvents = asyncio.run(run())
+    assert [data for _, _, data in slowEvents[:3]] == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert slowEvents[3:] == [(0, RESYNC_EVENT, {"topic": FEED_TOPIC})]
+    assert fastEvents == [(4, "like", {"n": 3})]
+
+
+def test_stream_formats_events_and_unsubscribes(bus):
+    async def run():
+        stream = stream_events(post_topic("7"))
+        chunks = [await stream.__anext__()]
+        assert bus.subscriberCount(post_topic("7")) == 1
+        bus.publish(post_topic("7"), "comment_created", {"commentId": "9"})
+        chunks.append(await stream.__anext__())
+        chunks.append(await stream.__anext__())  # 이벤트 없음 -> keep-alive
+        await stream.aclose()
+        return chunks
+
+    retry, event, heartbeat = asyncio.run(run())
+    assert retry.startswith(b"retry: ")
+    assert _parse(event) == ("1", "comment_created", {"commentId": "9"})
+    assert heartbeat == b": keep-alive\n\n"
+    assert bus.subscriberCount() == 0
+
+
+def test_stream_ends_after_resync(bus):
+    async def run():
+        chunks = []
+        stream = stream_events(FEED_TOPIC)
+        chunks.append(await stream.__anext__())
+        for i in range(4):
+            bus.publish(FEED_TOPIC, "like", {"n": i})
+        async for chunk in stream:
+            chunks.append(chunk)
+        return chunks[1:]
+
+    chunks = asyncio.run(run())
+    assert [_parse(chunk)[1] for chunk in chunks] == ["like", "like", "like", RESYNC_EVENT]
+    assert bus.subscriberCount() == 0
@@ -0,0 +1,61 @@
+"""게시글 목록 캐시와 조회 라우팅 테스트 (컨트롤러 조회를 가짜로 대체, DB 불필요)"""
+import asyncio
+import pytest
+from starlette.requests import Request
+
+from controllers.post_controller import post_controller
+from routers.post_router import get_posts
+from utils.common.response_cache import feed_cache
+from utils.database import db
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """목록 조회마다 primary 조회 여부 기록 (replica 1개 설정)"""
+    calls = []
+
+    async def getPostsETag(limit, offset):
+        return '"posts"'
+
+    async def getAllPosts(limit, offset):
+        calls.append(db.reads_from_primary())
+        return {"items": [], "pagination": {"totalCount": len(calls)}}
+
+    monkeypatch.setattr(post_controller, "getPostsETag", getPostsETag)
+    monkeypatch.setattr(post_controller, "getAllPosts", getAllPosts)
+    monkeypatch.setattr(db, "_replica_pools", ["replica"])
+    # 이전 무효화 시각은 지운 상태(오래전 무효화)로 시작
+    feed_cache.invalidate()
+    monkeypatch.setattr(feed_cache, "_invalidatedAt", float("-inf"))
+    yield calls
+    feed_cache.invalidate()
+
+
+def _get_posts(primary: bool = False):
+    async def run():
+        db.bind_read_routing(primary)
+        request = Request({"type": "http", "method": "GET", "path": "/v1/posts", "headers": []})
+        return await get_posts(request, offset=0, limit=10, since=None)
+
+    return asyncio.run(run())
+
+
+def test_replica_reads_share_cached_page(loads):
+    _get_posts()
+    _get_posts()
+    assert loads == [False]
+
+
+def test_primary_routed_client_bypasses_cache(loads):
+    """read-your-writes 중인 클라이언트는 replica에서 읽어 캐시된 목록 대신 primary 결과"""
+    _get_posts()
+    _get_posts(primary=True)
+    _get_posts(primary=True)
+    assert loads == [False, True, True]
+
+
+def test_load_right_after_invalidation_uses_primary(loads):
+    """무효화 직후 캐시 갱신은 replica 지연을 피해 primary에서 조회"""
+    feed_cache.invalidate()
+    _get_posts()
+    assert loads == [True]
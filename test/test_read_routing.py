@@ -0,0 +1,182 @@
+"""replica 조회 라우팅 테스트: round-robin, primary 대체, read-your-writes 쿠키 (DB 불필요, 가짜 풀/ASGI 앱 사용)"""
+import asyncio
+import time
+import pytest
+
+from utils.database import db
+from utils.middleware import read_routing_middleware
+from utils.middleware.read_routing_middleware import PRIMARY_READ_COOKIE, ReadRoutingMiddleware
+
+
+class FakeCursor:
+    rowcount = 1
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def execute(self, query, params=()):
+        self.pool.executed.append(query)
+
+    async def fetchall(self):
+        return []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+class FakeConnection:
+    closed = False
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self.pool)
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class FakePool:
+    """acquire_error가 있으면 커넥션 대신 해당 예외 발생"""
+
+    limit = size = freesize = 5
+
+    def __init__(self, name, acquire_error=None):
+        self.name = name
+        self.acquire_error = acquire_error
+        self.executed = []
+
+    async def acquire(self):
+        if self.acquire_error is not None:
+            raise self.acquire_error
+        return FakeConnection(self)
+
+    async def release(self, conn):
+        pass
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    primary, first, second = FakePool("primary"), FakePool("replica1"), FakePool("replica2")
+    monkeypatch.setattr(db, "_pool", primary)
+    monkeypatch.setattr(db, "_replica_pools", [first, second])
+    monkeypatch.setattr(read_routing_middleware.settings, "db_read_your_writes_window", 2.0)
+    return primary, first, second
+
+
+# --- DB 계층 ---
+
+def test_reads_round_robin_across_replicas(pools):
+    primary, first, second = pools
+
+    async def run():
+        for _ in range(4):
+            await db.fetch_all("SELECT 1")
+
+    asyncio.run(run())
+    assert len(first.executed) == len(second.executed) == 2
+    assert primary.executed == []
+
+
+@pytest.mark.parametrize("error", [asyncio.TimeoutError(), OSError("connection refused")])
+def test_unavailable_replica_falls_back_to_primary(pools, error):
+    primary, first, second = pools
+    first.acquire_error = second.acquire_error = error
+    asyncio.run(db.fetch_all("SELECT 1"))
+    assert primary.executed == ["SELECT 1"]
+
+
+def test_reads_after_write_use_primary(pools):
+    """같은 요청에서 쓰기 후의 조회는 primary (read_your_writes=False 쓰기는 제외)"""
+    primary, first, second = pools
+
+    async def run():
+        routing = db.bind_read_routing()
+        await db.execute("UPDATE posts SET hits = hits + 1", read_your_writes=False)
+        await db.fetch_all("SELECT after_view")
+        assert not routing.wrote
+        await db.execute("UPDATE posts SET title = 't'")
+        await db.fetch_all("SELECT after_write")
+        assert routing.wrote
+
+    asyncio.run(run())
+    assert first.executed + second.executed == ["SELECT after_view"]
+    assert primary.executed[-1] == "SELECT after_write"
+
+
+def test_without_replicas_everything_uses_primary(pools, monkeypatch):
+    primary, _, _ = pools
+    monkeypatch.setattr(db, "_replica_pools", [])
+    asyncio.run(db.fetch_all("SELECT 1"))
+    assert primary.executed == ["SELECT 1"]
+
+
+# --- 미들웨어 ---
+
+async def _app(scope, receive, send):
+    """POST는 쓰기, 그 외는 조회 1회"""
+    if scope["method"] == "POST":
+        await db.execute("INSERT INTO posts VALUES ()")
+    else:
+        await db.fetch_all("SELECT 1")
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _request(method, cookie=None):
+    """응답의 Set-Cookie 헤더 목록 반환"""
+    messages = []
+    headers = [(b"cookie", f"{PRIMARY_READ_COOKIE}={cookie}".encode())] if cookie is not None else []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": "/v1/posts", "headers": headers}
+    asyncio.run(ReadRoutingMiddleware(_app)(scope, receive, send))
+    return [v.decode() for k, v in messages[0]["headers"] if k == b"set-cookie"]
+
+
+def test_write_response_sets_primary_read_cookie(pools):
+    cookies = _request("POST")
+    assert len(cookies) == 1
+    value = cookies[0].split(";")[0].split("=", 1)[1]
+    assert cookies[0].startswith(f"{PRIMARY_READ_COOKIE}=")
+    assert 1.0 < float(value) - time.time() <= 2.001  # 만료 시각은 밀리초 단위로 반올림
+    assert "Max-Age=2" in cookies[0]
+    assert "HttpOnly" in cookies[0]
+
+
+def test_read_response_sets_no_cookie(pools):
+    primary, _, _ = pools
+    assert _request("GET") == []
+    assert primary.executed == []
+
+
+def test_valid_cookie_routes_reads_to_primary(pools):
+    primary, first, second = pools
+    assert _request("GET", cookie=f"{time.time() + 2:.3f}") == []
+    assert primary.executed == ["SELECT 1"]
+    assert first.executed + second.executed == []
+
+
+@pytest.mark.parametrize("cookie", [f"{time.time() - 1:.3f}", "garbage"])
+def test_expired_or_invalid_cookie_reads_from_replica(pools, cookie):
+    primary, first, second = pools
+    _request("GET", cookie=cookie)
+    assert primary.executed == []
+    assert first.executed + second.executed == ["SELECT 1"]
+
+
+def test_no_cookie_without_replicas(pools, monkeypatch):
+    monkeypatch.setattr(db, "_replica_pools", [])
+    assert _request("POST") == []
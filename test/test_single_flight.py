@@ -0,0 +1,142 @@
+"""Single-flight 조회 병합 테스트 (DB 불필요)"""
+import asyncio
+import pytest
+
+from utils.common import deadline
+from utils.database import db
+from utils.database.single_flight import single_flight, single_flight_group
+from utils.errors.exceptions import APIError
+
+
+class FakeModel:
+    def __init__(self, delay: float = 0.05, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.cancelled = 0
+
+    @single_flight
+    async def getItem(self, itemId: str):
+        self.calls.append({"itemId": itemId, "remaining": deadline.remaining(), "primary": db.reads_from_primary()})
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return {"itemId": itemId}
+
+
+async def _with_deadline(timeout, coro):
+    token = deadline.set_deadline(timeout)
+    try:
+        return await coro
+    finally:
+        deadline.reset_deadline(token)
+
+
+def test_concurrent_calls_share_one_query():
+    """같은 인자의 동시 호출은 조회 1번, 같은 결과 객체 / 다른 인자는 별도 조회"""
+    model = FakeModel()
+
+    async def run():
+        return await asyncio.gather(model.getItem("a"), model.getItem("a"), model.getItem("b"))
+
+    first, second, other = asyncio.run(run())
+    assert first is second
+    assert other == {"itemId": "b"}
+    assert [call["itemId"] for call in model.calls] == ["a", "b"]
+    assert not single_flight_group._flights
+
+
+def test_error_propagates_to_all_waiters():
+    """조회 실패는 모든 대기자에게 전달되고, 다음 호출은 새로 조회"""
+    model = FakeModel(error=ValueError("boom"))
+
+    async def run():
+        return await asyncio.gather(model.getItem("a"), model.getItem("a"), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(model.calls) == 1
+
+    model.error = None
+    assert asyncio.run(model.getItem("a")) == {"itemId": "a"}
+    assert len(model.calls) == 2
+
+
+def test_write_epoch_splits_flights():
+    """쓰기 완료 후 시작한 호출은 진행 중인 이전 조회에 합류하지 않음"""
+    model = FakeModel()
+
+    async def run():
+        before = asyncio.ensure_future(model.getItem("a"))
+        await asyncio.sleep(0)
+        db._bump_write_epoch()
+        after = await model.getItem("a")
+        return await before, after
+
+    before, after = asyncio.run(run())
+    assert before is not after
+    assert len(model.calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_others():
+    """대기자 하나가 취소되어도 조회는 계속, 마지막 대기자가 떠나면 조회 취소"""
+    model = FakeModel(delay=0.1)
+
+    async def one_left():
+        leaving = asyncio.ensure_future(model.getItem("a"))
+        staying = asyncio.ensure_future(model.getItem("a"))
+        await asyncio.sleep(0.01)
+        leaving.cancel()
+        return await staying
+
+    assert asyncio.run(one_left()) == {"itemId": "a"}
+    assert model.cancelled == 0
+
+    async def all_left():
+        waiters = [asyncio.ensure_future(model.getItem("b")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(all_left())
+    assert model.cancelled == 1
+    assert not single_flight_group._flights
+
+
+def test_waiter_deadline_is_per_caller():
+    """짧은 마감 시각의 대기자만 504, 조회 Task는 기본 한도 이상의 마감 시각과 키의 라우팅으로 실행"""
+    model = FakeModel(delay=0.1)
+
+    async def run():
+        return await asyncio.gather(
+            _with_deadline(0.01, model.getItem("a")),
+            _with_deadline(5, model.getItem("a")),
+            return_exceptions=True,
+        )
+
+    short, long = asyncio.run(run())
+    assert isinstance(short, APIError) and short.code.name == "REQUEST_TIMEOUT"
+    assert long == {"itemId": "a"}
+    assert len(model.calls) == 1
+    assert model.calls[0]["remaining"] is not None
+    assert model.calls[0]["remaining"] > 0.01
+    assert model.calls[0]["primary"] is True
+
+
+def test_all_waiters_timing_out_cancels_query():
+    """모든 대기자가 마감 시각을 넘기면 조회 Task도 취소 (커넥션을 계속 점유하지 않음)"""
+    model = FakeModel(delay=1)
+
+    async def run():
+        with pytest.raises(APIError):
+            await _with_deadline(0.01, model.getItem("a"))
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert model.cancelled == 1
@@ -0,0 +1,103 @@
+"""미사용 업로드 파일 정리 테스트 (임시 디렉터리 + 가짜 참조 조회, DB 불필요)"""
+import asyncio
+import os
+import time
+import pytest
+
+from models.file_model import file_model
+from utils.common import upload_gc
+from utils.database import db
+
+HASH_USED = "a" * 64
+HASH_UNUSED = "b" * 64
+HASH_RECENT = "c" * 64
+LEGACY_USED = "0b7e7c2e-3f7a-4c1e-9d2b-1f0e5a6b7c8d.png"
+LEGACY_UNUSED = "9f8e7d6c-5b4a-4c3d-8e2f-1a0b9c8d7e6f.jpg"
+VARIANTS = ("thumbnail", "card", "full")
+OLD = time.time() - 7 * 86400
+
+
+def _hashed(contentHash: str, ext: str = ".png"):
+    return [f"{contentHash}{ext}"] + [f"{contentHash}_{variant}.webp" for variant in VARIANTS]
+
+
+@pytest.fixture
+def uploads(tmp_path, monkeypatch):
+    """post 디렉터리에 파일 생성 (RECENT만 유예 기간 이내), 참조 조회는 primary 여부와 함께 기록"""
+    directory = tmp_path / "image" / "post"
+    directory.mkdir(parents=True)
+    recent = set(_hashed(HASH_RECENT)) | {"recent.png.part"}
+    names = _hashed(HASH_USED) + _hashed(HASH_UNUSED) + _hashed(HASH_RECENT) + [
+        LEGACY_USED, LEGACY_UNUSED, "abandoned.png.part", "recent.png.part",
+    ]
+    for name in names:
+        path = directory / name
+        path.write_bytes(b"x" * 10)
+        if name not in recent:
+            os.utime(path, (OLD, OLD))
+
+    referenced = {f"/public/image/post/{HASH_USED}_full.webp", f"/public/image/post/{LEGACY_USED}"}
+    lookups = []
+
+    async def getReferencedUrls(urls):
+        urls = set(urls)
+        lookups.append((urls, db.reads_from_primary()))
+        return urls & referenced
+
+    monkeypatch.setattr(upload_gc, "UPLOAD_ROOT", str(tmp_path))
+    monkeypatch.setattr(file_model, "getReferencedUrls", getReferencedUrls)
+    # replica가 있어도 참조 확인은 primary에서 해야 함
+    monkeypatch.setattr(db, "_replica_pools", ["replica"])
+    return directory, lookups
+
+
+def _collect(**kwargs):
+    return asyncio.run(upload_gc.collect_orphans(grace_seconds=86400, batch_size=4, **kwargs))
+
+
+def test_referenced_files_and_variants_are_kept(uploads):
+    directory, _ = uploads
+    stats = _collect()
+    remaining = set(os.listdir(directory))
+
+    assert set(_hashed(HASH_USED)) <= remaining
+    assert LEGACY_USED in remaining
+    assert not set(_hashed(HASH_UNUSED)) & remaining
+    assert LEGACY_UNUSED not in remaining
+    assert stats["deleted"] == len(_hashed(HASH_UNUSED)) + 1
+    assert stats["bytesReclaimed"] == (stats["deleted"] + stats["tempFilesDeleted"]) * 10
+
+
+def test_files_within_grace_period_are_kept(uploads):
+    directory, _ = uploads
+    _collect()
+    remaining = set(os.listdir(directory))
+    assert set(_hashed(HASH_RECENT)) <= remaining
+    assert "recent.png.part" in remaining
+
+
+def test_abandoned_temp_files_are_removed(uploads):
+    directory, _ = uploads
+    stats = _collect()
+    assert "abandoned.png.part" not in os.listdir(directory)
+    assert stats["tempFilesDeleted"] == 1
+
+
+def test_dry_run_deletes_nothing(uploads):
+    directory, _ = uploads
+    before = set(os.listdir(directory))
+    stats = _collect(dry_run=True)
+    assert set(os.listdir(directory)) == before
+    assert stats["deleted"] == len(_hashed(HASH_UNUSED)) + 1
+    assert stats["tempFilesDeleted"] == 1
+
+
+def test_reference_check_reads_from_primary(uploads):
+    """방금 참조된 파일이 replica 지연으로 삭제되지 않도록 참조 확인은 primary에서"""
+    _, lookups = uploads
+    _collect(dry_run=True)
+    assert lookups
+    assert all(primary for _, primary in lookups)
+    # 파생본은 같은 이름의 full 파생본 URL로 참조 여부 판단
+    checked = set().union(*(urls for urls, _ in lookups))
+    assert f"/public/image/post/{HASH_USED}_full.webp" in checked
@@ -0,0 +1,76 @@
+"""
+동시 실행 수 제한 (요청 수락 제어, DB 커넥션 풀 크기 조절에서 사용)
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수 제한 + 제한된 대기열
+    - 실행 중인 요청이 끝나면 대기 중인 가장 오래된 요청에 자리를 넘김 (FIFO)
+    - resize로 실행 중에도 한도 변경 가능 (줄이면 실행 중인 작업이 끝나는 대로 반영)
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.rejected = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """실행 자리 획득 (대기열이 가득 찼거나 대기 시간이 지나면 False)"""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            # 자리를 넘겨받은 직후 취소(클라이언트 연결 종료)되면 다음 대기자에게 반환
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def release(self) -> None:
+        # 한도 안이면 자리를 대기자에게 그대로 넘기고(active 유지), 없으면 반환
+        if self.active <= self.limit:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+    def resize(self, limit: int) -> None:
+        """한도 변경 (늘어난 자리는 대기자에게 바로 배정)"""
+        self.limit = limit
+        while self.active < self.limit and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
@@ -0,0 +1,54 @@
+"""
+요청 마감 시각 (deadline)
+- DeadlineMiddleware가 요청마다 경로별 처리 시간 한도(request_timeouts, 없으면 request_timeout)로 마감 시각을 설정
+- DB 계층(utils.database.db)은 남은 시간을 쿼리 시간 한도(MAX_EXECUTION_TIME 힌트 + 클라이언트 측 타임아웃)로 사용
+- 컨텍스트 변수로 전달되므로 요청에서 만든 Task도 같은 마감 시각을 따름
+  (여러 요청이 공유하는 single-flight 조회는 기본 한도 이상의 마감 시각으로 따로 실행하고, 대기자마다 각자 마감 시각 적용)
+"""
+
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+from config import settings
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def parse_timeouts(rules: Dict[str, float]) -> List[Tuple[str, str, float]]:
+    """{"GET /v1/posts": 5.0} → (메서드, 경로 접두사, 초) 목록 (긴 접두사 우선)"""
+    parsed = []
+    for route, timeout in rules.items():
+        method, prefix = route.split(" ", 1)
+        parsed.append((method.upper(), prefix.strip(), float(timeout)))
+    return sorted(parsed, key=lambda rule: len(rule[1]), reverse=True)
+
+
+class RouteTimeouts:
+    """경로별 처리 시간 한도 (0 이하면 마감 시각 없음)"""
+
+    def __init__(self, rules: List[Tuple[str, str, float]], default: float):
+        self.rules = rules
+        self.default = default
+
+    def match(self, method: str, path: str) -> float:
+        for ruleMethod, prefix, timeout in self.rules:
+            if ruleMethod == method and path.startswith(prefix):
+                return timeout
+        return self.default
+
+
+route_timeouts = RouteTimeouts(parse_timeouts(settings.request_timeouts), settings.request_timeout)
+
+
+def set_deadline(timeout: float) -> Token:
+    return _deadline.set(time.monotonic() + timeout if timeout > 0 else None)
+
+
+def reset_deadline(token: Token) -> None:
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """마감까지 남은 시간 (초, 마감 시각이 없으면 None, 지났으면 0 이하)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
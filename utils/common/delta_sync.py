@@ -0,0 +1,87 @@
+"""
+변경분 동기화 (since 조회)
+- posts/comments의 changed_at(행이 바뀔 때마다 DB가 갱신, 마이크로초)을 기준으로 since 이후 변경된 행만 조회
+  (게시글 조회수 증가는 changed_at을 그대로 두므로 변경분에 포함되지 않음)
+- since 형식
+  - 이전 응답의 nextSince (그대로 전달)
+  - createdAt/updatedAt 값 등 시간대 없는 ISO 8601 (DB 시간 그대로 비교)
+  - 시간대가 있는 ISO 8601 (예: 2026-01-01T00:00:00Z) 또는 ULID(생성 시각) → Unix 시간으로 비교
+- 한 번에 limit개를 넘으면 hasMore와 함께 마지막 행 위치({changed_at}_{id})를 nextSince로 반환
+  (같은 시각에 바뀐 여러 행(multi-row INSERT 등)도 ID 순으로 이어서 조회)
+- 마지막 페이지의 nextSince는 커밋 직전의 쓰기를 놓치지 않도록 현재 시각에서 delta_sync_overlap만큼 앞당김
+  (겹친 구간의 행은 다시 전송되므로 클라이언트는 ID 기준으로 병합)
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+import ulid
+from config import settings
+from utils.database.db import fetch_one_tuple
+from utils.errors.exceptions import APIError
+from utils.errors.error_codes import ErrorCode
+
+CURSOR_SEPARATOR = "_"
+
+
+class SinceMarker:
+    """since 조회 조건 (afterId가 있으면 같은 시각의 행은 ID 순으로 이어서 조회)"""
+
+    __slots__ = ("sql", "param", "afterId")
+
+    def __init__(self, sql: str, param: Any, afterId: Optional[str] = None):
+        self.sql = sql
+        self.param = param
+        self.afterId = afterId
+
+    def where(self, changedColumn: str, idColumn: str) -> Tuple[str, List[Any]]:
+        if self.afterId is None:
+            return f"{changedColumn} >= {self.sql}", [self.param]
+        return (
+            f"({changedColumn} > {self.sql} OR ({changedColumn} = {self.sql} AND {idColumn} > %s))",
+            [self.param, self.param, self.afterId],
+        )
+
+
+def _invalid_since() -> APIError:
+    return APIError(ErrorCode.INVALID_INPUT, {"since": ["INVALID_FORMAT"]})
+
+
+def parse_since(value: Optional[str]) -> Optional[SinceMarker]:
+    """since 쿼리 파라미터 해석 (없으면 None, 형식이 잘못되면 422)"""
+    if not value:
+        return None
+
+    afterId = None
+    if CURSOR_SEPARATOR in value:
+        value, afterId = value.split(CURSOR_SEPARATOR, 1)
+        if not afterId:
+            raise _invalid_since()
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        if afterId is not None:
+            raise _invalid_since()
+        try:
+            return SinceMarker("FROM_UNIXTIME(%s)", ulid.ULID.from_str(value).timestamp)
+        except ValueError:
+            raise _invalid_since()
+
+    if parsed.tzinfo is not None:
+        return SinceMarker("FROM_UNIXTIME(%s)", parsed.timestamp(), afterId)
+    return SinceMarker("%s", parsed, afterId)
+
+
+async def fetch_cutoff() -> datetime:
+    """마지막 페이지의 nextSince (변경분 조회 전에 DB 시각으로 계산)"""
+    row = await fetch_one_tuple(
+        "SELECT NOW(6) - INTERVAL %s MICROSECOND",
+        (int(settings.delta_sync_overlap * 1_000_000),),
+    )
+    return row[0]
+
+
+def next_since(cutoff: datetime, lastChangedAt: Optional[datetime], lastId: Optional[str], hasMore: bool) -> str:
+    if hasMore:
+        return f"{lastChangedAt.isoformat()}{CURSOR_SEPARATOR}{lastId}"
+    return cutoff.isoformat()
@@ -0,0 +1,41 @@
+"""
+ETag / 조건부 GET 유틸리티
+- ETag는 응답 본문이 아니라 버전 정보(resource_versions, 사용자 필드 등)로 계산하므로
+  304 응답 시 본문 조회/직렬화를 전혀 하지 않음
+- 버전은 본문 조회 전에 읽어야 함 (조회 중 변경이 생기면 본문이 ETag보다 최신이 되어 다음 요청에서 200으로 갱신됨)
+"""
+
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+
+# 폴링 응답은 캐시에 저장하되 매번 재검증 (로그인 여부/사용자별 본문은 Cookie로 구분)
+POLLING_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 정보로 strong ETag 생성"""
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match가 현재 ETag와 일치하는지 (If-None-Match는 weak 비교, RFC 9110 13.1.2)"""
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = POLLING_CACHE_CONTROL
+    response.headers["Vary"] = "Cookie"
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    """본문 없는 304 응답"""
+    return set_etag(Response(status_code=304), etag)
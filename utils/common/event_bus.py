@@ -0,0 +1,125 @@
+"""
+실시간 이벤트 발행/구독 (Server-Sent Events)
+- 프로세스 내 pub/sub: Controller가 쓰기 후 publish, SSE 스트림이 subscribe
+- 토픽: FEED_TOPIC(새 게시글/게시글 변경/좋아요/댓글 수), post_topic(postId)(해당 게시글의 댓글/좋아요)
+- 구독자별 큐는 sse_queue_size로 제한: 가득 차면(느린 클라이언트) 발행자를 막지 않고 해당 구독을 끊고
+  resync 이벤트를 보내 클라이언트가 조건부 GET(ETag)으로 다시 맞추도록 함
+- 워커(프로세스)마다 별도이므로 여러 워커로 실행하면 같은 워커에서 발생한 이벤트만 전달됨
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+from pydantic_core import to_json
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+FEED_TOPIC = "feed"
+RESYNC_EVENT = "resync"
+
+# 큐 항목: (이벤트 ID, 이벤트 이름, 데이터)
+Event = Tuple[int, str, Any]
+
+
+def post_topic(postId: str) -> str:
+    return f"post:{postId}"
+
+
+class Subscription:
+    """구독 1개 (SSE 연결 1개)"""
+
+    def __init__(self, topic: str, maxsize: int):
+        self.topic = topic
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def offer(self, event: Event) -> bool:
+        """큐에 추가 (가득 차면 False)"""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+
+    async def next(self, timeout: float) -> Optional[Event]:
+        """다음 이벤트 (timeout 동안 없으면 None, 큐를 비운 뒤 유실이 있었으면 resync)"""
+        if self.queue.empty() and self.overflowed:
+            return (0, RESYNC_EVENT, {"topic": self.topic})
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """토픽별 구독자 관리 (발행은 동기, 이벤트 루프 안에서만 호출)"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lastEventId = 0
+
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(topic, settings.sse_queue_size)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.topic)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.topic]
+
+    def publish(self, topic: str, event: str, data: Any) -> None:
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+        self._lastEventId += 1
+        for subscription in list(subscribers):
+            if not subscription.offer((self._lastEventId, event, data)):
+                # 밀린 이벤트를 모두 보낸 뒤 resync로 종료되도록 구독 해제
+                self.unsubscribe(subscription)
+                logger.warning(f"SSE subscriber queue full, sending resync: topic={topic}")
+
+    def subscriberCount(self, topic: Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._subscribers.get(topic, ()))
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """SSE 메시지 1개 직렬화 (data는 한 줄 JSON)"""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    return ("\n".join(lines) + "\ndata: ").encode() + to_json(data) + b"\n\n"
+
+
+async def stream_events(topic: str) -> AsyncIterator[bytes]:
+    """
+    토픽을 구독해 이벤트를 SSE 형식으로 전송 (응답 전송이 시작될 때 구독, 종료/연결 끊김 시 해제)
+    - sse_heartbeat_interval 동안 이벤트가 없으면 주석 줄 전송 (프록시 유휴 타임아웃 방지,
+      끊긴 연결은 이 전송이 실패하면서 정리됨)
+    - resync를 보낸 뒤에는 스트림 종료 (클라이언트가 재연결)
+    """
+    subscription = event_bus.subscribe(topic)
+    try:
+        yield b"retry: %d\n\n" % settings.sse_retry_ms
+        while True:
+            item = await subscription.next(settings.sse_heartbeat_interval)
+            if item is None:
+                yield b": keep-alive\n\n"
+                continue
+            event_id, event, data = item
+            yield format_sse(event, data, event_id)
+            if event == RESYNC_EVENT:
+                break
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+event_bus = EventBus()
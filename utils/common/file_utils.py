@@ -1,46 +1,117 @@
+import hashlib
 import os
-import uuid
+import tempfile
+from typing import BinaryIO, Optional
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from utils.common.image_variants import create_variants, touch_variants, variant_path, variants_exist
 from utils.errors.exceptions import APIError
 from utils.errors.error_codes import ErrorCode
 
-ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".JPG", ".JPEG"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+CHUNK_SIZE = 64 * 1024  # 스트리밍 저장 단위
 
-def save_upload_file(file: UploadFile, domain: str) -> str:
+# 매직 바이트 → 저장 확장자 (클라이언트가 보낸 파일명/Content-Type은 신뢰하지 않음)
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
+
+
+def detect_image_extension(header: bytes) -> Optional[str]:
+    """파일 앞부분의 시그니처로 이미지 형식 판별 (지원하지 않는 형식이면 None)"""
+    for signature, extension in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return extension
+    return None
+
+
+def _open_temp_file(upload_path: str):
+    # 원자적 rename을 위해 최종 경로와 같은 디렉토리(같은 파일시스템)에 생성
+    os.makedirs(upload_path, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=upload_path, prefix=".upload-", suffix=".part")
+    return os.fdopen(fd, "wb"), temp_path
+
+
+def _remove_if_exists(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _discard_temp_file(buffer: BinaryIO, temp_path: str) -> None:
+    buffer.close()
+    _remove_if_exists(temp_path)
+
+
+async def save_upload_file(file: UploadFile, domain: str) -> str:
     """
     업로드된 파일을 로컬에 저장하고 URL 경로 반환
     domain: 'post' 또는 'profile'
+    - CHUNK_SIZE 단위로 임시 파일에 스트리밍 저장 (디스크 I/O는 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+    - 크기 제한은 file.size가 아니라 실제로 저장한 바이트 수로 검사
+      (multipart 파서가 이미 본문 전체를 임시 파일로 받아 둔 뒤이므로, 수신 중 제한은 BodyLimitMiddleware가 담당)
+    - 형식은 첫 청크의 매직 바이트로 판별하고, 완료 후 public/image/{domain}으로 원자적 rename
+    - 저장한 원본으로 thumbnail/card/full WebP 파생본을 만들고 full 파생본 URL 반환 (utils.common.image_variants)
+    - 파일명은 내용의 SHA-256이므로 같은 이미지는 한 번만 저장/변환되고 URL은 내용이 바뀌지 않음 (immutable 캐시 가능)
+    - 별도 등록 없이 게시글/프로필에서 참조하지 않는 파일은 utils.common.upload_gc가 정리
     """
-    # 1. 확장자 검증
-    file_extension = os.path.splitext(file.filename)[1]
-    if file_extension not in ALLOWED_EXTENSIONS:
-        raise APIError(ErrorCode.BAD_REQUEST, message=f"허용되지 않은 파일 형식입니다. ({', '.join(ALLOWED_EXTENSIONS)})")
+    sub_dir = f"image/{domain}"
+    upload_path = os.path.join("public", sub_dir)
 
-    # 2. 파일 크기 검증 (FastAPI UploadFile.size 사용)
-    # size가 없는 경우를 대비해 file.file.seek 활용 가능하지만 최신 FastAPI 기준 size 활용
+    # 1. 선언된 크기가 이미 초과면 읽지 않고 거절
     if file.size and file.size > MAX_FILE_SIZE:
         raise APIError(ErrorCode.PAYLOAD_TOO_LARGE, message="파일 크기는 5MB를 초과할 수 없습니다.")
 
-    base_dir = "public"
-    sub_dir = f"image/{domain}"
-    upload_path = os.path.join(base_dir, sub_dir)
-    
-    # 디렉토리 생성 (이미 main.py에서 생성하지만 안전을 위해)
-    if not os.path.exists(upload_path):
-        os.makedirs(upload_path, exist_ok=True)
-        
-    # 파일명 중복 방지를 위한 UUID 추가
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    
-    file_path = os.path.join(upload_path, unique_filename)
-    
-    # 파일 포인터를 처음으로 되돌림 (검증 과정에서 읽었을 수 있음)
-    file.file.seek(0)
-    
-    with open(file_path, "wb") as buffer:
-        buffer.write(file.file.read())
-        
+    await file.seek(0)
+    first_chunk = await file.read(CHUNK_SIZE)
+
+    # 2. 매직 바이트로 형식 검증
+    file_extension = detect_image_extension(first_chunk)
+    if file_extension is None:
+        raise APIError(ErrorCode.BAD_REQUEST, message="허용되지 않은 파일 형식입니다. (png, jpg, gif)")
+
+    # 3. 임시 파일에 스트리밍 저장하며 크기 검사
+    buffer, temp_path = await run_in_threadpool(_open_temp_file, upload_path)
+    try:
+        written = 0
+        digest = hashlib.sha256()
+        chunk = first_chunk
+        while chunk:
+            written += len(chunk)
+            if written > MAX_FILE_SIZE:
+                raise APIError(ErrorCode.PAYLOAD_TOO_LARGE, message="파일 크기는 5MB를 초과할 수 없습니다.")
+            digest.update(chunk)
+            await run_in_threadpool(buffer.write, chunk)
+            chunk = await file.read(CHUNK_SIZE)
+        await run_in_threadpool(buffer.close)
+
+        # 4. 내용 해시 경로로 원자적 이동 (같은 내용이 이미 변환까지 끝났으면 임시 파일만 삭제)
+        content_hash = digest.hexdigest()
+        original_path = os.path.join(upload_path, f"{content_hash}{file_extension}")
+        if variants_exist(original_path):
+            await run_in_threadpool(_discard_temp_file, buffer, temp_path)
+            # 업로드 정리(upload_gc)의 유예 기간이 다시 시작되도록 수정 시각 갱신
+            await run_in_threadpool(touch_variants, original_path)
+        else:
+            await run_in_threadpool(os.replace, temp_path, original_path)
+    except BaseException:
+        # 취소된 경우에도 정리되도록 동기 호출
+        _discard_temp_file(buffer, temp_path)
+        raise
+
+    # 5. 파생본 생성 (시그니처만 맞고 디코딩할 수 없는 파일은 거절)
+    if not variants_exist(original_path):
+        try:
+            await create_variants(original_path)
+        except ValueError:
+            await run_in_threadpool(_remove_if_exists, original_path)
+            raise APIError(ErrorCode.BAD_REQUEST, message="이미지를 처리할 수 없습니다.")
+
+    full_path = variant_path(original_path, "full")
+    file_url = f"/public/{sub_dir}/{os.path.basename(full_path)}"
+
     # 접근 가능한 URL 경로 반환 (실무에서는 도메인 주소를 환경변수에서 가져옴)
     # 여기서는 상대 경로 기반의 URL 반환
-    return f"/public/{sub_dir}/{unique_filename}"
+    return file_url
@@ -0,0 +1,134 @@
+"""
+업로드 이미지 파생본(variant) 생성
+- 원본 하나로 thumbnail/card/full 크기의 WebP 파일을 만들어 카드/아바타에 원본 대신 전송
+- 디코딩/리사이즈/인코딩은 CPU 작업이므로 ProcessPoolExecutor에서 실행 (이벤트 루프와 GIL을 막지 않음)
+- 파일명 규칙: {이름}.{원본 확장자} → {이름}_{variant}.webp
+  API에는 full 파생본 URL을 저장하고, 나머지 파생본 URL은 이 규칙으로 계산 (DB 스키마 변경 없음)
+- 원본은 크기 변경 시 재생성을 위해 보관하지만 API에서는 노출하지 않음
+"""
+
+import asyncio
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+from config import settings
+
+# variant 이름 → 긴 변 최대 픽셀 (원본보다 크게 확대하지 않음)
+VARIANT_SIZES: Dict[str, int] = {
+    "thumbnail": 160,
+    "card": 640,
+    "full": 1600,
+}
+VARIANT_FORMAT = "webp"
+FULL_SUFFIX = f"_full.{VARIANT_FORMAT}"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def variant_path(original_path: str, variant: str) -> str:
+    base, _ = os.path.splitext(original_path)
+    return f"{base}_{variant}.{VARIANT_FORMAT}"
+
+
+def variant_urls(file_url: Optional[str]) -> Optional[Dict[str, str]]:
+    """full 파생본 URL에서 모든 파생본 URL 계산 (파생본이 없는 이전 업로드는 None)"""
+    if not file_url or not file_url.endswith(FULL_SUFFIX):
+        return None
+    base = file_url[: -len(FULL_SUFFIX)]
+    return {name: f"{base}_{name}.{VARIANT_FORMAT}" for name in VARIANT_SIZES}
+
+
+def _render_variants(original_path: str, sizes: Tuple[Tuple[str, int], ...], quality: int) -> None:
+    """(워커 프로세스) 원본을 읽어 파생본 저장 (임시 파일에 쓰고 rename)"""
+    from PIL import Image, ImageOps, ImageSequence
+
+    with Image.open(original_path) as image:
+        animated = getattr(image, "is_animated", False)
+        if animated:
+            frames = [frame.convert("RGBA") for frame in ImageSequence.Iterator(image)]
+            durations = image.info.get("duration", 100)
+        else:
+            image = ImageOps.exif_transpose(image)
+            image.load()
+            frames = [image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")]
+            durations = None
+
+        for name, max_side in sizes:
+            resized = []
+            for frame in frames:
+                frame = frame.copy()
+                frame.thumbnail((max_side, max_side), Image.LANCZOS)
+                resized.append(frame)
+
+            target = variant_path(original_path, name)
+            # 같은 내용의 동시 업로드가 같은 파생본을 만들 수 있으므로 임시 파일명은 호출마다 고유하게
+            temp_path = f"{target}.{uuid.uuid4().hex}.part"
+            save_options = {"format": "WEBP", "quality": quality, "method": 4}
+            if animated:
+                save_options.update(save_all=True, append_images=resized[1:], duration=durations, loop=0)
+            try:
+                resized[0].save(temp_path, **save_options)
+                os.replace(temp_path, target)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # 스레드가 있는 서버 프로세스에서 fork하지 않도록 spawn 사용
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.image_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+async def create_variants(original_path: str) -> str:
+    """
+    원본으로 모든 파생본을 생성하고 full 파생본 경로 반환
+    - 이미지로 디코딩할 수 없으면 ValueError (생성 중이던 파생본은 삭제)
+    - 워커 프로세스가 비정상 종료되면 풀을 재생성하도록 정리 후 BrokenProcessPool 전파
+    """
+    sizes = tuple(VARIANT_SIZES.items())
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            _get_pool(), _render_variants, original_path, sizes, settings.image_webp_quality
+        )
+    except BrokenProcessPool:
+        _remove_variants(original_path)
+        shutdown_pool()
+        raise
+    except Exception as e:
+        _remove_variants(original_path)
+        raise ValueError(f"이미지를 처리할 수 없습니다: {e}") from e
+    return variant_path(original_path, "full")
+
+
+def variants_exist(original_path: str) -> bool:
+    return all(os.path.exists(variant_path(original_path, name)) for name in VARIANT_SIZES)
+
+
+def touch_variants(original_path: str) -> None:
+    for path in [original_path] + [variant_path(original_path, name) for name in VARIANT_SIZES]:
+        if os.path.exists(path):
+            os.utime(path)
+
+
+def _remove_variants(original_path: str) -> None:
+    for name in VARIANT_SIZES:
+        path = variant_path(original_path, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -5,9 +5,18 @@
 """
 
 from typing import Any, Dict, List, Optional
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
 from ..errors.error_codes import ErrorCode, SuccessCode, get_success_message
 
 
+class FastJSONResponse(JSONResponse):
+    """pydantic_core 직렬화기로 한 번에 렌더링 (BaseModel이 포함된 dict를 변환 없이 직렬화)"""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 class StandardResponse:
     """모든 API 응답의 표준 포맷"""
 
@@ -20,6 +29,23 @@ class StandardResponse:
             "data": data if data is not None else {}
         }
 
+    @staticmethod
+    def fast(code: SuccessCode, data: Any = None, status_code: int = 200) -> FastJSONResponse:
+        """
+        성공 응답을 Response로 직접 반환 (DB에서 만든 신뢰 가능한 응답 객체 전용)
+        - Response를 반환하면 FastAPI가 response_model 재검증/재직렬화를 건너뜀 (OpenAPI 스키마는 response_model 기준 유지)
+        - 본문은 response_model 경로와 동일하도록 details(null)까지 포함
+        """
+        return FastJSONResponse(
+            {
+                "code": code.name,
+                "message": "",
+                "data": data if data is not None else {},
+                "details": None,
+            },
+            status_code=status_code,
+        )
+
     @staticmethod
     def error(code: ErrorCode, details: Any = None, message: Optional[str] = None) -> Dict:
         """
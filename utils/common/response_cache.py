@@ -0,0 +1,111 @@
+"""
+응답 캐시 (stale-while-revalidate)
+- 직렬화된 응답 본문(bytes)과 ETag를 키별로 저장
+- ttl 이내: 캐시 그대로 반환
+- ttl ~ ttl + stale_ttl: 이전 본문을 즉시 반환하고 백그라운드 작업 1개가 갱신
+- 그 이후/캐시 없음: 직접 조회 (같은 키의 동시 요청은 하나의 조회를 공유)
+- invalidate() 이후에는 이전 세대에서 시작한 조회 결과를 저장하지 않음
+  (invalidated_within으로 최근 무효화 여부 확인: 로더가 replica 지연을 피해 primary에서 조회할 때 사용)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Set, Tuple
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# 로더 반환값: (응답 본문, ETag)
+Loader = Callable[[], Awaitable[Tuple[bytes, str]]]
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "storedAt")
+
+    def __init__(self, body: bytes, etag: str, storedAt: float):
+        self.body = body
+        self.etag = etag
+        self.storedAt = storedAt
+
+
+class ResponseCache:
+    """프로세스 로컬 응답 캐시 (LRU, 워커마다 별도)"""
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float, max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._generation = 0
+        self._invalidatedAt = float("-inf")
+
+    async def get(self, key: Hashable, loader: Loader) -> CachedResponse:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            age = now - entry.storedAt
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return entry
+            if age < self.ttl + self.stale_ttl:
+                # 갱신은 키당 하나만 (이미 진행 중이면 그대로 stale 반환)
+                if key not in self._inflight:
+                    task = self._start_load(key, loader)
+                    self._background.add(task)
+                    task.add_done_callback(self._on_background_done)
+                return entry
+
+        task = self._inflight.get(key) or self._start_load(key, loader)
+        # 요청이 취소되어도 다른 대기자를 위해 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """모든 키 무효화 (진행 중인 조회는 결과를 저장하지 않음)"""
+        self._generation += 1
+        self._invalidatedAt = time.monotonic()
+        self._entries.clear()
+        self._inflight.clear()
+
+    def invalidated_within(self, seconds: float) -> bool:
+        return time.monotonic() - self._invalidatedAt < seconds
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()  # 실패는 _load에서 로깅됨 (미회수 예외 경고 방지)
+
+    def _start_load(self, key: Hashable, loader: Loader) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(key, loader, self._generation))
+        self._inflight[key] = task
+        return task
+
+    async def _load(self, key: Hashable, loader: Loader, generation: int) -> CachedResponse:
+        try:
+            body, etag = await loader()
+            entry = CachedResponse(body, etag, time.monotonic())
+            if generation == self._generation:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return entry
+        except Exception:
+            logger.exception(f"{self.name} cache load failed: {key}")
+            raise
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+# 게시글 목록(GET /v1/posts) 앞쪽 페이지 캐시
+feed_cache = ResponseCache(
+    "feed",
+    ttl=settings.feed_cache_ttl,
+    stale_ttl=settings.feed_cache_stale_ttl,
+    max_entries=settings.feed_cache_max_entries,
+)
@@ -0,0 +1,150 @@
+"""
+/public 정적 파일 서빙 (사전 압축, 경로별 캐시 정책)
+- 원본 옆의 .br / .gz 사이드카 파일을 Accept-Encoding에 따라 그대로 전송 (요청마다 압축하지 않음)
+- 사이드카가 원본보다 오래되었으면 무시하고 원본을 전송
+- 사이드카 생성: python -m utils.common.static_files public
+"""
+
+import argparse
+import gzip
+import mimetypes
+import os
+import re
+from typing import Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+from utils.middleware.compression_middleware import COMPRESSIBLE_TYPES, accepted_encodings, brotli
+
+# 인코딩별 사이드카 확장자
+SIDECAR_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+
+# 내용 해시 이름 (utils.common.file_utils): {sha256}.ext, {sha256}_{variant}.webp (+ .br/.gz 사이드카)
+HASHED_NAME = re.compile(r"^([0-9a-f]{64})(_[a-z]+)?\.[A-Za-z0-9]+(?:\.(?:br|gz))?$")
+UUID_NAME = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}(_[a-z]+)?\.[A-Za-z0-9]+$")
+
+
+def _is_compressible(path: str) -> bool:
+    media_type, _ = mimetypes.guess_type(path)
+    return bool(media_type) and media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def cache_policy(path: str) -> Tuple[str, Optional[str]]:
+    """
+    경로 분류별 (Cache-Control, 고정 ETag)
+    - 내용 해시 이름 ({sha256}[_{variant}].ext): 내용이 바뀌지 않으므로 immutable, ETag는 해시 기반이라 서버/배포가 달라도 동일
+    - UUID 이름 (이전 업로드): 같은 이름으로 덮어쓰지 않으므로 immutable
+    - 그 외: 짧게 캐시하고 ETag/Last-Modified로 재검증
+    """
+    name = os.path.basename(path)
+    hashed = HASHED_NAME.match(name)
+    if hashed:
+        return IMMUTABLE_CACHE_CONTROL, f'"{hashed.group(1)}{hashed.group(2) or ""}"'
+    if UUID_NAME.match(name):
+        return IMMUTABLE_CACHE_CONTROL, None
+    return REVALIDATE_CACHE_CONTROL, None
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    /public 정적 파일 서빙
+    - .br/.gz 사이드카 우선 전송 (Content-Type은 원본 기준)
+    - 경로 분류별 Cache-Control/ETag (cache_policy)
+    - If-None-Match/If-Modified-Since는 304, Range/If-Range는 206 (FileResponse)
+    - 서버가 ASGI pathsend 확장을 지원하면 FileResponse가 파일 경로만 넘겨 서버가 zero-copy(sendfile)로 전송
+    """
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        path = str(full_path)
+        media_type, _ = mimetypes.guess_type(path)
+        cache_control, etag = cache_policy(path)
+
+        headers = {"Cache-Control": cache_control}
+        sidecar = self._find_sidecar(path, stat_result, request_headers)
+        if sidecar is not None:
+            encoding, path, stat_result = sidecar
+            headers["Content-Encoding"] = encoding
+            if etag:
+                etag = f'{etag[:-1]}-{encoding}"'
+
+        response = FileResponse(path, status_code=status_code, stat_result=stat_result, media_type=media_type, headers=headers)
+        if etag:
+            response.headers["ETag"] = etag
+        if _is_compressible(str(full_path)):
+            response.headers.add_vary_header("Accept-Encoding")
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _find_sidecar(self, full_path: str, stat_result: os.stat_result, request_headers: Headers):
+        if not _is_compressible(full_path):
+            return None
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        # 미리 만든 .br은 서버에 brotli가 없어도 전송 가능, 없으면 .gz로 대체
+        candidates = [e for e in ("br", "gzip") if e in accepted or (e == "gzip" and "*" in accepted)]
+        for encoding in candidates:
+            path = full_path + SIDECAR_SUFFIXES[encoding]
+            try:
+                sidecar_stat = os.stat(path)
+            except OSError:
+                continue
+            if sidecar_stat.st_mtime >= stat_result.st_mtime:
+                return encoding, path, sidecar_stat
+        return None
+
+
+def _write_sidecar(path: str, encoding: str, data: bytes) -> Optional[int]:
+    """사이드카 생성 (압축 효과가 없으면 기존 사이드카를 지우고 None 반환)"""
+    if encoding == "br":
+        compressed = brotli.compress(data, quality=11)
+    else:
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    sidecar_path = path + SIDECAR_SUFFIXES[encoding]
+    if len(compressed) >= len(data):
+        if os.path.exists(sidecar_path):
+            os.remove(sidecar_path)
+        return None
+    with open(sidecar_path, "wb") as f:
+        f.write(compressed)
+    return len(compressed)
+
+
+def precompress(directory: str, min_size: int = 256) -> int:
+    """디렉터리 내 압축 가능한 파일마다 .gz (brotli 설치 시 .br도) 사이드카 생성"""
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(tuple(SIDECAR_SUFFIXES.values())) or not _is_compressible(path):
+                continue
+            if os.path.getsize(path) < min_size:
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            for encoding in encodings:
+                size = _write_sidecar(path, encoding, data)
+                if size is not None:
+                    written += 1
+                    print(f"{path}{SIDECAR_SUFFIXES[encoding]}: {len(data)} -> {size} bytes")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정적 파일 사전 압축 (.gz/.br 사이드카 생성)")
+    parser.add_argument("directory", nargs="?", default="public")
+    parser.add_argument("--min-size", type=int, default=256, help="이보다 작은 파일은 건너뜀 (바이트)")
+    args = parser.parse_args()
+    count = precompress(args.directory, args.min_size)
+    print(f"{count} sidecar file(s) written")
@@ -0,0 +1,140 @@
+"""
+미사용 업로드 파일 정리
+- public/image/{domain} 디렉터리를 batch_size개씩 스캔하고, 유예 기간(grace)보다 오래된 파일만 검사
+- 파일별 후보 URL(자기 자신, 같은 이름의 full 파생본)이 게시글/프로필에서 사용 중이 아니면 삭제
+  (내용 해시 업로드는 원본/파생본 모두 full 파생본 URL로 참조되므로 파일 단위로 독립 판단 가능)
+- 중단된 업로드/파생본 생성의 임시 파일(*.part)도 유예 기간이 지나면 삭제
+- 실행: python -m utils.common.upload_gc [--dry-run] 또는 UPLOAD_GC_INTERVAL 설정 시 서버에서 주기 실행
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from config import settings
+from models.file_model import file_model
+from utils.common.image_variants import FULL_SUFFIX
+from utils.database.db import init_pool, close_pool, primary_reads
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ROOT = "public"
+UPLOAD_DOMAINS = ("post", "profile")
+TEMP_SUFFIX = ".part"
+
+# 스캔 대상 파일: (파일명, 크기, 수정 시각)
+FileEntry = Tuple[str, int, float]
+
+
+def _url(domain: str, name: str) -> str:
+    return f"/public/image/{domain}/{name}"
+
+
+def _candidate_urls(domain: str, name: str) -> List[str]:
+    """파일을 참조할 수 있는 URL (자기 자신 + 같은 이름의 full 파생본)"""
+    stem = name.split(".", 1)[0].split("_", 1)[0]
+    return [_url(domain, name), _url(domain, f"{stem}{FULL_SUFFIX}")]
+
+
+def _scan_batches(directory: str, batch_size: int):
+    with os.scandir(directory) as entries:
+        batch: List[FileEntry] = []
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            batch.append((entry.name, stat.st_size, stat.st_mtime))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _remove(directory: str, names: List[str]) -> None:
+    for name in names:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+
+async def collect_orphans(
+    grace_seconds: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """미사용 업로드 파일 삭제 후 통계 반환 (dry_run이면 삭제하지 않고 집계만)"""
+    grace_seconds = settings.upload_gc_grace if grace_seconds is None else grace_seconds
+    batch_size = batch_size or settings.upload_gc_batch_size
+    cutoff = time.time() - grace_seconds
+    stats = {"scanned": 0, "deleted": 0, "bytesReclaimed": 0, "tempFilesDeleted": 0}
+
+    for domain in UPLOAD_DOMAINS:
+        directory = os.path.join(UPLOAD_ROOT, "image", domain)
+        if not os.path.isdir(directory):
+            continue
+
+        batches = _scan_batches(directory, batch_size)
+        while True:
+            # 디렉터리 읽기/stat도 스레드풀에서 (서버 내 실행 시 이벤트 루프를 막지 않음)
+            batch = await run_in_threadpool(next, batches, None)
+            if batch is None:
+                break
+            stats["scanned"] += len(batch)
+
+            expired = [entry for entry in batch if entry[2] < cutoff]
+            temp_files = [entry for entry in expired if entry[0].endswith(TEMP_SUFFIX)]
+            candidates = {
+                entry[0]: _candidate_urls(domain, entry[0]) for entry in expired if not entry[0].endswith(TEMP_SUFFIX)
+            }
+
+            # 방금 업로드해 참조한 파일이 replica 지연으로 미사용 처리되지 않도록 primary에서 확인
+            with primary_reads():
+                referenced = await file_model.getReferencedUrls({url for urls in candidates.values() for url in urls})
+            orphans = [entry for entry in expired if entry[0] in candidates and not referenced.intersection(candidates[entry[0]])]
+
+            stats["tempFilesDeleted"] += len(temp_files)
+            stats["deleted"] += len(orphans)
+            stats["bytesReclaimed"] += sum(entry[1] for entry in orphans + temp_files)
+            if dry_run:
+                continue
+
+            await run_in_threadpool(_remove, directory, [entry[0] for entry in orphans + temp_files])
+
+    logger.info(f"Upload GC{' (dry run)' if dry_run else ''}: {stats}")
+    return stats
+
+
+async def run_periodically(interval: int) -> None:
+    """서버 백그라운드 작업 (interval초마다 실행, 실패해도 다음 주기에 재시도)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await collect_orphans()
+        except Exception:
+            logger.exception("Upload GC failed")
+
+
+async def _main(args: argparse.Namespace) -> None:
+    await init_pool()
+    try:
+        stats = await collect_orphans(args.grace, args.batch_size, args.dry_run)
+    finally:
+        await close_pool()
+    print(
+        f"scanned={stats['scanned']} deleted={stats['deleted']} "
+        f"temp_files_deleted={stats['tempFilesDeleted']} reclaimed={stats['bytesReclaimed'] / 1024 / 1024:.1f}MB"
+        + (" (dry run)" if args.dry_run else "")
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미사용 업로드 파일 정리")
+    parser.add_argument("--grace", type=int, default=None, help="이 시간(초)보다 오래된 파일만 삭제 (기본: UPLOAD_GC_GRACE)")
+    parser.add_argument("--batch-size", type=int, default=None, help="한 번에 스캔/조회할 파일 수 (기본: UPLOAD_GC_BATCH_SIZE)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상과 회수 용량만 출력")
+    asyncio.run(_main(parser.parse_args()))
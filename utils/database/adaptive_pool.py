@@ -0,0 +1,112 @@
+"""
+커넥션 풀 크기 자동 조절
+- aiomysql 풀은 생성 후 크기를 바꿀 수 없으므로 최대 크기(db_pool_max_size)로 만들고,
+  동시에 꺼낼 수 있는 커넥션 수(limit)를 db_pool_min_size ~ db_pool_max_size 사이에서 조절 (시작값은 풀별 설정 크기)
+- db_pool_resize_interval마다 그동안의 커넥션 대기 시간과 최대 동시 사용 수로 결정하고 로그 기록
+  - limit 자리를 db_pool_grow_wait 이상 기다린 획득이 있으면 limit을 절반만큼 늘림 (빠르게 확장,
+    새 커넥션 연결 시간은 크기를 늘려도 줄지 않으므로 제외)
+  - 대기가 없고 최대 동시 사용 수가 limit * db_pool_shrink_utilization 이하면 1 줄임 (천천히 축소)
+- 줄인 뒤에는 반환되는 커넥션 중 limit을 넘는 만큼 닫아 실제 연결 수도 줄임
+- db_pool_adaptive=false면 limit을 시작값으로 고정
+"""
+
+import asyncio
+import logging
+import sys
+import time
+import aiomysql
+from config import settings
+from utils.common.concurrency import ConcurrencyLimiter
+
+logger = logging.getLogger("db")
+
+
+class AdaptivePool:
+    """aiomysql 풀 + 크기 조절 (acquire/release 외에는 aiomysql 풀과 같은 속성 제공)"""
+
+    def __init__(self, name: str, pool: aiomysql.Pool, minsize: int, maxsize: int, initial: int):
+        self.name = name
+        self.pool = pool
+        self.minsize = minsize
+        self.maxsize = maxsize
+        # 대기 시간은 acquire에서 직접 제한하므로 대기열 크기는 제한하지 않음
+        self.limiter = ConcurrencyLimiter(
+            name, min(max(initial, minsize), maxsize), queue_size=sys.maxsize, queue_timeout=settings.db_acquire_timeout
+        )
+        self._resetWindow(time.monotonic())
+
+    @property
+    def limit(self) -> int:
+        return self.limiter.limit
+
+    @property
+    def size(self) -> int:
+        return self.pool.size
+
+    @property
+    def freesize(self) -> int:
+        return self.pool.freesize
+
+    def _resetWindow(self, now: float) -> None:
+        self._windowStart = now
+        self._acquires = 0
+        self._waited = 0
+        self._maxWait = 0.0
+        self._peak = self.limiter.active
+
+    def _record(self, wait: float) -> None:
+        self._acquires += 1
+        self._maxWait = max(self._maxWait, wait)
+        if wait >= settings.db_pool_grow_wait:
+            self._waited += 1
+        self._peak = max(self._peak, self.limiter.active)
+
+    async def acquire(self) -> aiomysql.Connection:
+        """커넥션 획득 (limit 자리 대기 + 풀 획득을 합쳐 db_acquire_timeout을 넘으면 asyncio.TimeoutError)"""
+        started = time.monotonic()
+        admitted = await self.limiter.acquire()
+        waited = time.monotonic() - started
+        self._record(waited)
+        if not admitted:
+            raise asyncio.TimeoutError()
+        try:
+            conn = await asyncio.wait_for(self.pool.acquire(), max(settings.db_acquire_timeout - waited, 0.001))
+        except BaseException:
+            self.limiter.release()
+            raise
+        return conn
+
+    async def release(self, conn: aiomysql.Connection) -> None:
+        if self.pool.size > self.limiter.limit and not conn.closed:
+            conn.close()
+        try:
+            await self.pool.release(conn)
+        finally:
+            self.limiter.release()
+        self._maybeResize()
+
+    def _maybeResize(self) -> None:
+        now = time.monotonic()
+        if now - self._windowStart < settings.db_pool_resize_interval:
+            return
+
+        limit = self.limiter.limit
+        newLimit, reason = limit, ""
+        if settings.db_pool_adaptive:
+            if self._waited:
+                newLimit = min(self.maxsize, limit + max(1, limit // 2))
+                reason = f"{self._waited}/{self._acquires} acquires waited (max {self._maxWait * 1000:.1f}ms)"
+            elif self._peak <= limit * settings.db_pool_shrink_utilization:
+                newLimit = max(self.minsize, limit - 1)
+                reason = f"peak in use {self._peak}/{limit}"
+
+        if newLimit != limit:
+            self.limiter.resize(newLimit)
+            logger.info(f"DB pool '{self.name}' resized {limit} -> {newLimit}: {reason}")
+        self._resetWindow(now)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    async def wait_closed(self) -> None:
+        await self.pool.wait_closed()
@@ -1,36 +1,177 @@
-from typing import Any, Dict, Iterable, Optional
+"""
+MySQL 커넥션 풀 및 쿼리 실행기
+- 쓰기(execute)와 트랜잭션(transaction, 안의 조회 포함)은 primary 풀 사용
+- 조회(fetch_*)는 db_replica_hosts가 설정되면 replica 풀을 차례로 사용 (replica 장애 시 primary로 대체)
+- read-your-writes: 요청에서 쓰기가 발생하면 이후 조회와, db_read_your_writes_window 동안의 같은 클라이언트
+  요청(ReadRoutingMiddleware가 쿠키로 표시)의 조회는 primary 사용
+- 풀 크기는 커넥션 대기 시간/사용률에 따라 자동 조절 (utils.database.adaptive_pool)
+- 요청 마감 시각(utils.common.deadline)이 있으면 쿼리마다 남은 시간을 실행 시간 한도로 적용하고,
+  초과하거나 요청이 취소되면(클라이언트 연결 종료) 실행 중인 쿼리를 KILL QUERY로 종료
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import asyncio
+import itertools
 import logging
 import aiomysql
 from config import settings
+from utils.errors.exceptions import APIError
+from utils.errors.error_codes import ErrorCode
+from utils.database.adaptive_pool import AdaptivePool
+from utils.common.deadline import remaining
 
 
-_pool: Optional[aiomysql.Pool] = None
+_pool: Optional[AdaptivePool] = None
+_replica_pools: List[AdaptivePool] = []
+_replica_cursor = itertools.count()
 _logger = logging.getLogger("db")
 
+# MAX_EXECUTION_TIME을 넘어 서버가 중단한 SELECT의 에러 코드 (ER_QUERY_TIMEOUT)
+ER_QUERY_TIMEOUT = 3024
+# 진행 중인 KILL QUERY 작업 (요청이 끝나도 완료될 때까지 참조 유지)
+_kill_tasks: Set[asyncio.Task] = set()
 
-async def init_pool() -> None:
-    global _pool
-    if _pool is not None:
-        return
-    _pool = await aiomysql.create_pool(
-        host=settings.db_host,
-        port=settings.db_port,
+# 쓰기 완료(commit) 횟수: single-flight 조회가 쓰기 이전에 시작된 조회 결과를 공유하지 않도록 사용
+_write_epoch = 0
+
+
+class ReadRouting:
+    """요청 단위 조회 라우팅 상태 (primary: 조회를 primary로, wrote: 이 요청에서 쓰기 발생)"""
+
+    __slots__ = ("primary", "wrote")
+
+    def __init__(self, primary: bool = False):
+        self.primary = primary
+        self.wrote = False
+
+
+_read_routing: ContextVar[Optional[ReadRouting]] = ContextVar("db_read_routing", default=None)
+
+
+def write_epoch() -> int:
+    return _write_epoch
+
+
+def _bump_write_epoch(read_your_writes: bool = True) -> None:
+    global _write_epoch
+    _write_epoch += 1
+    routing = _read_routing.get()
+    if routing is not None and read_your_writes:
+        routing.wrote = True
+
+
+def bind_read_routing(primary: bool = False) -> ReadRouting:
+    """현재 요청(컨텍스트)의 조회 라우팅 상태 설정 (ReadRoutingMiddleware에서 호출)"""
+    routing = ReadRouting(primary)
+    _read_routing.set(routing)
+    return routing
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """블록 안의 조회를 primary로 (replica 지연을 허용할 수 없는 조회: 변경분 동기화, 업로드 정리 등)"""
+    token = _read_routing.set(ReadRouting(primary=True))
+    try:
+        yield
+    finally:
+        _read_routing.reset(token)
+
+
+def reads_from_primary() -> bool:
+    if not _replica_pools:
+        return True
+    routing = _read_routing.get()
+    return routing is not None and (routing.primary or routing.wrote)
+
+
+def has_replicas() -> bool:
+    return bool(_replica_pools)
+
+
+def _parse_host(spec: str) -> Tuple[str, int]:
+    host, _, port = spec.partition(":")
+    return host, int(port) if port else settings.db_port
+
+
+async def _create_pool(name: str, host: str, port: int, size: int) -> AdaptivePool:
+    """size: 시작 크기 (db_pool_min_size ~ db_pool_max_size 사이에서 자동 조절)"""
+    minsize = min(settings.db_pool_min_size, size)
+    maxsize = max(settings.db_pool_max_size, size)
+    pool = await aiomysql.create_pool(
+        host=host,
+        port=port,
         user=settings.db_user,
         password=settings.db_password,
         db=settings.db_name,
-        minsize=1,
-        maxsize=settings.db_pool_size,
+        minsize=minsize,
+        maxsize=maxsize,
         autocommit=False,
+        pool_recycle=settings.db_pool_recycle,
     )
+    return AdaptivePool(name, pool, minsize, maxsize, size)
+
+
+async def init_pool() -> None:
+    global _pool
+    if _pool is not None:
+        return
+    _pool = await _create_pool("primary", settings.db_host, settings.db_port, settings.db_pool_size)
+    for spec in settings.db_replica_hosts:
+        host, port = _parse_host(spec)
+        _replica_pools.append(await _create_pool(f"replica:{spec}", host, port, settings.db_replica_pool_size))
 
 
 async def close_pool() -> None:
     global _pool
     if _pool is None:
         return
-    _pool.close()
-    await _pool.wait_closed()
+    for pool in [_pool] + _replica_pools:
+        pool.close()
+        await pool.wait_closed()
     _pool = None
+    _replica_pools.clear()
+
+
+async def _ping_pool(pool: AdaptivePool) -> None:
+    # 시작 크기만큼 동시에 꺼내 미리 연결 (하나씩 꺼내면 같은 커넥션만 반복 확인)
+    results = await asyncio.gather(*(pool.acquire() for _ in range(pool.limit)), return_exceptions=True)
+    conns = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        # 끊긴 커넥션(wait_timeout 등)은 ping이 재연결
+        await asyncio.gather(*(conn.ping() for conn in conns))
+    finally:
+        for conn in conns:
+            await pool.release(conn)
+
+
+async def warm_pool() -> None:
+    """
+    풀마다 시작 크기만큼 커넥션을 열어 ping으로 확인 (서버 시작 시 warm-up)
+    - replica는 실패해도 조회가 primary로 대체되므로 경고만 남김
+    """
+    await _ensure_pool()
+    await _ping_pool(_pool)
+    for pool in _replica_pools:
+        try:
+            await _ping_pool(pool)
+        except (asyncio.TimeoutError, aiomysql.Error, OSError) as e:
+            _logger.warning(f"Replica warm-up failed: {type(e).__name__} {e}")
+
+
+async def ping() -> bool:
+    """primary 연결 가능 여부 (readiness 검사용)"""
+    try:
+        async with _acquire() as conn:
+            await conn.ping()
+        return True
+    except (APIError, asyncio.TimeoutError, aiomysql.Error, OSError) as e:
+        _logger.warning(f"DB ping failed: {type(e).__name__} {e}")
+        return False
 
 
 async def _ensure_pool() -> None:
@@ -38,20 +179,129 @@ async def _ensure_pool() -> None:
         await init_pool()
 
 
+@asynccontextmanager
+async def _acquire(readonly: bool = False) -> AsyncIterator[aiomysql.Connection]:
+    """풀에서 커넥션 획득 (_checkout 참고)"""
+    async with _checkout(readonly) as (_, conn):
+        yield conn
+
+
+@asynccontextmanager
+async def _checkout(readonly: bool = False) -> AsyncIterator[Tuple[AdaptivePool, aiomysql.Connection]]:
+    """
+    풀에서 커넥션 획득 (커넥션을 꺼낸 풀도 함께 반환)
+    - readonly이고 primary를 써야 하는 상황이 아니면 replica 풀을 차례로 사용 (실패하면 primary)
+    - db_acquire_timeout 안에 빈 커넥션이 없으면 무한정 기다리지 않고 503 (DB가 느려졌을 때 요청이 쌓이지 않도록)
+    """
+    await _ensure_pool()
+    if _pool is None:
+        raise RuntimeError("DB pool is not initialized")
+
+    pool, conn = _pool, None
+    if readonly and not reads_from_primary():
+        replica = _replica_pools[next(_replica_cursor) % len(_replica_pools)]
+        try:
+            pool, conn = replica, await replica.acquire()
+        except (asyncio.TimeoutError, aiomysql.Error, OSError) as e:
+            _logger.warning(f"Replica unavailable, reading from primary: {type(e).__name__} {e}")
+            pool = _pool
+
+    if conn is None:
+        try:
+            conn = await pool.acquire()
+        except asyncio.TimeoutError:
+            _logger.warning(
+                f"DB pool acquire timed out after {settings.db_acquire_timeout}s "
+                f"(pool={pool.name}, limit={pool.limit}, size={pool.size}, free={pool.freesize})"
+            )
+            raise APIError(ErrorCode.SERVICE_UNAVAILABLE, message="DB 커넥션을 얻지 못했습니다.")
+
+    try:
+        yield pool, conn
+    finally:
+        await pool.release(conn)
+
+
+def _timeout_error() -> APIError:
+    return APIError(ErrorCode.REQUEST_TIMEOUT, message="쿼리 실행 시간이 요청 처리 시간 한도를 넘었습니다.")
+
+
+def _with_time_limit(query: str, timeout: float) -> str:
+    """SELECT에 MAX_EXECUTION_TIME 힌트 추가 (MySQL은 읽기 전용 SELECT에만 적용)"""
+    stripped = query.lstrip()
+    if stripped[:6].upper() != "SELECT":
+        return query
+    return f"SELECT /*+ MAX_EXECUTION_TIME({max(1, int(timeout * 1000))}) */{stripped[6:]}"
+
+
+async def _kill_query(pool: AdaptivePool, threadId: int) -> None:
+    """thread id는 서버마다 따로 매겨지므로 쿼리를 실행한 서버(풀)에서 KILL QUERY"""
+    try:
+        conn = await pool.acquire()
+    except Exception as e:
+        _logger.warning(f"KILL QUERY {threadId} skipped (pool={pool.name}): {type(e).__name__} {e}")
+        return
+    try:
+        async with conn.cursor() as cursor:
+            await cursor.execute("KILL QUERY %s", (threadId,))
+    except Exception as e:
+        # 이미 끝난 쿼리(Unknown thread id) 등
+        _logger.warning(f"KILL QUERY {threadId} failed (pool={pool.name}): {type(e).__name__} {e}")
+    finally:
+        await pool.release(conn)
+
+
+def _abort(pool: AdaptivePool, conn: aiomysql.Connection) -> None:
+    """실행 중인 쿼리 중단 (커넥션은 닫아 풀에 반환되지 않게 하고, 서버의 쿼리는 같은 풀의 다른 커넥션에서 KILL QUERY)"""
+    threadId = conn.thread_id()
+    conn.close()
+    task = asyncio.ensure_future(_kill_query(pool, threadId))
+    _kill_tasks.add(task)
+    task.add_done_callback(_kill_tasks.discard)
+
+
+async def _run_query(
+    pool: AdaptivePool, conn: aiomysql.Connection, cursor: aiomysql.Cursor, query: str, params: Optional[Iterable[Any]]
+) -> None:
+    """
+    마감 시각을 적용해 쿼리 실행
+    - 서버: SELECT는 MAX_EXECUTION_TIME 힌트로 남은 시간이 지나면 중단 (504)
+    - 클라이언트: 남은 시간 + db_deadline_grace 안에 끝나지 않거나(쓰기 포함) 요청이 취소되면 _abort
+    """
+    timeout = remaining()
+    try:
+        if timeout is None:
+            await cursor.execute(query, params or ())
+        elif timeout <= 0:
+            raise _timeout_error()
+        else:
+            await asyncio.wait_for(
+                cursor.execute(_with_time_limit(query, timeout), params or ()),
+                timeout + settings.db_deadline_grace,
+            )
+    except asyncio.TimeoutError:
+        _abort(pool, conn)
+        raise _timeout_error()
+    except asyncio.CancelledError:
+        _abort(pool, conn)
+        raise
+    except aiomysql.OperationalError as e:
+        if e.args and e.args[0] == ER_QUERY_TIMEOUT:
+            raise _timeout_error()
+        raise
+
+
 async def _execute(
     query: str,
     params: Optional[Iterable[Any]] = None,
     fetchone: bool = False,
     fetchall: bool = False,
+    cursor_class: type = aiomysql.DictCursor,
 ) -> Any:
-    await _ensure_pool()
-    if _pool is None:
-        raise RuntimeError("DB pool is not initialized")
-
-    async with _pool.acquire() as conn:
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
+    async with _checkout(readonly=True) as (pool, conn):
+        async with conn.cursor(cursor_class) as cursor:
             try:
-                await cursor.execute(query, params or ())
+                await _run_query(pool, conn, cursor, query, params)
                 result = None
                 if fetchone:
                     result = await cursor.fetchone()
@@ -60,7 +310,8 @@ async def _execute(
                 await conn.commit()
                 return result
             except Exception as e:
-                await conn.rollback()
+                if not conn.closed:
+                    await conn.rollback()
                 _logger.error(f"DB Error: {str(e)} | Query: {query} | Params: {params}")
                 raise e
 
@@ -73,18 +324,46 @@ async def fetch_all(query: str, params: Optional[Iterable[Any]] = None) -> Itera
     return await _execute(query, params=params, fetchall=True)
 
 
-async def execute(query: str, params: Optional[Iterable[Any]] = None) -> int:
-    await _ensure_pool()
-    if _pool is None:
-        raise RuntimeError("DB pool is not initialized")
+async def fetch_one_tuple(query: str, params: Optional[Iterable[Any]] = None) -> Optional[Tuple[Any, ...]]:
+    """SELECT 컬럼 순서의 tuple row 조회 (레코드 매핑용, dict 생성 생략)"""
+    return await _execute(query, params=params, fetchone=True, cursor_class=aiomysql.Cursor)
+
 
-    async with _pool.acquire() as conn:
+async def fetch_all_tuples(query: str, params: Optional[Iterable[Any]] = None) -> Sequence[Tuple[Any, ...]]:
+    """SELECT 컬럼 순서의 tuple row 목록 조회 (레코드 매핑용, dict 생성 생략)"""
+    return await _execute(query, params=params, fetchall=True, cursor_class=aiomysql.Cursor)
+
+
+async def execute(query: str, params: Optional[Iterable[Any]] = None, read_your_writes: bool = True) -> int:
+    """
+    쓰기 쿼리 실행 (primary)
+    - read_your_writes=False: 이 요청의 이후 조회를 primary로 보내지 않음 (조회수처럼 바로 다시 읽을 필요 없는 쓰기)
+    """
+    async with _checkout() as (pool, conn):
         async with conn.cursor() as cursor:
             try:
-                await cursor.execute(query, params or ())
+                await _run_query(pool, conn, cursor, query, params)
                 await conn.commit()
                 return cursor.rowcount
             except Exception as e:
-                await conn.rollback()
+                if not conn.closed:
+                    await conn.rollback()
                 _logger.error(f"DB Error: {str(e)} | Query: {query} | Params: {params}")
                 raise e
+            finally:
+                _bump_write_epoch(read_your_writes)
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[aiomysql.Connection]:
+    """하나의 커넥션에서 여러 쿼리를 묶어 실행 (정상 종료 시 commit, 예외 시 rollback)"""
+    async with _acquire() as conn:
+        try:
+            yield conn
+            await conn.commit()
+        except Exception as e:
+            await conn.rollback()
+            _logger.error(f"DB Transaction Error: {str(e)}")
+            raise e
+        finally:
+            _bump_write_epoch()
@@ -0,0 +1,107 @@
+"""
+Single-flight 조회 병합
+- 같은 인자로 동시에 호출된 모델 조회는 하나의 쿼리(Task)를 공유하고 같은 결과를 반환
+- 쓰기가 완료(write_epoch 변경)된 뒤 시작한 호출은 이전 조회에 합류하지 않음 (쓰기 직후 재조회는 항상 새 쿼리)
+- primary 조회(read-your-writes)와 replica 조회는 서로 합류하지 않음
+- 조회 Task는 첫 호출의 컨텍스트를 그대로 물려받지 않고 새 컨텍스트에서 실행
+  - 조회 라우팅: 키의 primary/replica 구분만 적용
+  - 마감 시각: 첫 호출의 남은 시간과 기본 처리 시간 한도(request_timeout) 중 긴 쪽
+    (짧은 한도의 요청 하나 때문에 다른 대기자가 504를 받지 않으면서, 쿼리에는 여전히 한도 적용)
+- 대기자마다 자기 마감 시각까지만 기다리고(초과 시 504), 마지막 대기자가 떠나면(시간 초과/연결 종료)
+  조회 Task를 취소해 실행 중인 쿼리도 중단 (DB 계층의 KILL QUERY)
+- 결과 객체는 대기자 전원이 공유하므로 호출 측에서 수정하지 않아야 함 (레코드는 replace로 복사)
+"""
+
+import asyncio
+import contextvars
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+from config import settings
+from utils.common.deadline import remaining, set_deadline
+from utils.errors.exceptions import APIError
+from utils.errors.error_codes import ErrorCode
+from utils.database.db import bind_read_routing, reads_from_primary, write_epoch
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("epoch", "task", "waiters")
+
+    def __init__(self, epoch: int, task: asyncio.Task):
+        self.epoch = epoch
+        self.task = task
+        self.waiters = 0
+
+
+def _flight_timeout() -> Optional[float]:
+    """조회 Task의 처리 시간 한도 (None이면 한도 없음)"""
+    timeout = remaining()
+    if settings.request_timeout > 0:
+        timeout = max(timeout or 0.0, settings.request_timeout)
+    return timeout
+
+
+def _flight_context(primary: bool) -> contextvars.Context:
+    context = contextvars.Context()
+    context.run(bind_read_routing, primary)
+    timeout = _flight_timeout()
+    if timeout is not None:
+        context.run(set_deadline, timeout)
+    return context
+
+
+class SingleFlight:
+    """키별 진행 중인 조회 Task 관리"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]], primary: bool = False) -> T:
+        epoch = write_epoch()
+        flight = self._flights.get(key)
+        if flight is None or flight.epoch != epoch:
+            task = _flight_context(primary).run(asyncio.ensure_future, fn())
+            flight = _Flight(epoch, task)
+            self._flights[key] = flight
+            task.add_done_callback(lambda _: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            # 한 대기자가 취소되거나 마감 시각을 넘겨도 다른 대기자의 조회는 계속 진행
+            timeout = remaining()
+            if timeout is None:
+                return await asyncio.shield(flight.task)
+            try:
+                return await asyncio.wait_for(asyncio.shield(flight.task), max(timeout, 0))
+            except asyncio.TimeoutError:
+                if flight.task.done():
+                    raise
+                raise APIError(ErrorCode.REQUEST_TIMEOUT, message="쿼리 실행 시간이 요청 처리 시간 한도를 넘었습니다.")
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # 새 호출이 취소 중인 Task에 합류하지 않도록 먼저 제거
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+single_flight_group = SingleFlight()
+
+
+def single_flight(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """모델 조회 메서드용 데코레이터 (키: 메서드 이름 + 조회 대상(primary/replica) + 인자)"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        if not settings.db_single_flight:
+            return await method(self, *args, **kwargs)
+        primary = reads_from_primary()
+        key = (method.__qualname__, primary, args, tuple(sorted(kwargs.items())))
+        return await single_flight_group.do(key, lambda: method(self, *args, **kwargs), primary)
+
+    return wrapper
@@ -15,6 +15,8 @@ class ErrorCode(Enum):
     CONFLICT = (409, "리소스 충돌이 발생했습니다.")
     TOO_MANY_REQUEST = (429, "너무 많은 요청이 발생했습니다.")
     INTERNAL_SERVER_ERROR = (500, "서버 내부 오류가 발생했습니다.")
+    SERVICE_UNAVAILABLE = (503, "일시적으로 요청을 처리할 수 없습니다.")
+    REQUEST_TIMEOUT = (504, "요청 처리 시간이 초과되었습니다.")
 
     # --- 검증 및 입력 에러 ---
     INVALID_INPUT = (422, "입력 값이 올바르지 않습니다.")
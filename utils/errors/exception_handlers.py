@@ -24,6 +24,8 @@ def _map_http_status_to_error_code(status_code: int) -> ErrorCode:
         422: ErrorCode.INVALID_INPUT,
         429: ErrorCode.TOO_MANY_REQUEST,
         500: ErrorCode.INTERNAL_SERVER_ERROR,
+        503: ErrorCode.SERVICE_UNAVAILABLE,
+        504: ErrorCode.REQUEST_TIMEOUT,
     }
     return mapping.get(status_code, ErrorCode.INTERNAL_SERVER_ERROR)
 
@@ -1,56 +1,83 @@
+import json
 import time
 import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from config import settings
+from utils.middleware.request_id_middleware import request_id_ctx
 
 logger = logging.getLogger("access_logger")
+# 트래픽 리플레이용 구조화 캡처 로거 (main.py에서 전용 핸들러 연결)
+capture_logger = logging.getLogger("access_capture")
 
 class AccessLogMiddleware(BaseHTTPMiddleware):
     """
     모든 HTTP 요청과 응답을 로깅하는 미들웨어.
     - 요청: Method, URL, Client IP
     - 응답: Status Code, 처리 시간(ms)
+    - 캡처 모드(access_log_capture_path 설정 시): 제외 경로를 포함한 모든 요청을 JSON Lines로 기록
     """
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
-        
+
         # 요청 정보 추출
         method = request.method
         path = request.url.path
         client_ip = request.client.host if request.client else "unknown"
-        
+        capture = settings.access_log_capture_path is not None
+
         # 특정 경로 제외 (정적 파일 및 빈번한 폴링성 요청)
         # /public: 정적 파일
         # /v1/posts: 게시글 목록/상세/댓글 (폴링성)
         # /v1/users/me: 내 정보 조회 (폴링성)
         excluded_paths = ["/v1/posts", "/v1/users/me"]
-        
+
         is_excluded = (
-            path.startswith("/public") or 
+            path.startswith("/public") or
             path in excluded_paths or
             (path.startswith("/v1/posts/") and not path.endswith("/likes"))
         )
 
-        if is_excluded:
+        if is_excluded and not capture:
             return await call_next(request)
 
         # 요청 로깅
-        logger.info(f"Request: {method} {path} - IP: {client_ip}")
-        
+        if not is_excluded:
+            logger.info(f"Request: {method} {path} - IP: {client_ip}")
+
         try:
             response = await call_next(request)
-            
+
             # 처리 시간 계산
             process_time = (time.time() - start_time) * 1000
             status_code = response.status_code
-            
+
             # 응답 로깅
-            logger.info(f"Response: {method} {path} - Status: {status_code} - Time: {process_time:.2f}ms")
-            
+            if not is_excluded:
+                logger.info(f"Response: {method} {path} - Status: {status_code} - Time: {process_time:.2f}ms")
+            if capture:
+                self._capture(request, start_time, status_code, process_time)
+
             return response
-            
+
         except Exception as e:
             # 예외 발생 시 로깅 (이미 exception_handler에서 처리되지만, 미들웨어 레벨에서도 기록)
             process_time = (time.time() - start_time) * 1000
             logger.error(f"Error: {method} {path} - Message: {str(e)} - Time: {process_time:.2f}ms")
+            if capture:
+                self._capture(request, start_time, 500, process_time)
             raise e
+
+    def _capture(self, request: Request, start_time: float, status_code: int, process_time: float) -> None:
+        """리플레이 도구가 요청 구성과 도착 간격을 재구성할 수 있도록 한 줄짜리 JSON으로 기록"""
+        capture_logger.info(json.dumps({
+            "ts": round(start_time, 6),
+            "requestId": request_id_ctx.get(),
+            "method": request.method,
+            "path": request.url.path,
+            "query": request.url.query,
+            "status": status_code,
+            "durationMs": round(process_time, 2),
+            "ip": request.client.host if request.client else "unknown",
+            "authenticated": bool(request.cookies.get(settings.session_cookie_name)),
+        }, ensure_ascii=False))
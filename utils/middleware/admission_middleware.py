@@ -0,0 +1,80 @@
+"""
+요청 수락 제어 (admission control)
+- 요청을 read(조회)/write(작성·수정·삭제)/auth(로그인·가입·비밀번호, bcrypt) 분류로 나누고 분류별 동시 실행 수 제한
+- 한도를 넘은 요청은 분류별 대기열에서 admission_queue_timeout까지 대기
+- 대기열이 가득 찼거나 대기 시간이 지나면 429(TOO_MANY_REQUEST, Retry-After)로 바로 실패
+  (DB가 느려졌을 때 모든 요청이 커넥션 풀 앞에 쌓여 전체 지연이 늘어나는 대신 일부 요청만 거절)
+- 정적 파일, 헬스 체크, SSE 스트림(장시간 연결)은 제한하지 않음
+"""
+
+import logging
+from typing import Dict, Optional
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from config import settings
+from utils.common.concurrency import ConcurrencyLimiter
+from utils.common.response import StandardResponse
+from utils.errors.error_codes import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+# 비밀번호 해싱/검증(bcrypt)으로 CPU를 많이 쓰는 경로
+AUTH_PATHS = ("/v1/auth/", "/v1/users/password")
+UNLIMITED_PATHS = ("/public", "/health")
+
+
+def _build_limiters() -> Dict[str, ConcurrencyLimiter]:
+    limits = {
+        "read": settings.admission_read_limit,
+        "write": settings.admission_write_limit,
+        "auth": settings.admission_auth_limit,
+    }
+    return {
+        name: ConcurrencyLimiter(name, limit, settings.admission_queue_size, settings.admission_queue_timeout)
+        for name, limit in limits.items()
+    }
+
+
+limiters = _build_limiters()
+
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """요청 분류 (제한하지 않는 요청은 None)"""
+    if path.startswith(UNLIMITED_PATHS) or path.endswith("/events"):
+        return None
+    if path.startswith(AUTH_PATHS):
+        return "auth"
+    return "read" if method in READ_METHODS else "write"
+
+
+class AdmissionControlMiddleware:
+    """분류별 ConcurrencyLimiter로 요청 수락 (응답 본문 전송이 끝날 때까지 자리 유지)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        name = route_class(scope["method"], scope["path"]) if scope["type"] == "http" else None
+        if name is None or not settings.admission_control_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = limiters[name]
+        if not await limiter.acquire():
+            logger.warning(
+                f"Admission rejected: {scope['method']} {scope['path']} - class={name} "
+                f"active={limiter.active} waiting={limiter.waiting}"
+            )
+            response = JSONResponse(
+                StandardResponse.error(ErrorCode.TOO_MANY_REQUEST),
+                status_code=ErrorCode.TOO_MANY_REQUEST.status_code,
+                headers={"Retry-After": str(settings.admission_retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -0,0 +1,68 @@
+"""
+업로드 요청 본문 크기 제한
+- multipart 파서(request.form)는 라우트 실행 전에 본문 전체를 임시 파일로 받아 두므로,
+  save_upload_file의 크기 검사만으로는 초과 업로드도 끝까지 수신/저장한 뒤에야 거절됨
+- multipart/form-data 요청만 대상으로 본문을 받는 동안 크기 검사
+  - Content-Length가 upload_max_body_size를 넘으면 본문을 읽지 않고 바로 413
+  - Content-Length가 없거나(chunked) 실제 본문이 더 길면 받는 중에 넘는 순간 413 (나머지 본문은 읽지 않음)
+"""
+
+import logging
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config import settings
+from utils.common.response import StandardResponse
+from utils.errors.error_codes import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+TOO_LARGE_MESSAGE = "파일 크기는 5MB를 초과할 수 없습니다."
+
+
+def _header(scope: Scope, name: bytes) -> bytes:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
+
+
+class BodyLimitMiddleware:
+    """
+    DeadlineMiddleware 안쪽에 등록 (본문 수신은 Deadline의 receive 대행 Task가 아니라 앱 쪽에서 실패해야
+    예외 핸들러가 413 응답을 만들 수 있음), Admission 바깥이라 큰 요청은 수락 자리를 쓰기 전에 거절
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _header(scope, b"content-type").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.upload_max_body_size
+        contentLength = _header(scope, b"content-length")
+        if contentLength.isdigit() and int(contentLength) > limit:
+            logger.warning(f"Upload rejected: {scope['method']} {scope['path']} - Content-Length {int(contentLength)}")
+            response = JSONResponse(
+                StandardResponse.error(ErrorCode.PAYLOAD_TOO_LARGE, message=TOO_LARGE_MESSAGE),
+                status_code=ErrorCode.PAYLOAD_TOO_LARGE.status_code,
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    logger.warning(f"Upload rejected: {scope['method']} {scope['path']} - body over {limit} bytes")
+                    # FastAPI는 본문 파싱 중 HTTPException만 그대로 전달 (그 외 예외는 400으로 변환)
+                    raise HTTPException(ErrorCode.PAYLOAD_TOO_LARGE.status_code, TOO_LARGE_MESSAGE)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,135 @@
+import gzip
+from typing import Optional, Set, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config import settings
+
+try:
+    import brotli  # 선택 의존성 (pip install brotli)
+except ImportError:
+    brotli = None
+
+# 압축 대상 Content-Type (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "text/",
+    "image/svg+xml",
+)
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Accept-Encoding에서 허용된 인코딩 목록 (q=0은 거부로 처리)"""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            accepted.add(coding.strip())
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """동적 응답에 사용할 인코딩 선택 (brotli 설치 시 br 우선)"""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.compression_brotli_quality)
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어 (순수 ASGI)
+    - 본문이 한 번에 전달되는 응답만 압축 (StreamingResponse/FileResponse/SSE 등 스트리밍 응답, pathsend, 206 부분 응답은 그대로 전달)
+    - compression_min_size 미만, 허용 목록 밖의 Content-Type, 이미 인코딩된 응답은 압축하지 않음
+    - 압축 시 ETag를 weak로 변환 (표현이 달라지므로, If-None-Match는 weak 비교라 304는 그대로 동작)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.compression_min_size if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                # pathsend 등 본문 외 메시지는 압축하지 않고 보류 중인 시작 메시지와 함께 전달
+                passthrough = True
+                if start_message is not None:
+                    await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            compressed = None
+            if not message.get("more_body", False):
+                compressed, headers = self._maybe_compress(start_message, body, encoding)
+
+            passthrough = True
+            if compressed is None:
+                await send(start_message)
+                await send(message)
+                return
+
+            start_message["headers"] = headers.raw
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _maybe_compress(self, start_message: Message, body: bytes, encoding: str) -> Tuple[Optional[bytes], Optional[MutableHeaders]]:
+        headers = MutableHeaders(raw=list(start_message["headers"]))
+        content_type = headers.get("content-type", "")
+        if (
+            len(body) < self.minimum_size
+            or start_message["status"] == 206
+            or "content-encoding" in headers
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+        ):
+            return None, None
+
+        compressed = compress(body, encoding)
+        if len(compressed) >= len(body):
+            return None, None
+
+        headers["Content-Encoding"] = encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return compressed, headers
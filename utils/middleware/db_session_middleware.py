@@ -6,12 +6,21 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from config import settings
 from utils.database.db import fetch_one, execute
+from utils.errors.exceptions import APIError
+from utils.errors.exception_handlers import api_exception_handler
 
 
 class DBSessionMiddleware(BaseHTTPMiddleware):
     """DB 기반 세션 미들웨어"""
 
     async def dispatch(self, request: Request, call_next):
+        try:
+            return await self._dispatch(request, call_next)
+        except APIError as e:
+            # 미들웨어에서 발생한 APIError(커넥션 획득 시간 초과 등)도 라우터와 같은 형식으로 응답
+            return await api_exception_handler(request, e)
+
+    async def _dispatch(self, request: Request, call_next):
         session_key = request.cookies.get(settings.session_cookie_name)
         session: Dict = {}
 
@@ -0,0 +1,79 @@
+"""
+요청 마감 시각 설정 + 클라이언트 연결 종료 시 요청 취소
+- 경로별 처리 시간 한도로 마감 시각 설정 (utils.common.deadline, DB 쿼리 시간 한도로 사용)
+- 요청 메시지(receive)를 이 미들웨어가 대신 읽어 전달하다가 응답 완료 전에 http.disconnect가 오면
+  앱 Task를 취소 (실행 중인 쿼리는 DB 계층이 KILL QUERY로 종료하고 커넥션을 풀에 반환하지 않음)
+  - 취소는 안전한 메서드(GET/HEAD)만: 쓰기 요청은 여러 단계(댓글 삭제 → 게시글 삭제 → 버전 갱신 등)가
+    트랜잭션으로 묶여 있지 않아 중간에 취소하면 일부만 반영되므로 끝까지 실행하고 disconnect만 전달
+- 취소된 요청은 바깥 미들웨어(액세스 로그 등)를 위해 499(Client Closed Request) 빈 응답으로 마무리
+"""
+
+import asyncio
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.common.deadline import reset_deadline, route_timeouts, set_deadline
+
+logger = logging.getLogger(__name__)
+
+CLIENT_CLOSED_REQUEST = 499
+CANCELLABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class DeadlineMiddleware:
+    """수락 제어(Admission)보다 바깥에 등록해 대기 중 연결이 끊긴 요청도 취소"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = set_deadline(route_timeouts.match(scope["method"], scope["path"]))
+        try:
+            await self._run(scope, receive, send)
+        finally:
+            reset_deadline(token)
+
+    async def _run(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # 본문 청크는 하나씩만 미리 읽음 (업로드 스트리밍의 backpressure 유지)
+        messages: "asyncio.Queue[Message]" = asyncio.Queue(maxsize=1)
+        state = {"started": False, "complete": False, "disconnected": False}
+
+        async def app_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["started"] = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                state["complete"] = True
+            elif message["type"] == "http.response.pathsend":
+                state["complete"] = True
+            await send(message)
+
+        app_task = asyncio.ensure_future(self.app(scope, messages.get, app_send))
+        cancellable = scope["method"] in CANCELLABLE_METHODS
+
+        async def pump() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect" and cancellable:
+                    if not state["complete"]:
+                        state["disconnected"] = True
+                        app_task.cancel()
+                    return
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        pump_task = asyncio.ensure_future(pump())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            if not state["disconnected"]:
+                raise
+            logger.info(f"Client disconnected, request cancelled: {scope['method']} {scope['path']}")
+            if not state["started"]:
+                await send({"type": "http.response.start", "status": CLIENT_CLOSED_REQUEST, "headers": []})
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            pump_task.cancel()
@@ -0,0 +1,152 @@
+"""
+요청 빈도 제한 (토큰 버킷)
+- 경로별 규칙(settings.rate_limit_rules, "메서드 경로 접두사": "요청 수/초")마다 식별자별 토큰 버킷 유지
+  (가장 긴 경로 접두사 규칙 하나만 적용, 규칙이 없는 요청은 제한하지 않음)
+- 식별자: 클라이언트 IP, 로그인한 사용자는 사용자 ID도 함께 (두 버킷 모두 토큰이 있어야 통과)
+- 토큰이 없으면 429(RATE_LIMIT_EXCEEDED)와 다음 토큰까지의 시간(Retry-After) 반환
+  (로그인 등 bcrypt 검증 전에 거절하므로 대량 대입 시도가 CPU를 소모하지 않음)
+- 버킷은 (토큰 수, 마지막 갱신 시각) tuple로 프로세스 메모리에 저장하고,
+  rate_limit_sweep_interval마다 가득 찬(= 새로 만든 것과 같은) 버킷을 제거
+- 워커(프로세스)마다 별도이므로 실제 한도는 워커 수만큼 늘어남
+"""
+
+import logging
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from config import settings
+from utils.common.response import StandardResponse
+from utils.errors.error_codes import ErrorCode
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitRule:
+    __slots__ = ("method", "prefix", "capacity", "rate")
+
+    def __init__(self, method: str, prefix: str, capacity: int, period: float):
+        self.method = method
+        self.prefix = prefix
+        self.capacity = capacity
+        self.rate = capacity / period  # 초당 충전되는 토큰 수
+
+
+def parse_rules(rules: Dict[str, str]) -> List[RateLimitRule]:
+    """{"POST /v1/auth/login": "10/60"} → 규칙 목록 (긴 접두사 우선)"""
+    parsed = []
+    for route, limit in rules.items():
+        method, prefix = route.split(" ", 1)
+        capacity, period = limit.split("/", 1)
+        parsed.append(RateLimitRule(method.upper(), prefix.strip(), int(capacity), float(period)))
+    return sorted(parsed, key=lambda rule: len(rule.prefix), reverse=True)
+
+
+class TokenBucketLimiter:
+    """규칙별/식별자별 토큰 버킷"""
+
+    def __init__(self, rules: List[RateLimitRule], max_keys: int, sweep_interval: float):
+        self.rules = rules
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        # (규칙 번호, 식별자) → (토큰 수, 마지막 갱신 시각), 삽입 순서 = 최근 사용 순
+        self._buckets: Dict[Tuple[int, str], Tuple[float, float]] = {}
+        self._lastSweep = time.monotonic()
+
+    def match(self, method: str, path: str) -> Optional[int]:
+        for index, rule in enumerate(self.rules):
+            if rule.method == method and path.startswith(rule.prefix):
+                return index
+        return None
+
+    def consume(self, ruleIndex: int, *identities: str) -> float:
+        """
+        식별자별 버킷에서 토큰 1개씩 사용 (성공하면 0)
+        - 하나라도 부족하면 어느 버킷도 사용하지 않고 가장 긴 다음 토큰까지 남은 초 반환
+        """
+        now = time.monotonic()
+        if now - self._lastSweep >= self.sweep_interval:
+            self._sweep(now)
+
+        rule = self.rules[ruleIndex]
+        current = {identity: self._refill(ruleIndex, identity, now) for identity in identities}
+        allowed = min(current.values()) >= 1
+        for identity, tokens in current.items():
+            self._buckets[(ruleIndex, identity)] = (tokens - 1 if allowed else tokens, now)
+        if allowed:
+            return 0.0
+        return max((1 - tokens) / rule.rate for tokens in current.values() if tokens < 1)
+
+    def _refill(self, ruleIndex: int, identity: str, now: float) -> float:
+        """현재 토큰 수 (버킷은 꺼내 두고 consume에서 최근 사용 위치로 다시 저장)"""
+        rule = self.rules[ruleIndex]
+        bucket = self._buckets.pop((ruleIndex, identity), None)
+        if bucket is not None:
+            return min(rule.capacity, bucket[0] + (now - bucket[1]) * rule.rate)
+        if len(self._buckets) >= self.max_keys:
+            self._sweep(now)
+            while len(self._buckets) >= self.max_keys:
+                del self._buckets[next(iter(self._buckets))]
+        return float(rule.capacity)
+
+    def _sweep(self, now: float) -> None:
+        """가득 찬 버킷 제거 (다시 요청하면 같은 상태로 새로 생성됨)"""
+        self._lastSweep = now
+        full = [
+            key for key, (tokens, last) in self._buckets.items()
+            if tokens + (now - last) * self.rules[key[0]].rate >= self.rules[key[0]].capacity
+        ]
+        for key in full:
+            del self._buckets[key]
+
+    def reset(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+rate_limiter = TokenBucketLimiter(
+    parse_rules(settings.rate_limit_rules),
+    max_keys=settings.rate_limit_max_keys,
+    sweep_interval=settings.rate_limit_sweep_interval,
+)
+
+
+def _identities(scope: Scope) -> Tuple[str, ...]:
+    client = scope.get("client")
+    ip = f"ip:{client[0] if client else 'unknown'}"
+    user_id = scope.get("state", {}).get("user_id")
+    return (f"user:{user_id}", ip) if user_id else (ip,)
+
+
+class RateLimitMiddleware:
+    """
+    요청 빈도 제한 미들웨어
+    - AuthMiddleware 안쪽에 등록해 세션의 사용자 ID(request.state.user_id)를 IP와 함께 식별자로 사용
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.rate_limit_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        ruleIndex = rate_limiter.match(scope["method"], scope["path"])
+        if ruleIndex is not None:
+            identities = _identities(scope)
+            retryAfter = rate_limiter.consume(ruleIndex, *identities)
+            if retryAfter > 0:
+                logger.warning(f"Rate limited: {scope['method']} {scope['path']} - {' '.join(identities)}")
+                response = JSONResponse(
+                    StandardResponse.error(ErrorCode.RATE_LIMIT_EXCEEDED),
+                    status_code=ErrorCode.RATE_LIMIT_EXCEEDED.status_code,
+                    headers={"Retry-After": str(math.ceil(retryAfter))},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
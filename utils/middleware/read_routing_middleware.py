@@ -0,0 +1,59 @@
+"""
+read-your-writes 라우팅 미들웨어 (replica 설정 시에만 동작)
+- 요청마다 조회 라우팅 상태를 설정 (utils.database.db.bind_read_routing)
+- 요청에서 쓰기가 발생하면 응답에 db_read_your_writes_window 동안 유효한 쿠키를 추가하고,
+  이 쿠키가 유효한 요청의 조회는 primary 사용 (replica 지연 중에도 자신이 쓴 내용을 바로 조회)
+- 쿠키에 만료 시각을 담으므로 워커/인스턴스 간에 상태를 공유하지 않아도 됨
+"""
+
+import math
+import time
+from http.cookies import SimpleCookie
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config import settings
+from utils.database.db import bind_read_routing, has_replicas
+
+PRIMARY_READ_COOKIE = "db_primary_until"
+
+
+def _primary_until(scope: Scope) -> float:
+    try:
+        return float(HTTPConnection(scope).cookies.get(PRIMARY_READ_COOKIE, 0))
+    except ValueError:
+        return 0.0
+
+
+def _primary_read_cookie() -> str:
+    window = settings.db_read_your_writes_window
+    cookie = SimpleCookie()
+    cookie[PRIMARY_READ_COOKIE] = f"{time.time() + window:.3f}"
+    cookie[PRIMARY_READ_COOKIE]["max-age"] = math.ceil(window)
+    cookie[PRIMARY_READ_COOKIE]["path"] = "/"
+    cookie[PRIMARY_READ_COOKIE]["httponly"] = True
+    cookie[PRIMARY_READ_COOKIE]["samesite"] = settings.cookie_samesite
+    if settings.cookie_secure:
+        cookie[PRIMARY_READ_COOKIE]["secure"] = True
+    return cookie.output(header="").strip()
+
+
+class ReadRoutingMiddleware:
+    """세션/사용자 쿼리를 실행하는 미들웨어(DBSession 등)보다 바깥에 등록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not has_replicas():
+            await self.app(scope, receive, send)
+            return
+
+        routing = bind_read_routing(primary=_primary_until(scope) > time.time())
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and routing.wrote:
+                MutableHeaders(scope=message).append("set-cookie", _primary_read_cookie())
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,34 +1,149 @@
-from models.user_model import user_model
-from models.post_model import post_model
-from models.comment_model import comment_model
-from utils.database.db import execute
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 import logging
+import aiomysql
+from config import settings
+from models.user_model import user_model
+from utils.common.response_cache import feed_cache
+from utils.database.db import transaction
 
 logger = logging.getLogger(__name__)
 
-def seed_database():
+# 시드 직후 상태의 인메모리 스냅샷: {테이블: (컬럼 목록, row 목록)}
+_snapshot: Optional[Dict[str, Tuple[Sequence[str], List[Tuple[Any, ...]]]]] = None
+_seed_result: Optional[Dict] = None
+
+
+async def _list_tables(cursor) -> List[str]:
+    await cursor.execute("SHOW TABLES")
+    return [row[0] for row in await cursor.fetchall()]
+
+
+@asynccontextmanager
+async def _foreign_key_checks_disabled(cursor) -> AsyncIterator[None]:
+    """블록 안에서만 FK 검사 끄기 (실패해도 다시 켜서 풀에 반환되는 커넥션에 남지 않도록)"""
+    await cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        yield
+    finally:
+        await cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+async def _clear_tables(cursor) -> List[str]:
+    """FK 검사를 끄고 모든 테이블 비우기
+    (테스트 데이터셋은 작으므로 테이블을 재생성하는 TRUNCATE보다 DELETE가 빠름)"""
+    tables = await _list_tables(cursor)
+    async with _foreign_key_checks_disabled(cursor):
+        for table in tables:
+            await cursor.execute(f"DELETE FROM {table}")
+    return tables
+
+
+async def seed_database():
     """데이터베이스 초기화 및 시드 데이터 삽입"""
     logger.info("Seeding database...")
-    
-    # 1. 모든 저장소 초기화
-    execute("DELETE FROM sessions")
-    user_model.clear()
-    post_model.clear()
-    comment_model.clear()
-    
+
+    # 1. 모든 테이블 초기화
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            await _clear_tables(cursor)
+
     # 2. 기본 테스트용 관리자 계정 생성
-    admin_user = user_model.createUser(
+    admin_user = await user_model.createUser(
         email="admin@test.com",
         password="Admin123!",
         nickname="테스트관리자",
         profileImageUrl=None
     )
-    
-    logger.info(f"Database seeded. Admin user created: {admin_user['email']}")
+
+    logger.info(f"Database seeded. Admin user created: {admin_user.email}")
     return {
         "message": "Database reset and seeded successfully",
         "admin_user": {
-            "email": admin_user["email"],
-            "nickname": admin_user["nickname"]
+            "email": admin_user.email,
+            "nickname": admin_user.nickname
         }
     }
+
+
+async def snapshot_database() -> Dict[str, int]:
+    """현재 DB 상태를 메모리에 스냅샷 (restore_database로 복원)"""
+    global _snapshot
+    snapshot = {}
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            for table in await _list_tables(cursor):
+                await cursor.execute(f"SELECT * FROM {table}")
+                columns = [desc[0] for desc in cursor.description]
+                snapshot[table] = (columns, list(await cursor.fetchall()))
+    _snapshot = snapshot
+    logger.info(f"Database snapshot taken: {', '.join(f'{t}={len(r)}' for t, (_, r) in snapshot.items())}")
+    return {table: len(rows) for table, (_, rows) in snapshot.items()}
+
+
+async def restore_database():
+    """
+    스냅샷 상태로 복원 (스냅샷이 없으면 시드 후 스냅샷 생성)
+    - 시드(bcrypt 해싱 포함)는 프로세스당 1회만 수행하고, 이후에는 비우기 + multi-row INSERT만 실행
+    """
+    global _seed_result
+    feed_cache.invalidate()
+    if _snapshot is None:
+        _seed_result = await seed_database()
+        await snapshot_database()
+        return _seed_result
+
+    async with transaction() as conn:
+        async with conn.cursor() as cursor:
+            await _clear_tables(cursor)
+            async with _foreign_key_checks_disabled(cursor):
+                for table, (columns, rows) in _snapshot.items():
+                    if not rows:
+                        continue
+                    placeholders = ", ".join(["%s"] * len(columns))
+                    await cursor.executemany(
+                        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                        rows,
+                    )
+    return _seed_result or {"message": "Database restored from snapshot"}
+
+
+async def reseed_database():
+    """다시 시드한 뒤 스냅샷 갱신 (이후 restore_database는 새 시드 상태와 결과를 사용)"""
+    global _seed_result
+    feed_cache.invalidate()
+    _seed_result = await seed_database()
+    await snapshot_database()
+    return _seed_result
+
+
+async def prepare_worker_database(suffix: str) -> str:
+    """
+    병렬 테스트 워커 전용 DB 생성 ({db_name}_{suffix})
+    - 기준 DB의 테이블 정의(SHOW CREATE TABLE)를 그대로 복제하므로 FK 제약도 유지됨
+    - 반환된 DB 이름을 settings.db_name에 설정한 뒤 풀을 초기화해야 함
+    """
+    base_name = settings.db_name
+    worker_name = f"{base_name}_{suffix}"
+    conn = await aiomysql.connect(
+        host=settings.db_host,
+        port=settings.db_port,
+        user=settings.db_user,
+        password=settings.db_password,
+        db=base_name,
+        autocommit=True,
+    )
+    try:
+        async with conn.cursor() as cursor:
+            await cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{worker_name}` DEFAULT CHARSET utf8mb4")
+            tables = await _list_tables(cursor)
+            await cursor.execute(f"USE `{worker_name}`")
+            await cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            for table in tables:
+                await cursor.execute(f"SHOW CREATE TABLE `{base_name}`.`{table}`")
+                create_sql = (await cursor.fetchone())[1]
+                await cursor.execute(f"DROP TABLE IF EXISTS `{table}`")
+                await cursor.execute(create_sql)
+    finally:
+        conn.close()
+    return worker_name